@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the bisect card lookup with a linear scan of the card table.
+
+Converts the same small and medium integers with to_cardinal(), once with
+the CardIndex lookup and once with find_card() replaced by the linear scan
+splitnum() used to do over the whole table at every level.
+
+Usage:
+    python benchmarks/bench_cards.py [--count N] [--langs en,fr,...]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import CONVERTER_CLASSES  # noqa: E402
+
+BANDS = (('0..99', 0, 100), ('0..999', 0, 1000),
+         ('10^3..10^6', 1000, 10 ** 6), ('10^6..10^9', 10 ** 6, 10 ** 9))
+
+
+def scan_find_card(converter):
+    def find_card(value, cards=None):
+        for elem in converter.cards if cards is None else cards:
+            if elem <= value:
+                return elem
+    return find_card
+
+
+def best_of(func, values, repeat=5):
+    return min(timeit.repeat(lambda: [func(v) for v in values],
+                             number=1, repeat=repeat)) / len(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--langs', default='en,fr,de,es,nl,ko')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print('%-5s %6s %-12s %9s %9s %8s' % ('lang', 'cards', 'values',
+                                          'scan us', 'index us',
+                                          'speedup'))
+    for lang in args.langs.split(','):
+        converter = CONVERTER_CLASSES[lang]
+        for name, low, high in BANDS:
+            values = [rng.randrange(low, high) for _ in range(args.count)]
+            indexed = best_of(converter.to_cardinal, values)
+            expected = [converter.to_cardinal(v) for v in values]
+            converter.find_card = scan_find_card(converter)
+            try:
+                scanned = best_of(converter.to_cardinal, values)
+                assert [converter.to_cardinal(v) for v in values] == expected
+            finally:
+                del converter.find_card
+            print('%-5s %6d %-12s %9.1f %9.1f %7.2fx' % (
+                lang, len(converter.cards), name, scanned * 1e6,
+                indexed * 1e6, scanned / indexed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare num2words() calls with a formatter from get_formatter().
+
+Both convert the same random integers below 1000 (where the spelling
+itself is cheapest, so the per-call overhead shows most) with the same
+options.
+
+Usage:
+    python benchmarks/bench_formatter.py [--count N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import get_formatter, num2words  # noqa: E402
+
+CASES = [
+    ('en', 'cardinal', {}),
+    ('en', 'currency', {'currency': 'USD'}),
+    ('fi', 'cardinal', {'case': 'genitive'}),
+    ('fi', 'ordinal', {'case': 'inessive', 'plural': True}),
+    ('ja', 'cardinal', {'reading': True}),
+]
+
+
+def best(function, values, repeat=5):
+    def run():
+        for value in values:
+            function(value)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    values = [rng.randrange(1000) for _ in range(args.count)]
+    print('%-4s %-9s %-38s %8s %8s %8s' % (
+        'lang', 'to', 'options', 'call us', 'fmt us', 'speedup'))
+    for lang, to, options in CASES:
+        formatter = get_formatter(lang, to, **options)
+        call = best(lambda v: num2words(v, lang=lang, to=to, **options),
+                    values)
+        bound = best(formatter, values)
+        print('%-4s %-9s %-38s %8.2f %8.2f %7.2fx' % (
+            lang, to, options, call * 1e6, bound * 1e6, call / bound))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare the exact fractional engine with the float based one.
+
+``legacy`` is the previous to_cardinal_float(): the value goes through
+float(), its precision is read from Decimal(str(value)) and the digits
+are computed with float arithmetic and a 0.01 rounding fudge. ``decimal``
+is the current to_cardinal_float(), reading the digits from the decimal
+notation of the value. Both spell English cardinals; ``differ`` counts
+the values whose words are not the same and ``digits`` is the mean
+number of fractional digits each spells.
+
+Usage:
+    python benchmarks/bench_fraction.py [--count N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import math
+import os
+import random
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import CONVERTER_CLASSES  # noqa: E402
+from num2words.compat import to_s  # noqa: E402
+
+CONVERTER = CONVERTER_CLASSES['en']
+
+
+def legacy_float2tuple(value, precision):
+    pre = int(value)
+    post = abs(value - pre) * 10**precision
+    if abs(round(post) - post) < 0.01:
+        post = int(round(post))
+    else:
+        post = int(math.floor(post))
+    return pre, post
+
+
+def legacy_to_cardinal_float(value):
+    value = float(value)
+    precision = abs(Decimal(str(value)).as_tuple().exponent)
+    pre, post = legacy_float2tuple(value, precision)
+
+    post = str(post)
+    post = '0' * (precision - len(post)) + post
+
+    out = [CONVERTER.to_cardinal(pre)]
+    if precision:
+        out.append(CONVERTER.title(CONVERTER.pointword))
+    for i in range(precision):
+        out.append(to_s(CONVERTER.to_cardinal(int(post[i]))))
+    return ' '.join(out)
+
+
+def columns(count, rng):
+    def cents():
+        return rng.randrange(10 ** 6) + rng.randrange(1, 100) / 100.0
+
+    def digits(places):
+        return Decimal('%d.%0*d' % (rng.randrange(10 ** 6), places,
+                                    rng.randrange(1, 10 ** places)))
+
+    return [
+        ('float cents', [cents() for _ in range(count)]),
+        ('float 1e7..1e8', [rng.uniform(1e7, 1e8) for _ in range(count)]),
+        ('Decimal 2 places', [digits(2) for _ in range(count)]),
+        ('Decimal 12 places', [digits(12) for _ in range(count)]),
+        ('Decimal 25 places', [digits(25) for _ in range(count)]),
+    ]
+
+
+def fraction_words(results):
+    """Mean number of words after the point."""
+    return sum(len(words.split(' point ')[1].split())
+               for words in results) / float(len(results))
+
+
+def best(function, values, repeat=5):
+    def run():
+        for value in values:
+            function(value)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000)
+    args = parser.parse_args()
+
+    print('%-18s %10s %10s %8s %8s %8s' % (
+        'values', 'legacy us', 'decimal us', 'speedup', 'differ', 'digits'))
+    for name, values in columns(args.count, random.Random(42)):
+        old = [legacy_to_cardinal_float(value) for value in values]
+        new = [CONVERTER.to_cardinal_float(value) for value in values]
+        differ = sum(a != b for a, b in zip(old, new))
+        legacy = best(legacy_to_cardinal_float, values)
+        current = best(CONVERTER.to_cardinal_float, values)
+        print('%-18s %10.1f %10.1f %7.2fx %8d %4.0f/%-3.0f' % (
+            name, legacy * 1e6, current * 1e6, legacy / current, differ,
+            fraction_words(old), fraction_words(new)))
+
+
+if __name__ == '__main__':
+    main()
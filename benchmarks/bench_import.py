@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure startup cost of the package and the command line tool.
+
+Each measurement runs in a fresh interpreter so nothing is cached between
+runs:
+
+* ``import num2words`` wall time, peak RSS and the cumulative time
+  ``python -X importtime`` reports for the package and its submodules;
+* the cost of loading each language (importing its ``lang_*`` module and
+  instantiating the converter) right after ``import num2words``, which
+  includes ``num2words.base`` for the first language;
+* the wall time of ``bin/num2words 42`` and ``bin/num2words -L`` next to a
+  bare interpreter start;
+* the same numbers with every converter preloaded, which is what
+  ``import num2words`` used to do before the registry became lazy.
+
+The medians are compared with the limits in ``startup_budget.json``;
+``--check`` exits with status 1 when one is exceeded. ``--output`` writes
+the results as JSON and ``--history`` appends them as one JSON line, so a
+CI job can keep a record over time. ``-X importtime`` needs Python 3.7+.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N] [--check]
+                                      [--output FILE] [--history FILE]
+"""
+
+from __future__ import print_function
+
+import argparse
+import compileall
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET = os.path.join(ROOT, 'benchmarks', 'startup_budget.json')
+CLI = os.path.join(ROOT, 'bin', 'num2words')
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import num2words
+imported = time.perf_counter()
+{body}
+end = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+loaded = sum(1 for m in sys.modules if m.startswith('num2words.lang_'))
+print(json.dumps({{'seconds': end - start, 'body_seconds': end - imported,
+                  'rss_kb': rss, 'modules': loaded}}))
+"""
+
+SCENARIOS = [
+    ('import', ''),
+    ('import + en', "num2words.num2words(42)"),
+    ('eager', "num2words.CONVERTER_CLASSES.preload()"),
+]
+
+
+def environ():
+    return dict(os.environ, PYTHONPATH=ROOT)
+
+
+def parse_importtime(stderr):
+    """Return ``(name, depth, self_us, cumulative_us)`` for each line of
+    ``-X importtime`` output, in the order the imports finished."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        name = fields[2][1:].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return entries
+
+
+def probe(body, importtime=False):
+    """Run ``import num2words`` followed by ``body`` in a fresh interpreter
+    and return its measurements, plus the ``-X importtime`` entries when
+    ``importtime`` is set (which slows the import down a little)."""
+    options = ['-X', 'importtime'] if importtime else []
+    proc = subprocess.Popen(
+        [sys.executable] + options + ['-c', PROBE.format(body=body)],
+        env=environ(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(err.decode('utf-8'))
+    result = json.loads(out.decode('utf-8'))
+    result['importtime'] = parse_importtime(err.decode('utf-8'))
+    return result
+
+
+def package_us(entries):
+    """Cumulative microseconds of ``import num2words``."""
+    for name, depth, _, cumulative in entries:
+        if name == 'num2words' and depth == 0:
+            return cumulative
+    return 0
+
+
+def wall_time(command):
+    start = time.time()
+    subprocess.check_call(command, env=environ(), stdout=subprocess.PIPE)
+    return time.time() - start
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def measure(repeat, langs):
+    results = {'scenarios': {}, 'languages': {}}
+    for name, body in SCENARIOS:
+        runs = [probe(body) for _ in range(repeat)]
+        traced = [probe(body, importtime=True) for _ in range(repeat)]
+        results['scenarios'][name] = {
+            'ms': median(r['seconds'] for r in runs) * 1000,
+            'importtime_ms': median(
+                package_us(r['importtime']) for r in traced) / 1000.0,
+            'rss_mb': median(r['rss_kb'] for r in runs) / 1024.0,
+            'modules': runs[0]['modules'],
+        }
+    for lang in langs:
+        runs = [probe('num2words.CONVERTER_CLASSES[%r]' % lang)
+                for _ in range(repeat)]
+        results['languages'][lang] = median(
+            r['body_seconds'] for r in runs) * 1000
+    results['python_ms'] = median(
+        wall_time([sys.executable, '-c', 'pass'])
+        for _ in range(repeat)) * 1000
+    results['cli_ms'] = median(
+        wall_time([sys.executable, CLI, '42'])
+        for _ in range(repeat)) * 1000
+    results['cli_list_ms'] = median(
+        wall_time([sys.executable, CLI, '--list-languages'])
+        for _ in range(repeat)) * 1000
+    return results
+
+
+def over_budget(results, budget):
+    """Return a message per limit of ``budget`` exceeded by ``results``."""
+    measured = {
+        'import_ms': results['scenarios']['import']['ms'],
+        'import_rss_mb': results['scenarios']['import']['rss_mb'],
+        'language_ms': max(results['languages'].values() or [0]),
+        'cli_ms': results['cli_ms'],
+    }
+    return ['%s: %.1f > %.1f' % (key, measured[key], limit)
+            for key, limit in sorted(budget.items())
+            if measured[key] > limit]
+
+
+def report(results):
+    print('%-12s %10s %14s %12s %8s' % (
+        'scenario', 'wall ms', 'importtime ms', 'peak RSS MB', 'modules'))
+    for name, _ in SCENARIOS:
+        row = results['scenarios'][name]
+        print('%-12s %10.1f %14.1f %12.1f %8d' % (
+            name, row['ms'], row['importtime_ms'], row['rss_mb'],
+            row['modules']))
+    print()
+    print('%-12s %10s' % ('language', 'load ms'))
+    for lang, ms in sorted(results['languages'].items(),
+                           key=lambda item: -item[1]):
+        print('%-12s %10.1f' % (lang, ms))
+    print()
+    print('python -c pass       %8.1f ms' % results['python_ms'])
+    print('bin/num2words 42     %8.1f ms' % results['cli_ms'])
+    print('bin/num2words -L     %8.1f ms' % results['cli_list_ms'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--langs', help='comma separated languages')
+    parser.add_argument('--budget', default=BUDGET)
+    parser.add_argument('--check', action='store_true',
+                        help='exit with status 1 when over budget')
+    parser.add_argument('-o', '--output', help='JSON file to write')
+    parser.add_argument('--history', help='JSON lines file to append to')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import num2words
+
+    # measure the package as installed, with its byte code written
+    compileall.compile_dir(os.path.dirname(num2words.__file__), quiet=1)
+
+    langs = args.langs.split(',') if args.langs else sorted(
+        num2words.CONVERTER_CLASSES)
+    results = measure(args.repeat, langs)
+    results['meta'] = {
+        'num2words': num2words.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': args.repeat,
+    }
+    report(results)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=1, sort_keys=True)
+    if args.history:
+        with open(args.history, 'a') as history:
+            history.write(json.dumps(results, sort_keys=True) + '\n')
+
+    with open(args.budget) as budget_file:
+        failures = over_budget(results, json.load(budget_file))
+    print()
+    print('budget: %s' % ('; '.join(failures) or 'ok'))
+    if failures and args.check:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure the memory used by each converter with tracemalloc.
+
+Each language runs in a fresh interpreter: ``import num2words`` happens
+before tracing starts, then the script records the memory allocated by
+loading the converter (its module, class and instance) and after
+spelling the cardinals below ``CARDINAL_TABLE_SIZE``, which fills the
+converter's spell table. The ``all`` row loads and warms every language
+in one interpreter, as a long-lived worker would.
+
+Usage:
+    python benchmarks/bench_memory.py [--langs en,fr] [--output FILE]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import gc, json, tracemalloc
+import num2words
+langs = {langs!r}
+tracemalloc.start()
+for lang in langs:
+    num2words.CONVERTER_CLASSES[lang]
+gc.collect()
+loaded = tracemalloc.get_traced_memory()[0]
+for lang in langs:
+    converter = num2words.CONVERTER_CLASSES[lang]
+    for value in range(getattr(converter, 'CARDINAL_TABLE_SIZE', 0)):
+        try:
+            num2words.num2words(value, lang=lang)
+        except Exception:
+            break
+gc.collect()
+warm = tracemalloc.get_traced_memory()[0]
+print(json.dumps({{'loaded': loaded, 'warm': warm}}))
+"""
+
+
+def probe(langs):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.check_output(
+        [sys.executable, '-c', PROBE.format(langs=list(langs))], env=env)
+    return json.loads(out.decode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--langs', help='comma separated languages')
+    parser.add_argument('-o', '--output', help='JSON file to write')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import num2words
+
+    langs = args.langs.split(',') if args.langs else sorted(
+        num2words.CONVERTER_CLASSES)
+    results = dict((lang, probe([lang])) for lang in langs)
+    results['all'] = probe(langs)
+
+    print('%-8s %10s %10s' % ('lang', 'loaded KB', 'warm KB'))
+    for lang in langs + ['all']:
+        print('%-8s %10.1f %10.1f' % (lang, results[lang]['loaded'] / 1024.0,
+                                      results[lang]['warm'] / 1024.0))
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=1, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
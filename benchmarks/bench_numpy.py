@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare num2words_array() with calling num2words() for every element.
+
+Usage:
+    python benchmarks/bench_numpy.py [--size N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import num2words  # noqa: E402
+from num2words.arrays import num2words_array  # noqa: E402
+
+COLUMNS = [
+    ('int64 0..10^6', lambda rng, n: rng.integers(0, 10 ** 6, n)),
+    ('int64 +-10^12', lambda rng, n: rng.integers(-10 ** 12, 10 ** 12, n)),
+    ('int64 0..999', lambda rng, n: rng.integers(0, 1000, n)),
+    ('float64 cents', lambda rng, n: rng.integers(0, 10 ** 5, n) / 100.0),
+]
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10 ** 6)
+    parser.add_argument('--langs', default='en,ja,ko,fr')
+    args = parser.parse_args()
+    rng = numpy.random.default_rng(0)
+
+    print('%-5s %-16s %10s %10s %8s' % ('lang', 'column', 'loop s',
+                                        'array s', 'speedup'))
+    for lang in args.langs.split(','):
+        for name, make in COLUMNS:
+            values = make(rng, args.size)
+            num2words_array(values[:10], lang=lang)  # warm up tables
+            loop = timed(lambda: [num2words(v, lang=lang)
+                                  for v in values.tolist()])
+            array = timed(lambda: num2words_array(values, lang=lang))
+            print('%-5s %-16s %10.2f %10.2f %7.1fx' % (
+                lang, name, loop, array, loop / array))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure how ParallelConverter scales with the number of workers.
+
+The same list of values is converted serially with num2words() and then
+with pools of 1, 2, 4... workers up to the number of CPUs. Pool start-up
+is excluded, workers are warmed up first.
+
+Usage:
+    python benchmarks/bench_parallel.py [--size N] [--lang LANG]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import num2words  # noqa: E402
+from num2words.parallel import ParallelConverter  # noqa: E402
+
+
+def worker_counts(cpus):
+    count = 1
+    while count < cpus:
+        yield count
+        count *= 2
+    yield cpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200000)
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--chunksize', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    values = [rng.randrange(10 ** 9) for _ in range(args.size)]
+
+    start = time.perf_counter()
+    expected = [num2words(v, lang=args.lang) for v in values]
+    serial = time.perf_counter() - start
+    cpus = os.cpu_count() or 1
+    print('%d values, %d CPUs' % (len(values), cpus))
+    print('%-10s %10s %10s %10s' % ('workers', 'seconds', 'speedup',
+                                    'efficiency'))
+    print('%-10s %10.2f %10.2f %10s' % ('serial', serial, 1.0, '-'))
+
+    for workers in worker_counts(cpus):
+        with ParallelConverter([args.lang], workers,
+                               args.chunksize) as pool:
+            pool.convert(range(workers * args.chunksize), lang=args.lang)
+            start = time.perf_counter()
+            result = pool.convert(values, lang=args.lang)
+            elapsed = time.perf_counter() - start
+        assert result == expected
+        print('%-10d %10.2f %10.2f %9.0f%%' % (
+            workers, elapsed, serial / elapsed,
+            100 * serial / elapsed / workers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare Num2Word_Base.spell_int() with clean(splitnum()).
+
+spell_int() is what to_cardinal() uses; clean(splitnum()) is the
+recursive nested-list protocol it replaces. Both must give the same
+words, the script checks it for every value.
+
+Usage:
+    python benchmarks/bench_spell.py [--count N] [--langs en,fr,...]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import CONVERTER_CLASSES  # noqa: E402
+
+DIGITS = (6, 30, 300)
+
+
+def best_of(func, values, repeat=5):
+    return min(timeit.repeat(lambda: [func(v) for v in values],
+                             number=1, repeat=repeat)) / len(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--langs', default='en,fr,de,nl,ro')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print('%-6s %7s %14s %14s %8s' % ('lang', 'digits', 'legacy us',
+                                      'spell_int us', 'speedup'))
+    for lang in args.langs.split(','):
+        converter = CONVERTER_CLASSES[lang]
+        for digits in DIGITS:
+            if 10 ** digits > converter.MAXVAL:
+                continue
+            values = [rng.randrange(10 ** (digits - 1), 10 ** digits)
+                      for _ in range(args.count)]
+
+            def legacy(value):
+                return converter.clean(converter.splitnum(value))
+
+            assert all(legacy(v) == converter.spell_int(v) for v in values)
+            before = best_of(legacy, values)
+            after = best_of(converter.spell_int, values)
+            print('%-6s %7d %14.1f %14.1f %7.2fx' % (
+                lang, digits, before * 1e6, after * 1e6, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Benchmark every language, converter and magnitude band.
+
+``run`` times num2words() for each language of CONVERTER_CLASSES, each
+converter of CONVERTES_TYPES and each band of values (integers of 1, 3,
+6, 12 and 30 digits, the largest value the language accepts, floats with
+two decimals) and writes the results as JSON. Combinations a language
+does not support are recorded with the exception raised.
+
+``compare`` reads two result files and reports the cases that became
+slower (or faster) by more than ``--threshold`` percent; it exits with
+status 1 when there is a regression.
+
+Usage:
+    python benchmarks/bench_suite.py run [-o FILE] [--langs en,fr]
+                                         [--to cardinal,...] [--count N]
+    python benchmarks/bench_suite.py compare OLD NEW [--threshold PCT]
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import num2words  # noqa: E402
+
+DIGIT_BANDS = (1, 3, 6, 12, 30)
+
+# Time each case for at least this long (seconds) per repeat
+MIN_TIME = 0.02
+
+
+def band_values(converter, band, count, rng):
+    """Return ``count`` random values of ``band``, or None if the band
+    does not apply to the converter."""
+    if band == 'float':
+        return [rng.randrange(10 ** 6) + rng.randrange(1, 100) / 100.0
+                for _ in range(count)]
+    if band == 'max':
+        maxval = getattr(converter, 'MAXVAL', None)
+        if maxval is None:
+            return None
+        return [maxval - 1 - rng.randrange(1000) for _ in range(count)]
+    digits = int(band)
+    low = 10 ** (digits - 1) if digits > 1 else 0
+    return [rng.randrange(low, 10 ** digits) for _ in range(count)]
+
+
+def time_case(values, lang, to, repeat):
+    """Return the best time per value in microseconds."""
+    def convert():
+        for value in values:
+            num2words.num2words(value, lang=lang, to=to)
+
+    number = 1
+    while True:
+        elapsed = timeit.timeit(convert, number=number)
+        if elapsed >= MIN_TIME or number >= 1000:
+            break
+        number *= 2
+    best = min([elapsed] + timeit.repeat(convert, number=number,
+                                         repeat=repeat - 1))
+    return best / number / len(values) * 1e6
+
+
+def run(args):
+    langs = args.langs.split(',') if args.langs else sorted(
+        num2words.CONVERTER_CLASSES)
+    tos = args.to.split(',') if args.to else num2words.CONVERTES_TYPES
+    # Time the converters, not the result cache
+    num2words.disable_cache()
+    bands = [str(digits) for digits in DIGIT_BANDS] + ['max', 'float']
+    results = {}
+    for lang in langs:
+        converter = num2words.CONVERTER_CLASSES[lang]
+        for to in tos:
+            for band in bands:
+                rng = random.Random('%s/%s/%s' % (lang, to, band))
+                values = band_values(converter, band, args.count, rng)
+                if values is None:
+                    continue
+                name = '%s/%s/%s' % (lang, to, band)
+                try:
+                    for value in values:
+                        num2words.num2words(value, lang=lang, to=to)
+                except Exception as err:
+                    results[name] = {'error': type(err).__name__}
+                else:
+                    results[name] = {'us': time_case(values, lang, to,
+                                                     args.repeat)}
+                if args.verbose:
+                    print(name, results[name], file=sys.stderr)
+
+    data = {
+        'meta': {
+            'num2words': num2words.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'count': args.count,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        json.dump(data, output, indent=1, sort_keys=True)
+        output.write('\n')
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+def compare(args):
+    with open(args.old) as old_file, open(args.new) as new_file:
+        old = json.load(old_file)['results']
+        new = json.load(new_file)['results']
+
+    limit = args.threshold / 100.0
+    regressions, improvements, changed = [], [], []
+    for name in sorted(set(old) & set(new)):
+        before, after = old[name].get('us'), new[name].get('us')
+        if before is None or after is None:
+            if old[name] != new[name]:
+                changed.append((name, old[name], new[name]))
+            continue
+        ratio = after / before
+        if ratio > 1 + limit:
+            regressions.append((name, before, after, ratio))
+        elif ratio < 1 - limit:
+            improvements.append((name, before, after, ratio))
+
+    for title, rows in (('Regressions', regressions),
+                        ('Improvements', improvements)):
+        print('%s (more than %g%%): %d' % (title, args.threshold, len(rows)))
+        for name, before, after, ratio in sorted(
+                rows, key=lambda row: row[3], reverse=title[0] == 'R'):
+            print('  %-32s %10.1f us %10.1f us %+7.1f%%' % (
+                name, before, after, (ratio - 1) * 100))
+    for name, before, after in changed:
+        print('  %-32s %s -> %s' % (name, before, after))
+    for label, names in (('only in old', set(old) - set(new)),
+                         ('only in new', set(new) - set(old))):
+        if names:
+            print('%d cases %s: %s' % (len(names), label,
+                                       ', '.join(sorted(names))))
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-o', '--output', help='JSON file to write')
+    run_parser.add_argument('--langs', help='comma separated languages')
+    run_parser.add_argument('--to', help='comma separated converters')
+    run_parser.add_argument('--count', type=int, default=20,
+                            help='values per case')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('-v', '--verbose', action='store_true')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser(
+        'compare', help='compare two result files')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=10.0,
+                                help='percent change reported')
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure the cardinal table fast path.
+
+Converts random integers per magnitude band with to_cardinal(), with the
+per-language table of spelled 0..999 (0..9999 for ja and ko) and with a
+converter whose table is disabled (CARDINAL_TABLE_SIZE = 0). Also reports
+how long building the table takes on first use.
+
+Usage:
+    python benchmarks/bench_table.py [--count N] [--langs en,fr,...]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from num2words import CONVERTER_CLASSES  # noqa: E402
+
+BANDS = (('0..99', 0, 100), ('0..999', 0, 1000), ('0..9999', 0, 10000),
+         ('10^3..10^6', 1000, 10 ** 6), ('10^6..10^12', 10 ** 6, 10 ** 12))
+
+
+def best_of(func, values, repeat=5):
+    return min(timeit.repeat(lambda: [func(v) for v in values],
+                             number=1, repeat=repeat)) / len(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--langs', default='en,fr,de,es,nl,ja,ko')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print('%-5s %-12s %11s %10s %8s' % ('lang', 'values', 'no table us',
+                                        'table us', 'speedup'))
+    for lang in args.langs.split(','):
+        cls = type(CONVERTER_CLASSES[lang])
+        converter, plain = cls(), cls()
+        plain.CARDINAL_TABLE_SIZE = 0
+        build = min(timeit.repeat(lambda: cls().to_cardinal(1), number=1,
+                                  repeat=3))
+        for name, low, high in BANDS:
+            values = [rng.randrange(low, high) for _ in range(args.count)]
+            assert ([converter.to_cardinal(v) for v in values] ==
+                    [plain.to_cardinal(v) for v in values])
+            before = best_of(plain.to_cardinal, values)
+            after = best_of(converter.to_cardinal, values)
+            print('%-5s %-12s %11.1f %10.1f %7.2fx' % (
+                lang, name, before * 1e6, after * 1e6, before / after))
+        print('%-5s %-12s %21.1f ms' % (lang, 'table build', build * 1e3))
+
+
+if __name__ == '__main__':
+    main()
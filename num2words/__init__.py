@@ -17,78 +17,327 @@
 
 from __future__ import unicode_literals
 
-from . import (lang_AR, lang_CZ, lang_DE, lang_DK, lang_EN, lang_EN_IN,
-               lang_ES, lang_ES_CO, lang_ES_NI, lang_ES_VE, lang_FI, lang_FR,
-               lang_FR_BE, lang_FR_CH, lang_FR_DZ, lang_HE, lang_HU, lang_ID,
-               lang_IT, lang_JA, lang_KN, lang_KO, lang_KZ, lang_LT, lang_LV,
-               lang_NL, lang_NO, lang_PL, lang_PT, lang_PT_BR, lang_RO,
-               lang_RU, lang_SL, lang_SR, lang_SV, lang_TE, lang_TH, lang_TR,
-               lang_UK, lang_VI, lang_HI)
-
-CONVERTER_CLASSES = {
-    'ar': lang_AR.Num2Word_AR(),
-    'cz': lang_CZ.Num2Word_CZ(),
-    'en': lang_EN.Num2Word_EN(),
-    'en_IN': lang_EN_IN.Num2Word_EN_IN(),
-    'fr': lang_FR.Num2Word_FR(),
-    'fr_CH': lang_FR_CH.Num2Word_FR_CH(),
-    'fr_BE': lang_FR_BE.Num2Word_FR_BE(),
-    'fr_DZ': lang_FR_DZ.Num2Word_FR_DZ(),
-    'de': lang_DE.Num2Word_DE(),
-    'fi': lang_FI.Num2Word_FI(),
-    'es': lang_ES.Num2Word_ES(),
-    'es_CO': lang_ES_CO.Num2Word_ES_CO(),
-    'es_NI': lang_ES_NI.Num2Word_ES_NI(),
-    'es_VE': lang_ES_VE.Num2Word_ES_VE(),
-    'id': lang_ID.Num2Word_ID(),
-    'ja': lang_JA.Num2Word_JA(),
-    'kn': lang_KN.Num2Word_KN(),
-    'ko': lang_KO.Num2Word_KO(),
-    'kz': lang_KZ.Num2Word_KZ(),
-    'lt': lang_LT.Num2Word_LT(),
-    'lv': lang_LV.Num2Word_LV(),
-    'pl': lang_PL.Num2Word_PL(),
-    'ro': lang_RO.Num2Word_RO(),
-    'ru': lang_RU.Num2Word_RU(),
-    'sl': lang_SL.Num2Word_SL(),
-    'sr': lang_SR.Num2Word_SR(),
-    'sv': lang_SV.Num2Word_SV(),
-    'no': lang_NO.Num2Word_NO(),
-    'dk': lang_DK.Num2Word_DK(),
-    'pt': lang_PT.Num2Word_PT(),
-    'pt_BR': lang_PT_BR.Num2Word_PT_BR(),
-    'he': lang_HE.Num2Word_HE(),
-    'it': lang_IT.Num2Word_IT(),
-    'vi': lang_VI.Num2Word_VI(),
-    'th': lang_TH.Num2Word_TH(),
-    'tr': lang_TR.Num2Word_TR(),
-    'nl': lang_NL.Num2Word_NL(),
-    'uk': lang_UK.Num2Word_UK(),
-    'te': lang_TE.Num2Word_TE(),
-    'hu': lang_HU.Num2Word_HU(),
-    'hi': lang_HI.Num2Word_HI(),
+from decimal import Decimal
+
+from . import cache as _cache
+from .cache import (cache_clear, cache_info, disable_cache,  # noqa: F401
+                    enable_cache, enable_cache_from_env)
+from .registry import LazyConverterRegistry
+
+__version__ = '0.5.10'
+
+# Codes that differ from the ones of CONVERTER_CLASSES
+LANG_ALIASES = {
+    'cs': 'cz',
+    'da': 'dk',
+    'iw': 'he',
+    'in': 'id',
+    'kk': 'kz',
+    'nb': 'no',
+    'nn': 'no',
 }
 
+CONVERTER_CLASSES = LazyConverterRegistry(__name__, {
+    'ar': 'lang_AR.Num2Word_AR',
+    'cz': 'lang_CZ.Num2Word_CZ',
+    'en': 'lang_EN.Num2Word_EN',
+    'en_IN': 'lang_EN_IN.Num2Word_EN_IN',
+    'fr': 'lang_FR.Num2Word_FR',
+    'fr_CH': 'lang_FR_CH.Num2Word_FR_CH',
+    'fr_BE': 'lang_FR_BE.Num2Word_FR_BE',
+    'fr_DZ': 'lang_FR_DZ.Num2Word_FR_DZ',
+    'de': 'lang_DE.Num2Word_DE',
+    'fi': 'lang_FI.Num2Word_FI',
+    'es': 'lang_ES.Num2Word_ES',
+    'es_CO': 'lang_ES_CO.Num2Word_ES_CO',
+    'es_NI': 'lang_ES_NI.Num2Word_ES_NI',
+    'es_VE': 'lang_ES_VE.Num2Word_ES_VE',
+    'id': 'lang_ID.Num2Word_ID',
+    'ja': 'lang_JA.Num2Word_JA',
+    'kn': 'lang_KN.Num2Word_KN',
+    'ko': 'lang_KO.Num2Word_KO',
+    'kz': 'lang_KZ.Num2Word_KZ',
+    'lt': 'lang_LT.Num2Word_LT',
+    'lv': 'lang_LV.Num2Word_LV',
+    'pl': 'lang_PL.Num2Word_PL',
+    'ro': 'lang_RO.Num2Word_RO',
+    'ru': 'lang_RU.Num2Word_RU',
+    'sl': 'lang_SL.Num2Word_SL',
+    'sr': 'lang_SR.Num2Word_SR',
+    'sv': 'lang_SV.Num2Word_SV',
+    'no': 'lang_NO.Num2Word_NO',
+    'dk': 'lang_DK.Num2Word_DK',
+    'pt': 'lang_PT.Num2Word_PT',
+    'pt_BR': 'lang_PT_BR.Num2Word_PT_BR',
+    'he': 'lang_HE.Num2Word_HE',
+    'it': 'lang_IT.Num2Word_IT',
+    'vi': 'lang_VI.Num2Word_VI',
+    'th': 'lang_TH.Num2Word_TH',
+    'tr': 'lang_TR.Num2Word_TR',
+    'nl': 'lang_NL.Num2Word_NL',
+    'uk': 'lang_UK.Num2Word_UK',
+    'te': 'lang_TE.Num2Word_TE',
+    'hu': 'lang_HU.Num2Word_HU',
+    'hi': 'lang_HI.Num2Word_HI',
+}, aliases=LANG_ALIASES)
+
 CONVERTES_TYPES = ['cardinal', 'ordinal', 'ordinal_num', 'year', 'currency']
 
 
-def num2words(number, ordinal=False, lang='en', to='cardinal', **kwargs):
-    # We try the full language first
-    if lang not in CONVERTER_CLASSES:
-        # ... and then try only the first 2 letters
-        lang = lang[:2]
-    if lang not in CONVERTER_CLASSES:
+def resolve_lang(lang):
+    """Return the code of CONVERTER_CLASSES used for ``lang``.
+
+    Besides the codes themselves, BCP-47 tags and POSIX locales such as
+    ``en-US``, ``pt_br``, ``es-419`` or ``fr_CA.UTF-8`` are understood,
+    falling back from the region to the language, as are the aliases of
+    LANG_ALIASES (``da`` for ``dk``...). Raises NotImplementedError for
+    unsupported languages.
+    """
+    resolved = CONVERTER_CLASSES.resolve(lang)
+    if resolved is None:
+        raise NotImplementedError()
+    return resolved
+
+
+def get_converter(lang):
+    return CONVERTER_CLASSES[resolve_lang(lang)]
+
+
+def get_converter_method(converter, to):
+    if to not in CONVERTES_TYPES:
         raise NotImplementedError()
-    converter = CONVERTER_CLASSES[lang]
+    return getattr(converter, 'to_{}'.format(to))
+
+
+def num2words(number, ordinal=False, lang='en', to='cardinal', cache=None,
+              **kwargs):
+    """Return the words of ``number`` in ``lang``.
+
+    ``cache`` overrides for this call whether the result cache is used
+    (see enable_cache()); by default it is when the cache is enabled.
+    """
+    converter, convert, kwargs, key = _prepare(number, ordinal, lang, to,
+                                               cache, kwargs)
+    if key is not None:
+        result = _cache.get_cached(key, _MISSING)
+        if result is not _MISSING:
+            return result
 
     if isinstance(number, str):
         number = converter.str_to_number(number)
+    result = convert(number, **kwargs)
 
-    # backwards compatible
-    if ordinal:
-        return converter.to_ordinal(number)
+    if key is not None:
+        _cache.set_cached(key, result)
+    return result
 
+
+def get_formatter(lang='en', to='cardinal', **options):
+    """Return a function spelling a number with fixed settings.
+
+    The language, the converter method and ``options`` are resolved and
+    checked once, so ``get_formatter('fi', case='genitive')(value)`` only
+    does the conversion; the formatter can be kept in a module global.
+    Invalid options raise here rather than on the first call. Formatters
+    do not use the result cache.
+    """
+    converter = get_converter(lang)
     if to not in CONVERTES_TYPES:
         raise NotImplementedError()
+    if hasattr(converter, 'bind'):
+        convert = converter.bind(to, **options)
+    else:
+        from .base import bind_converter
+        convert = bind_converter(converter, to, options)
+
+    def formatter(number):
+        if isinstance(number, str):
+            number = converter.str_to_number(number)
+        return convert(number)
+
+    return formatter
+
+
+def _prepare(number, ordinal, lang, to, cache, kwargs):
+    """Return the converter, its method, arguments and result cache key
+    (None when not cached) of a num2words() call."""
+    converter = get_converter(lang)
+
+    # backwards compatible
+    if ordinal:
+        to, kwargs = 'ordinal', {}
+    convert = get_converter_method(converter, to)
+
+    if cache is None:
+        cache = _cache.cache_enabled()
+    key = _cache_key(converter, to, number, kwargs) if cache else None
+    return converter, convert, kwargs, key
+
+
+def _cached_words(number, ordinal=False, lang='en', to='cardinal',
+                  cache=None, **kwargs):
+    """Return the cached result of a num2words() call or _MISSING. Only
+    hits are counted, the call made on a miss counts the miss."""
+    key = _prepare(number, ordinal, lang, to, cache, kwargs)[3]
+    if key is None:
+        return _MISSING
+    return _cache.get_cached(key, _MISSING, count_misses=False)
+
+
+_MISSING = object()
+
+
+def _cache_key(converter, to, number, kwargs):
+    """Return the result cache key of a conversion, or None if it cannot
+    be cached (unhashable number or argument)."""
+    try:
+        key = (converter, to, _value_key(number),
+               tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+BATCH_ERRORS = ('raise', 'skip', 'replace')
+
+_SKIP = object()
+
+
+def _value_key(value):
+    """Return a dict key for ``value`` that keeps apart numbers which
+    compare equal but convert differently, e.g. 150, 150.0 (currency
+    treats integers as cents), 0.0 and -0.0 or Decimal('1.0') and
+    Decimal('1.00').
+    """
+    if isinstance(value, Decimal):
+        return Decimal, value.as_tuple()
+    if isinstance(value, float):
+        return float, repr(value)
+    return type(value), value
+
+
+def _make_convert_one(lang, to, errors, default, kwargs):
+    """Resolve ``lang`` and ``to`` once and return a function converting a
+    single value according to the ``errors`` policy of num2words_many().
+    """
+    if errors not in BATCH_ERRORS:
+        raise ValueError('errors must be one of %s, not %r' %
+                         (', '.join(BATCH_ERRORS), errors))
+    converter = get_converter(lang)
+    convert = get_converter_method(converter, to)
+
+    def convert_one(number):
+        try:
+            if isinstance(number, str):
+                number = converter.str_to_number(number)
+            return convert(number, **kwargs)
+        except Exception:
+            if errors == 'raise':
+                raise
+            return _SKIP if errors == 'skip' else default
+
+    return convert_one
+
+
+def _convert_many(values, convert_one, done):
+    """Convert ``values``, memoizing the results in the ``done`` dict."""
+    results = []
+    for value in values:
+        try:
+            key = _value_key(value)
+            result = done[key]
+        except KeyError:
+            result = done[key] = convert_one(value)
+        except TypeError:
+            # unhashable, convert without memoizing
+            result = convert_one(value)
+        if result is not _SKIP:
+            results.append(result)
+    return results
+
+
+def num2words_many(values, lang='en', to='cardinal', errors='raise',
+                   default=None, **kwargs):
+    """Convert every number in ``values``, returning a list in input order.
+
+    The converter and its ``to_*`` method are resolved once for the whole
+    batch and repeated values are converted only once. ``kwargs`` are
+    passed on to the converter like with num2words().
+
+    ``errors`` sets what happens when a value cannot be converted:
+
+    * ``'raise'`` (default): the exception propagates and aborts the batch.
+    * ``'skip'``: the value is left out of the result.
+    * ``'replace'``: ``default`` is put in place of the words.
+
+    An unknown ``lang`` or ``to`` always raises ``NotImplementedError``.
+    """
+    convert_one = _make_convert_one(lang, to, errors, default, kwargs)
+    return _convert_many(values, convert_one, {})
+
+
+# Integers below this (in absolute value) stay cached during a stream
+STREAM_CACHE_LIMIT = 10000
+
+
+def _is_small(key):
+    return key[0] is int and -STREAM_CACHE_LIMIT < key[1] < STREAM_CACHE_LIMIT
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for value in iterable:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_num2words(iterable, lang='en', to='cardinal', chunksize=None,
+                   errors='raise', default=None, **kwargs):
+    """Lazily convert the numbers of ``iterable``, yielding their words.
+
+    Memory use does not grow with the length of the input: the converter
+    is resolved once and only integers smaller than ``STREAM_CACHE_LIMIT``
+    are cached for the whole stream. With ``chunksize``, values are read
+    and converted ``chunksize`` at a time through the batch path of
+    num2words_many(), which also dedupes the values of each chunk.
+
+    ``lang``, ``to``, ``errors``, ``default`` and ``kwargs`` are the same
+    as for num2words_many(). With ``errors='skip'`` fewer items are
+    yielded than read.
+    """
+    convert_one = _make_convert_one(lang, to, errors, default, kwargs)
+    if chunksize:
+        return _iter_chunks(iterable, convert_one, chunksize)
+    return _iter_values(iterable, convert_one)
+
+
+def _iter_values(iterable, convert_one):
+    done = {}
+    for value in iterable:
+        key = _value_key(value)
+        if _is_small(key):
+            try:
+                result = done[key]
+            except KeyError:
+                result = done[key] = convert_one(value)
+        else:
+            result = convert_one(value)
+        if result is not _SKIP:
+            yield result
+
+
+def _iter_chunks(iterable, convert_one, chunksize):
+    done = {}
+    for chunk in _chunked(iterable, chunksize):
+        for result in _convert_many(chunk, convert_one, done):
+            yield result
+        for key in [key for key in done if not _is_small(key)]:
+            del done[key]
+
 
-    return getattr(converter, 'to_{}'.format(to))(number, **kwargs)
+enable_cache_from_env()
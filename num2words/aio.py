@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""asyncio front-end: conversions that do not block the event loop.
+
+Conversions run on an executor (the loop's default thread pool unless
+another one, e.g. a ProcessPoolExecutor, is given). At most
+``max_concurrency`` of them are in flight per event loop, further callers
+wait for a free slot. Cheap inputs, small integers by default, are
+converted inline since the executor round trip would cost more than the
+conversion itself, as are results found in the result cache.
+
+Requires Python 3.7 or later.
+"""
+
+from __future__ import unicode_literals
+
+import asyncio
+import weakref
+from functools import partial
+
+from . import (_MISSING, _cached_words, _make_convert_one, num2words,
+               num2words_many)
+
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Integers below this (in absolute value) are converted inline
+INLINE_LIMIT = 1000
+
+# Largest batch of cheap values converted inline
+INLINE_BATCH_SIZE = 32
+
+# Batches are split in chunks of this size, converted concurrently
+BATCH_CHUNKSIZE = 1000
+
+
+class AsyncConverter(object):
+    """Run conversions on ``executor`` with bounded concurrency."""
+
+    def __init__(self, executor=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 inline_limit=INLINE_LIMIT, chunksize=BATCH_CHUNKSIZE):
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.inline_limit = inline_limit
+        self.chunksize = chunksize
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def is_cheap(self, value):
+        """Whether ``value`` is converted inline, on the event loop."""
+        return (type(value) is int
+                and -self.inline_limit < value < self.inline_limit)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self.max_concurrency)
+        async with semaphore:
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def convert(self, number, lang='en', to='cardinal', **kwargs):
+        """Asynchronous num2words().
+
+        Results found in the result cache are returned inline.
+        """
+        if self.is_cheap(number):
+            return num2words(number, lang=lang, to=to, **kwargs)
+        result = _cached_words(number, lang=lang, to=to, **kwargs)
+        if result is not _MISSING:
+            return result
+        return await self._run(
+            partial(num2words, number, lang=lang, to=to, **kwargs))
+
+    async def convert_many(self, values, lang='en', to='cardinal',
+                           errors='raise', default=None, **kwargs):
+        """Asynchronous num2words_many().
+
+        Large batches are split in chunks of ``chunksize`` values which are
+        converted concurrently. Cancelling the call cancels the chunks that
+        have not started yet.
+        """
+        values = list(values)
+        if (len(values) <= INLINE_BATCH_SIZE
+                and all(self.is_cheap(value) for value in values)):
+            return num2words_many(values, lang=lang, to=to, errors=errors,
+                                  default=default, **kwargs)
+
+        # fail early on unknown lang, to and errors
+        _make_convert_one(lang, to, errors, default, kwargs)
+        func = partial(num2words_many, lang=lang, to=to, errors=errors,
+                       default=default, **kwargs)
+        chunks = await asyncio.gather(*[
+            self._run(func, values[i:i + self.chunksize])
+            for i in range(0, len(values), self.chunksize)
+        ])
+        return [words for chunk in chunks for words in chunk]
+
+
+_default_converter = AsyncConverter()
+
+
+def configure(executor=None, max_concurrency=DEFAULT_MAX_CONCURRENCY,
+              inline_limit=INLINE_LIMIT, chunksize=BATCH_CHUNKSIZE):
+    """Set up the AsyncConverter behind anum2words() and
+    anum2words_many()."""
+    global _default_converter
+    _default_converter = AsyncConverter(executor, max_concurrency,
+                                        inline_limit, chunksize)
+    return _default_converter
+
+
+async def anum2words(number, lang='en', to='cardinal', **kwargs):
+    return await _default_converter.convert(number, lang=lang, to=to,
+                                            **kwargs)
+
+
+async def anum2words_many(values, lang='en', to='cardinal', errors='raise',
+                          default=None, **kwargs):
+    return await _default_converter.convert_many(
+        values, lang=lang, to=to, errors=errors, default=default, **kwargs)
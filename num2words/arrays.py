@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Conversion of NumPy arrays.
+
+NumPy is an optional dependency, it is only imported when
+num2words_array() is called.
+
+Integer cardinals in languages with a group engine (see ``ENGINES``) are
+split into base-1000 (base-10000 for ``ja`` and ``ko``) digit groups with
+vectorized integer operations and assembled from per-language group
+tables. Everything else is converted by the scalar converter, once per
+distinct value in the array.
+
+Only ``en``, ``ja`` and ``ko`` have a group engine. The other languages,
+whose group words depend on their neighbours (``un mille``/``mille``,
+``quatre-vingts``, case and gender agreement...), are not vectorized and
+only gain from the de-duplication of values.
+"""
+
+from __future__ import unicode_literals
+
+from . import CONVERTER_CLASSES, get_converter_method, resolve_lang
+from .compat import strtype
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("num2words_array() requires NumPy, install it "
+                          "with 'pip install num2words[numpy]'")
+    return numpy
+
+
+class GroupEngine(object):
+    """Cardinal words assembled from the words of each digit group.
+
+    ``words[g]`` is the converter's cardinal for ``g < base``; the group at
+    position ``i`` is spelled ``group_text(g, i)`` and consecutive non-zero
+    groups are joined with ``separator``.
+    """
+    base = 1000
+    separator = ' '
+
+    def __init__(self, converter):
+        self.converter = converter
+        self.words = [converter.to_cardinal(g) for g in range(self.base)]
+        self.maxval = converter.MAXVAL
+        self._tables = {}
+
+    def scale(self, i):
+        return self.converter.cards[self.base ** i]
+
+    def group_text(self, g, i):
+        if i == 0:
+            return self.words[g]
+        return '%s %s' % (self.words[g], self.scale(i))
+
+    def table(self, np, i):
+        try:
+            return self._tables[i]
+        except KeyError:
+            table = np.empty(self.base, dtype=object)
+            table[0] = ''
+            table[1:] = [self.group_text(g, i) for g in range(1, self.base)]
+            return self._tables.setdefault(i, table)
+
+    def separators(self, np, i, group):
+        return self.separator
+
+    def convert(self, np, values):
+        """Return an object array with the cardinals of int array values."""
+        negative = values < 0
+        if values.dtype.kind == 'i':
+            # -(v + 1) cannot overflow, even for the smallest integer
+            magnitude = np.where(negative, -(values + 1), values)
+            magnitude = magnitude.astype(np.uint64) + negative
+        else:
+            magnitude = values.astype(np.uint64)
+
+        out = np.empty(len(values), dtype=object)
+        out[:] = ''
+        nonempty = np.zeros(len(values), dtype=bool)
+
+        groups = []
+        rest = magnitude
+        while True:
+            groups.append((rest % self.base).astype(np.intp))
+            rest = rest // self.base
+            if not rest.any():
+                break
+
+        for i in range(len(groups) - 1, -1, -1):
+            group = groups[i]
+            part = self.table(np, i)[group]
+            present = group != 0
+            joined = present & nonempty
+            if joined.any():
+                sep = self.separators(np, i, group)
+                if not isinstance(sep, strtype):
+                    sep = sep[joined]
+                out[joined] = out[joined] + sep + part[joined]
+            first = present & ~nonempty
+            out[first] = part[first]
+            nonempty |= present
+
+        out[magnitude == 0] = self.words[0]
+        if negative.any():
+            out[negative] = self.converter.negword + out[negative]
+        return out
+
+
+class EnglishEngine(GroupEngine):
+    def separators(self, np, i, group):
+        # "one thousand and one", "one thousand, one hundred"
+        if i == 0:
+            seps = np.empty(len(group), dtype=object)
+            seps[:] = ', '
+            seps[group < 100] = ' and '
+            return seps
+        return ', '
+
+
+class JapaneseEngine(GroupEngine):
+    base = 10000
+    separator = ''
+
+    def scale(self, i):
+        return self.converter.cards[self.base ** i][0]
+
+    def group_text(self, g, i):
+        if i == 0:
+            return self.words[g]
+        return self.words[g] + self.scale(i)
+
+
+class KoreanEngine(GroupEngine):
+    base = 10000
+
+    def group_text(self, g, i):
+        if i == 0:
+            return self.words[g]
+        # "만", but "일억"
+        if g == 1 and i == 1:
+            return self.scale(i)
+        return self.words[g] + self.scale(i)
+
+
+ENGINES = {
+    'en': EnglishEngine,
+    'ja': JapaneseEngine,
+    'ko': KoreanEngine,
+}
+
+_engines = {}
+
+
+def get_engine(lang):
+    """Return the group engine of ``lang`` or None if it has none."""
+    lang = resolve_lang(lang)
+    if lang not in ENGINES:
+        return None
+    converter = CONVERTER_CLASSES[lang]
+    engine = _engines.get(lang)
+    if engine is None or engine.converter is not converter:
+        engine = _engines[lang] = ENGINES[lang](converter)
+    return engine
+
+
+def _convert_scalar(np, convert, values, kwargs):
+    if not len(values):
+        return np.empty(0, dtype=object)
+    distinct, inverse = np.unique(values, return_inverse=True)
+    words = np.empty(len(distinct), dtype=object)
+    words[:] = [convert(value, **kwargs) for value in distinct.tolist()]
+    return words[inverse.ravel()]
+
+
+def num2words_array(values, lang='en', to='cardinal', **kwargs):
+    """Convert a NumPy array of numbers, returning an object array of the
+    same shape holding the words.
+
+    ``lang``, ``to`` and ``kwargs`` are the same as for num2words().
+    """
+    np = _import_numpy()
+    values = np.asarray(values)
+    converter = CONVERTER_CLASSES[resolve_lang(lang)]
+    convert = get_converter_method(converter, to)
+    flat = values.ravel()
+    out = np.empty(flat.shape, dtype=object)
+
+    engine = None
+    if to == 'cardinal' and not kwargs and flat.dtype.kind in 'iuf':
+        engine = get_engine(lang)
+
+    if engine is None or not len(flat):
+        out[:] = _convert_scalar(np, convert, flat, kwargs)
+    elif flat.dtype.kind in 'iu':
+        if max(int(flat.max()), -int(flat.min())) >= engine.maxval:
+            out[:] = _convert_scalar(np, convert, flat, kwargs)
+        else:
+            out[:] = engine.convert(np, flat)
+    else:
+        integral = np.isfinite(flat) & (flat == np.floor(flat))
+        integral &= np.abs(flat) < min(2.0 ** 63, engine.maxval)
+        out[integral] = engine.convert(np, flat[integral].astype(np.int64))
+        out[~integral] = _convert_scalar(np, convert, flat[~integral],
+                                         kwargs)
+    return out.reshape(values.shape)
@@ -17,17 +17,124 @@
 
 from __future__ import unicode_literals
 
-import math
+from bisect import bisect_right
 from collections import OrderedDict
 from decimal import Decimal
+from functools import partial
 
-from .compat import to_s
+from .compat import getargspec, intern, strtype, to_s
 from .currency import parse_currency_parts, prefix_currency
 
 
+class CardIndex(object):
+    """Sorted index of the keys of a card table.
+
+    Tables are filled from the highest card down, and splitnum() takes the
+    first card (in table order) not greater than the value. The keys are
+    kept sorted with, for every key, the card that scan would pick for
+    values from this key up to the next one, so a lookup is a binary
+    search whatever the table order is.
+    """
+
+    __slots__ = ('cards', 'keys', 'found')
+
+    def __init__(self, cards):
+        order = dict((key, i) for i, key in enumerate(cards))
+        found = []
+        best = None
+        for key in sorted(cards):
+            if best is None or order[key] < order[best]:
+                best = key
+            found.append(best)
+        self.cards = cards
+        self.keys = tuple(sorted(cards))
+        self.found = tuple(found)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def find(self, value):
+        """Return the card splitnum() would use for ``value``, or None."""
+        i = bisect_right(self.keys, value)
+        if i:
+            return self.found[i - 1]
+
+
+class SpellTable(list):
+    """Texts of the integers 0..len - 1, see Num2Word_Base.spell_table().
+
+    Compared to a sequence of (text, num) pairs this saves a tuple and an
+    int object per entry: a num is only stored, in ``nums``, when it is
+    not the index of its text.
+    """
+
+    __slots__ = ('nums',)
+
+    def __init__(self):
+        super(SpellTable, self).__init__()
+        self.nums = {}
+
+    def add(self, pair):
+        """Append the (text, num) pair of the next integer."""
+        text, num = pair
+        if num != len(self):
+            self.nums[len(self)] = num
+        self.append(text)
+
+
+# Card keys shared by the converters, see compact_cards()
+_shared_keys = {}
+
+
+def compact_cards(cards):
+    """Return ``cards`` with keys and words shared between converters.
+
+    Powers of ten and words such as "million" are computed by every
+    converter loading them; the copies are replaced by a single object
+    (interned for the words, which may also be tuples of words).
+    """
+    compact = OrderedDict()
+    for key, word in cards.items():
+        if isinstance(word, strtype):
+            word = intern(word)
+        elif isinstance(word, tuple):
+            word = tuple(intern(part) if isinstance(part, strtype) else part
+                         for part in word)
+        compact[_shared_keys.setdefault(key, key)] = word
+    return compact
+
+
+def bind_converter(converter, to, options):
+    """Return a function converting a number with ``converter.to_<to>``
+    and ``options``, checked once here rather than on every call.
+
+    Unknown options raise TypeError and, for ``to='currency'``, a
+    ``currency`` code missing from CURRENCY_FORMS NotImplementedError.
+    """
+    method = getattr(converter, 'to_%s' % to)
+    spec = getargspec(method)
+    if not spec[2]:
+        names = spec[0][2:] + list(getattr(spec, 'kwonlyargs', []))
+        for name in options:
+            if name not in names:
+                raise TypeError(
+                    "%s() got an unexpected keyword argument '%s'" %
+                    (method.__name__, name))
+    forms = getattr(converter, 'CURRENCY_FORMS', None)
+    currency = options.get('currency')
+    if to == 'currency' and currency is not None and forms and \
+            currency not in forms:
+        raise NotImplementedError(
+            'Currency code "%s" not implemented for "%s"' %
+            (currency, converter.__class__.__name__))
+    return partial(method, **options) if options else method
+
+
 class Num2Word_Base(object):
     CURRENCY_FORMS = {}
     CURRENCY_ADJECTIVES = {}
+    # Cardinals below this are spelled once, see spell_table()
+    CARDINAL_TABLE_SIZE = 1000
 
     def __init__(self):
         self.is_title = False
@@ -39,6 +146,8 @@ class Num2Word_Base(object):
         self.errmsg_floatord = "Cannot treat float %s as ordinal."
         self.errmsg_negord = "Cannot treat negative num %s as ordinal."
         self.errmsg_toobig = "abs(%s) must be less than %s."
+        self._card_indexes = {}
+        self._spell_tables = {}
 
         self.setup()
 
@@ -47,6 +156,7 @@ class Num2Word_Base(object):
                ['high_numwords', 'mid_numwords', 'low_numwords']):
             self.cards = OrderedDict()
             self.set_numwords()
+            self.cards = compact_cards(self.cards)
             self.MAXVAL = 1000 * list(self.cards.keys())[0]
 
     def set_numwords(self):
@@ -66,29 +176,125 @@ class Num2Word_Base(object):
             self.cards[n] = word
 
     def splitnum(self, value):
-        for elem in self.cards:
-            if elem > value:
-                continue
+        elem = self.find_card(value)
+        if elem is None:
+            return None
 
-            out = []
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
+
+        if div == 1:
+            out.append((self.cards[1], 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(div * self.cards[elem], div*elem)]
+            out.append(self.splitnum(div))
+
+        out.append((self.cards[elem], elem))
+
+        if mod:
+            out.append(self.splitnum(mod))
+
+        return out
+
+    def card_index(self, cards=None):
+        """Return the CardIndex of ``cards`` (self.cards by default).
+
+        Indexes are built on first use and rebuilt if the table changed
+        size. Building one twice from two threads is harmless.
+        """
+        if cards is None:
+            cards = self.cards
+        index = self._card_indexes.get(id(cards))
+        if index is None or index.cards is not cards or \
+                len(index) != len(cards):
+            index = self._card_indexes[id(cards)] = CardIndex(cards)
+        return index
+
+    def find_card(self, value, cards=None):
+        """Return the largest key of ``cards`` not greater than ``value``."""
+        return self.card_index(cards).find(value)
+
+    def spell_int(self, value, cards=None, text=None, args=(), table=()):
+        """Iterative equivalent of ``self.clean(self.splitnum(value))``.
+
+        The number is consumed one card at a time from the most significant
+        end; every ``multiplier card`` group is merged as soon as it is
+        known and kept on a stack until the remainder has been spelled,
+        the stack is then folded right to left as clean() does. Only the
+        multipliers, which are smaller than the ratio between two cards,
+        are spelled recursively.
+
+        ``cards`` defaults to self.cards, ``text(elem)`` to ``cards[elem]``
+        and ``args`` are passed on to merge(). ``table`` is a SpellTable of
+        the integers below its length spelled with the same settings (see
+        spell_table()): they are returned as is, and larger numbers are
+        merged from its entries. Returns a (text, num) pair.
+        """
+        size = len(table)
+        if type(value) is int and value < size:
+            return (table[value], table.nums.get(value, value))
+        if cards is None:
+            cards = self.cards
+        if text is None:
+            text = cards.__getitem__
+        merge = self.merge
+
+        groups = []
+        while True:
+            elem = self.find_card(value, cards)
             if value == 0:
                 div, mod = 1, 0
             else:
                 div, mod = divmod(value, elem)
 
             if div == 1:
-                out.append((self.cards[1], 1))
+                left = (text(1), 1)
+            elif div == value:  # The system tallies, eg Roman Numerals
+                pair = (div * text(elem), div * elem)
+                break
+            elif type(div) is int and div < size:
+                left = (table[div], table.nums.get(div, div))
             else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(div * self.cards[elem], div*elem)]
-                out.append(self.splitnum(div))
-
-            out.append((self.cards[elem], elem))
-
-            if mod:
-                out.append(self.splitnum(mod))
-
-            return out
+                left = self.spell_int(div, cards, text, args, table)
+
+            pair = merge(left, (text(elem), elem), *args)
+            if not mod:
+                break
+            groups.append(pair)
+            if type(mod) is int and mod < size:
+                pair = (table[mod], table.nums.get(mod, mod))
+                break
+            value = mod
+
+        while groups:
+            pair = merge(groups.pop(), pair, *args)
+        return pair
+
+    def spell_table(self, key='cardinal', cards=None, text=None, args=()):
+        """Return the SpellTable of 0..CARDINAL_TABLE_SIZE - 1.
+
+        The table is built the first time it is asked for, every entry
+        merged from the previous ones, and kept under ``key``, which must
+        identify the other arguments (they are passed to spell_int()).
+        """
+        table = self._spell_tables.get(key)
+        if table is None:
+            table = SpellTable()
+            for value in range(self.CARDINAL_TABLE_SIZE):
+                table.add(self.spell_int(value, cards, text, args, table))
+            self._spell_tables[key] = table
+        return table
+
+    def bind(self, to, **options):
+        """Return a function converting a number with ``to_<to>`` and
+        ``options``, see bind_converter(). Languages override this to
+        also turn options into the values their methods use.
+        """
+        return bind_converter(self, to, options)
 
     def parse_minus(self, num_str):
         """Detach minus and return it as symbol with new num_str."""
@@ -100,11 +306,15 @@ class Num2Word_Base(object):
     def str_to_number(self, value):
         return Decimal(value)
 
-    def to_cardinal(self, value):
+    def to_cardinal(self, value, trailing_zeros=False):
         try:
             assert int(value) == value
         except (ValueError, TypeError, AssertionError):
-            return self.to_cardinal_float(value)
+            return self.to_cardinal_float(value, trailing_zeros)
+
+        if trailing_zeros and isinstance(value, Decimal) and \
+                value.as_tuple().exponent < 0:
+            return self.to_cardinal_float(value, trailing_zeros)
 
         out = ""
         if value < 0:
@@ -114,59 +324,89 @@ class Num2Word_Base(object):
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value)
-        words, num = self.clean(val)
+        words, num = self.spell_int(value, table=self.spell_table())
         return self.title(out + words)
 
-    def float2tuple(self, value):
-        pre = int(value)
+    def _int_to_cardinal(self, value, *args):
+        """Spell out a non-negative integer, passing ``args`` to merge()."""
+        if value >= self.MAXVAL:
+            raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        # Simple way of finding decimal places to update the precision
-        self.precision = abs(Decimal(str(value)).as_tuple().exponent)
+        words, num = self.spell_int(value, args=args)
+        return self.title(words)
 
-        post = abs(value - pre) * 10**self.precision
-        if abs(round(post) - post) < 0.01:
-            # We generally floor all values beyond our precision (rather than
-            # rounding), but in cases where we have something like 1.239999999,
-            # which is probably due to python's handling of floats, we actually
-            # want to consider it as 1.24 instead of 1.23
-            post = int(round(post))
-        else:
-            post = int(math.floor(post))
+    def float_precision(self, value):
+        """Return the number of decimal places of the float ``value``."""
+        return abs(Decimal(str(value)).as_tuple().exponent)
 
-        return pre, post
+    def split_fraction(self, value, trailing_zeros=False):
+        """Return the integer part of ``value`` and its fractional digits.
 
-    def to_cardinal_float(self, value):
+        The digits are read from the decimal notation of the value, in
+        full for a Decimal and from the shortest repr of a float, so none
+        is lost to float arithmetic. Trailing zeros ("1.50") are dropped
+        unless ``trailing_zeros`` is set.
+        """
+        pre = int(value)
+        if isinstance(value, Decimal):
+            text = format(value, 'f')
+        elif pre == value:
+            return pre, ()
+        else:
+            text = repr(float(value))
+            if 'e' in text:
+                text = format(Decimal(text), 'f')
+
+        fraction = text.partition('.')[2]
+        if not trailing_zeros:
+            fraction = fraction.rstrip('0')
+        return pre, tuple(int(digit) for digit in fraction)
+
+    def float2tuple(self, value, precision=None):
+        """Return the integer part of ``value`` and its first ``precision``
+        fractional digits (all of them by default) as an integer."""
+        pre, digits = self.split_fraction(value, trailing_zeros=True)
+        if precision is None:
+            precision = len(digits)
+        digits = (digits + (0,) * precision)[:precision]
+        return pre, int(''.join(to_s(digit) for digit in digits) or 0)
+
+    def to_cardinal_float(self, value, trailing_zeros=False):
         try:
             float(value) == value
         except (ValueError, TypeError, AssertionError, AttributeError):
             raise TypeError(self.errmsg_nonnum % value)
 
-        pre, post = self.float2tuple(float(value))
-
-        post = str(post)
-        post = '0' * (self.precision - len(post)) + post
+        pre, digits = self.split_fraction(value, trailing_zeros)
 
         out = [self.to_cardinal(pre)]
-        if self.precision:
+        if digits:
             out.append(self.title(self.pointword))
 
-        for i in range(self.precision):
-            curr = int(post[i])
-            out.append(to_s(self.to_cardinal(curr)))
+        # Each digit is spelled once
+        words = {}
+        for digit in digits:
+            if digit not in words:
+                words[digit] = to_s(self.to_cardinal(digit))
+            out.append(words[digit])
 
         return " ".join(out)
 
     def merge(self, curr, next):
         raise NotImplementedError
 
-    def clean(self, val):
+    def clean(self, val, *args):
+        """Merge the output of splitnum() into a single (text, num) pair.
+
+        Extra positional ``args`` are passed on to merge(), so per-call
+        settings never have to be stored on the (shared) converter.
+        """
         out = val
         while len(val) != 1:
             out = []
             left, right = val[:2]
             if isinstance(left, tuple) and isinstance(right, tuple):
-                out.append(self.merge(left, right))
+                out.append(self.merge(left, right, *args))
                 if val[2:]:
                     out.append(val[2:])
             else:
@@ -175,7 +415,7 @@ class Num2Word_Base(object):
                         if len(elem) == 1:
                             out.append(elem[0])
                         else:
-                            out.append(self.clean(elem))
+                            out.append(self.clean(elem, *args))
                     else:
                         out.append(elem)
             val = out
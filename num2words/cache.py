@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Result cache of num2words().
+
+The cache is off by default. enable_cache() turns it on for every call,
+``num2words(..., cache=True)`` or ``cache=False`` overrides that for one
+call. Converters must not be modified while their results are cached
+(e.g. ``is_title``), call cache_clear() after doing so.
+
+Results are stored by a backend: an in-process LRUCache by default, a
+DbmCache file kept between runs of one process at a time, or a
+SqliteCache file shared between processes and runs. Backends are chosen
+with enable_cache(backend) or, without touching the code, with the
+``NUM2WORDS_CACHE`` environment variable (see open_backend()).
+"""
+
+from __future__ import unicode_literals
+
+import atexit
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+DEFAULT_MAXSIZE = 4096
+
+# Pending writes of SqliteCache are committed this many at a time
+SQLITE_BATCH_SIZE = 100
+
+CACHE_ENV = 'NUM2WORDS_CACHE'
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class CacheBackend(object):
+    """Interface of the result cache backends.
+
+    Keys are the tuples built by num2words(): ``(converter, to, value key,
+    sorted kwargs)``. Backends must be thread-safe.
+    """
+
+    maxsize = None
+
+    def get(self, key, default=None, count_misses=True):
+        """Return the value of ``key`` or ``default``, counting a hit or,
+        unless ``count_misses`` is false, a miss."""
+        raise NotImplementedError
+
+    def set(self, key, value):
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove every entry and reset the statistics."""
+        raise NotImplementedError
+
+    def info(self):
+        """Return a CacheInfo."""
+        raise NotImplementedError
+
+    def close(self):
+        """Write pending entries and release resources."""
+
+
+class LRUCache(CacheBackend):
+    """Thread-safe mapping of at most ``maxsize`` entries, evicting the
+    least recently used one when full.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None, count_misses=True):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                if count_misses:
+                    self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._data))
+
+
+def default_namespace():
+    """Namespace of persistent keys: the library version, so that words
+    cached by another release are never served."""
+    from . import __version__
+    return 'num2words-%s' % __version__
+
+
+class PersistentCache(CacheBackend):
+    """Base of the backends storing results in a file.
+
+    Keys are encoded as text from the converter class, rather than the
+    converter object, and prefixed with ``namespace``. Values are stored
+    as JSON; results that are not JSON serializable are not stored.
+    """
+
+    def __init__(self, path, namespace=None):
+        self.path = path
+        self.namespace = namespace or default_namespace()
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+
+    def encode_key(self, key):
+        converter, to, value_key, kwargs = key
+        cls = type(converter)
+        return '%s %s.%s %r' % (self.namespace, cls.__module__,
+                                cls.__name__, (to, value_key, kwargs))
+
+    def get(self, key, default=None, count_misses=True):
+        key = self.encode_key(key)
+        with self._lock:
+            value = self._load(key)
+            if value is None:
+                if count_misses:
+                    self.misses += 1
+                return default
+            self.hits += 1
+        import json
+        return json.loads(value)
+
+    def set(self, key, value):
+        import json
+        try:
+            value = json.dumps(value)
+        except TypeError:
+            return
+        key = self.encode_key(key)
+        with self._lock:
+            self._store(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, None, self._count())
+
+    def _load(self, key):
+        raise NotImplementedError
+
+    def _store(self, key, value):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+    def _count(self):
+        raise NotImplementedError
+
+
+class DbmCache(PersistentCache):
+    """Results stored with the standard library ``dbm`` module.
+
+    The file must only be opened by one process at a time: ``dbm`` does
+    no locking, concurrent writers corrupt a ``dbm.dumb`` index and
+    ``dbm.gnu`` refuses a second writer. Use SqliteCache to share results
+    between processes.
+
+    Entries of other namespaces are left in the file, clear() removes
+    every entry.
+    """
+
+    def __init__(self, path, namespace=None):
+        super(DbmCache, self).__init__(path, namespace)
+        try:
+            import dbm
+            self._db = dbm.open(path, 'c')
+        except ImportError:
+            import anydbm
+            self._db = anydbm.open(path, 'c')
+
+    def _load(self, key):
+        try:
+            return self._db[key.encode('utf-8')].decode('utf-8')
+        except KeyError:
+            return None
+
+    def _store(self, key, value):
+        self._db[key.encode('utf-8')] = value.encode('utf-8')
+
+    def _clear(self):
+        for key in list(self._db.keys()):
+            del self._db[key]
+
+    def _count(self):
+        prefix = ('%s ' % self.namespace).encode('utf-8')
+        return sum(1 for key in self._db.keys() if key.startswith(prefix))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class SqliteCache(PersistentCache):
+    """Results stored in an SQLite database in WAL mode.
+
+    Writes are kept in memory and committed ``batch_size`` at a time (and
+    on close()), readers in other processes are not blocked by writers.
+    Entries of other namespaces are deleted when the database is opened.
+    """
+
+    def __init__(self, path, namespace=None, batch_size=SQLITE_BATCH_SIZE):
+        import sqlite3
+
+        super(SqliteCache, self).__init__(path, namespace)
+        self.batch_size = batch_size
+        self._pending = {}
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS results ('
+                             'namespace TEXT, key TEXT, value TEXT, '
+                             'PRIMARY KEY (namespace, key))')
+            self._db.execute('DELETE FROM results WHERE namespace != ?',
+                             (self.namespace,))
+
+    def encode_key(self, key):
+        # the namespace has its own column
+        return super(SqliteCache, self).encode_key(key)[
+            len(self.namespace) + 1:]
+
+    def _load(self, key):
+        try:
+            return self._pending[key]
+        except KeyError:
+            pass
+        row = self._db.execute(
+            'SELECT value FROM results WHERE namespace = ? AND key = ?',
+            (self.namespace, key)).fetchone()
+        return row and row[0]
+
+    def _store(self, key, value):
+        self._pending[key] = value
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            with self._db:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?)',
+                    [(self.namespace, key, value)
+                     for key, value in self._pending.items()])
+            self._pending.clear()
+
+    def _clear(self):
+        self._pending.clear()
+        with self._db:
+            self._db.execute('DELETE FROM results')
+
+    def _count(self):
+        self._flush()
+        return self._db.execute(
+            'SELECT COUNT(*) FROM results WHERE namespace = ?',
+            (self.namespace,)).fetchone()[0]
+
+    def flush(self):
+        """Commit the pending writes."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._db.close()
+
+
+def open_backend(spec):
+    """Return the backend described by ``spec``.
+
+    ``spec`` is ``memory`` or ``memory:<maxsize>`` for an LRUCache,
+    ``dbm:<path>`` for a DbmCache or ``sqlite:<path>`` for a SqliteCache.
+    This is the format of the ``NUM2WORDS_CACHE`` environment variable.
+    """
+    kind, _, arg = spec.partition(':')
+    if kind == 'memory':
+        return LRUCache(int(arg) if arg else DEFAULT_MAXSIZE)
+    if kind == 'dbm' and arg:
+        return DbmCache(arg)
+    if kind == 'sqlite' and arg:
+        return SqliteCache(arg)
+    raise ValueError('invalid cache backend %r' % spec)
+
+
+_results = LRUCache()
+_enabled = False
+
+
+def enable_cache(maxsize=None, backend=None):
+    """Cache the results of every num2words() call.
+
+    ``maxsize`` resizes the in-process LRU cache (DEFAULT_MAXSIZE entries
+    unless given), clearing it if the size changes. ``backend``, a
+    CacheBackend or a string for open_backend(), replaces the current
+    backend, which is closed.
+    """
+    global _enabled, _results
+    if backend is None and maxsize is not None and \
+            maxsize != _results.maxsize:
+        backend = LRUCache(maxsize)
+    if backend is not None:
+        if not isinstance(backend, CacheBackend):
+            backend = open_backend(backend)
+        _results.close()
+        _results = backend
+    _enabled = True
+
+
+def enable_cache_from_env():
+    """Call enable_cache() with ``NUM2WORDS_CACHE`` if it is set."""
+    spec = os.environ.get(CACHE_ENV)
+    if spec:
+        enable_cache(backend=spec)
+
+
+def disable_cache():
+    """Stop caching by default; ``cache=True`` calls still use the cache."""
+    global _enabled
+    _enabled = False
+
+
+def cache_enabled():
+    return _enabled
+
+
+def get_backend():
+    """Return the CacheBackend used by num2words()."""
+    return _results
+
+
+def cache_info():
+    """Return the (hits, misses, maxsize, currsize) of the result cache."""
+    return _results.info()
+
+
+def cache_clear():
+    """Empty the result cache and reset its statistics."""
+    _results.clear()
+
+
+@atexit.register
+def _close_backend():
+    _results.close()
+
+
+def get_cached(key, default=None, count_misses=True):
+    return _results.get(key, default, count_misses)
+
+
+def set_cached(key, value):
+    _results.set(key, value)
@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""num2words: convert numbers into words.
+
+Usage:
+    num2words [options] <number>
+    num2words [options] --stdin
+    num2words [options] --format=<format>
+    num2words --list-languages
+    num2words --list-converters
+    num2words serve [--host=<host>] [--port=<port>] [--workers=<n>]
+                    [--preload=<langs>] [--cache-size=<n>]
+    num2words --help
+
+Arguments:
+    <number>                Number you want to convert into words
+
+Options:
+    -L --list-languages     Show all languages.
+    -C --list-converters    Show all converters.
+    -l --lang=<lang>        Output language [default: en].
+    -t --to=<to>            Output converter [default: cardinal].
+    --stdin                 Convert the numbers read from standard input,
+                            one per line.
+    -j --jobs=<n>           With --stdin, convert on <n> worker processes,
+                            0 for one per CPU [default: 1].
+    -f --format=<format>    Format of the standard input: lines, csv or
+                            ndjson [default: lines].
+    --column=<name>         CSV column holding the numbers.
+    --field=<name>          NDJSON field holding the numbers.
+    --into=<name>           Column or field receiving the words, added if
+                            needed; by default the numbers are replaced.
+    --currency=<code>       Currency of the currency converter.
+    -h --help               Show this message.
+    -v --version            Show version.
+
+Examples:
+    $ num2words 10001
+    ten thousand and one
+
+    $ num2words 24,120.10
+    twenty-four thousand, one hundred and twenty point one
+
+    $ num2words 24,120.10 -l es
+    veinticuatro mil ciento veinte punto uno
+
+    $num2words 2.14 -l es --to currency
+    dos euros con catorce centimos
+
+    $ printf '1\\n2\\n' | num2words --stdin -l fr
+    un
+    deux
+
+    $ num2words --stdin --jobs 0 < numbers.txt > words.txt
+
+    $ num2words --format csv --column amount --into words --to currency
+
+    $ num2words serve --port 8080 --preload en,fr
+    $ curl 'localhost:8080/convert?n=42&lang=fr'
+    {"words": "quarante-deux"}
+
+See "num2words serve --help" and num2words.server for the server.
+"""
+
+from __future__ import unicode_literals
+
+import errno
+import os
+import sys
+from collections import deque
+from decimal import InvalidOperation
+
+from . import (CONVERTER_CLASSES, CONVERTES_TYPES, __version__, get_formatter,
+               num2words)
+
+# Short forms of the options
+SHORT_OPTIONS = {
+    '-L': '--list-languages',
+    '-C': '--list-converters',
+    '-l': '--lang',
+    '-t': '--to',
+    '-j': '--jobs',
+    '-f': '--format',
+    '-h': '--help',
+    '-v': '--version',
+}
+
+# Options taking a value, with their defaults
+VALUE_OPTIONS = {
+    '--lang': 'en',
+    '--to': 'cardinal',
+    '--jobs': '1',
+    '--format': 'lines',
+    '--column': None,
+    '--field': None,
+    '--into': None,
+    '--currency': None,
+}
+
+FLAG_OPTIONS = ('--list-languages', '--list-converters', '--stdin',
+                '--help', '--version')
+
+
+class UsageError(ValueError):
+    """Command line not matching the usage."""
+
+
+def parse_args(argv):
+    """Return the options and ``<number>`` of the command line ``argv`` in
+    a dict, as docopt would for the usage above. A negative number is not
+    taken for an option. Raises UsageError."""
+    args = dict(VALUE_OPTIONS, **dict.fromkeys(FLAG_OPTIONS, False))
+    args['<number>'] = None
+    argv = list(argv)
+    given = set()
+    numbers = []
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--' and argv:
+            arg = argv.pop(0)
+        elif arg.startswith('--'):
+            name, sep, value = arg.partition('=')
+            parse_option(args, name, value if sep else None, argv)
+            given.add(name)
+            continue
+        elif arg[:1] == '-' and arg[1:2].isalpha():
+            name = SHORT_OPTIONS.get(arg[:2], arg)
+            parse_option(args, name, arg[2:] or None, argv)
+            given.add(name)
+            continue
+        numbers.append(arg)
+
+    if args['--help'] or args['--version']:
+        return args
+    if len(numbers) > 1:
+        raise UsageError("only one <number> can be converted")
+    if numbers:
+        args['<number>'] = numbers[0]
+    modes = [args['<number>'] is not None,
+             args['--stdin'] or '--format' in given,
+             args['--list-languages'], args['--list-converters']]
+    if sum(modes) != 1:
+        raise UsageError("")
+    return args
+
+
+def parse_option(args, name, value, argv):
+    if name in FLAG_OPTIONS:
+        if value is not None:
+            raise UsageError("{} takes no value".format(name))
+        args[name] = True
+    elif name in VALUE_OPTIONS:
+        if value is None:
+            if not argv:
+                raise UsageError("{} needs a value".format(name))
+            value = argv.pop(0)
+        args[name] = value
+    else:
+        raise UsageError("unknown option {}".format(name))
+
+
+def get_languages():
+    return sorted(list(CONVERTER_CLASSES.keys()))
+
+
+def get_converters():
+    return sorted(list(CONVERTES_TYPES))
+
+
+def numbered_values(lines):
+    """Yield (line number, value) for each non blank line."""
+    for lineno, line in enumerate(lines, 1):
+        value = line.strip()
+        if value:
+            yield lineno, value
+
+
+class StreamError(ValueError):
+    """Error of the input of convert_stream()."""
+
+
+class LinesFormat(object):
+    """One number per line in, one line of words per number out."""
+
+    def __init__(self, stdout, column=None, into=None):
+        self.stdout = stdout
+
+    def entries(self, stdin):
+        """Yield the (line number, record) and the value of each record."""
+        for lineno, value in numbered_values(stdin):
+            yield (lineno, None), value
+
+    def write(self, record, words):
+        if words is not None:
+            self.stdout.write(words + os.linesep)
+
+
+class CsvFormat(object):
+    """CSV with a header row: the words of ``column`` are written to the
+    ``into`` column, which is added if it does not exist yet. By default
+    they replace the numbers. Rows that fail get an empty cell."""
+
+    def __init__(self, stdout, column, into=None):
+        import csv
+        self.column = column
+        self.into = into or column
+        self.writer = csv.writer(stdout, lineterminator=os.linesep)
+
+    def entries(self, stdin):
+        import csv
+        reader = csv.reader(stdin)
+        header = next(reader, None)
+        if header is None:
+            return
+        if self.column not in header:
+            raise StreamError("no column {}".format(self.column))
+        index = header.index(self.column)
+        width = len(header)
+        if self.into in header:
+            self.into_index = header.index(self.into)
+        else:
+            self.into_index = None
+            header = header + [self.into]
+        self.writer.writerow(header)
+        for row in reader:
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+            yield (reader.line_num, row), row[index].strip()
+
+    def write(self, row, words):
+        if words is None:
+            words = ''
+        if self.into_index is None:
+            row.append(words)
+        else:
+            row[self.into_index] = words
+        self.writer.writerow(row)
+
+
+class NdjsonFormat(object):
+    """One JSON object per line: the words of ``field`` are set in the
+    ``into`` field, by default replacing the number. Failed records get
+    null, lines that are not JSON objects are left out."""
+
+    def __init__(self, stdout, field, into=None):
+        self.stdout = stdout
+        self.field = field
+        self.into = into or field
+
+    def entries(self, stdin):
+        import json
+        for lineno, line in numbered_values(stdin):
+            try:
+                record = json.loads(line)
+                value = record[self.field]
+            except KeyError:
+                value = StreamError("no field {}".format(self.field))
+            except (ValueError, TypeError):
+                record = None
+                value = StreamError("not a JSON object")
+            else:
+                # numbers are read like on the command line
+                if isinstance(value, bool) or value is None:
+                    value = json.dumps(value)
+                elif not isinstance(value, str):
+                    value = str(value)
+            yield (lineno, record), value
+
+    def write(self, record, words):
+        import json
+        if record is not None:
+            record[self.into] = words
+            self.stdout.write(json.dumps(record, ensure_ascii=False) +
+                              os.linesep)
+
+
+FORMATS = {'lines': LinesFormat, 'csv': CsvFormat, 'ndjson': NdjsonFormat}
+
+
+def convert_entries(entries, convert):
+    """Yield (key, value, words, error) for each (key, value) of
+    ``entries``, words being None when the conversion failed. Blank values
+    give empty words, StreamError values are errors of the input."""
+    for key, value in entries:
+        if isinstance(value, StreamError):
+            yield key, value, None, value
+            continue
+        if not value:
+            yield key, value, '', None
+            continue
+        try:
+            yield key, value, convert(value), None
+        except Exception as err:
+            yield key, value, None, err
+
+
+def convert_entries_parallel(entries, convert, lang, to, options, jobs):
+    """Like convert_entries(), spreading chunks of values over ``jobs``
+    worker processes (one per CPU for 0). Results keep the input order."""
+    from .parallel import ParallelConverter
+
+    # entries sent to the workers and not yet written
+    pending = deque()
+
+    def values():
+        for entry in entries:
+            pending.append(entry)
+            value = entry[1]
+            yield '' if isinstance(value, StreamError) else value
+
+    with ParallelConverter([lang], jobs or None) as pool:
+        for words in pool.imap(values(), lang=lang, to=to,
+                               errors='replace', **options):
+            key, value = pending.popleft()
+            if isinstance(value, StreamError):
+                yield key, value, None, value
+            elif words is not None or not value:
+                yield key, value, words or '', None
+            else:
+                # convert the failed value again to get its error
+                try:
+                    yield key, value, convert(value), None
+                except Exception as err:
+                    yield key, value, None, err
+
+
+def convert_stream(lang, to, options=None, jobs=1, fmt='lines',
+                   column=None, into=None, stdin=None, stdout=None,
+                   stderr=None):
+    """Convert the numbers of ``stdin`` in the ``fmt`` format (see
+    FORMATS) with a converter resolved once. Failures are reported on
+    ``stderr`` with their line number and do not stop the stream; returns
+    the exit status."""
+    options = options or {}
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    if fmt not in FORMATS:
+        stderr.write("unknown format: {}{}".format(fmt, os.linesep))
+        return 1
+    if fmt != 'lines' and not column:
+        stderr.write("--format {} needs --column or --field{}".format(
+            fmt, os.linesep))
+        return 1
+    try:
+        convert = get_formatter(lang, to, **options)
+    except Exception as err:
+        stderr.write(error_message(err, lang=lang, to=to) + os.linesep)
+        return 1
+    records = FORMATS[fmt](stdout, column, into)
+    entries = records.entries(stdin)
+    if jobs == 1:
+        results = convert_entries(entries, convert)
+    elif sys.version_info < (3, 7):
+        stderr.write("--jobs needs Python 3.7 or later" + os.linesep)
+        return 1
+    else:
+        results = convert_entries_parallel(entries, convert, lang, to,
+                                           options, jobs)
+    status = 0
+    try:
+        for (lineno, record), value, words, err in results:
+            if isinstance(err, StreamError):
+                status = 1
+                stderr.write("line {}: {}{}".format(lineno, err, os.linesep))
+            elif err is not None:
+                status = 1
+                stderr.write("line {}: {}: {}{}".format(
+                    lineno, value, error_message(err), os.linesep))
+            records.write(record, words)
+        stdout.flush()
+    except StreamError as err:
+        stderr.write(str(err) + os.linesep)
+        return 1
+    except IOError as err:
+        if err.errno != errno.EPIPE:
+            raise
+        # the reader went away (e.g. "| head"), stop quietly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stdout.fileno())
+    return status
+
+
+def error_message(err, lang=None, to=None):
+    if isinstance(err, NotImplementedError) and lang is not None and \
+            not str(err):
+        return "unsupported language or converter: {} {}".format(lang, to)
+    if isinstance(err, InvalidOperation):
+        return "not a number"
+    return str(err) or type(err).__name__
+
+
+def usage():
+    """Return the usage section of the help."""
+    return __doc__[__doc__.index('Usage:'):].split('\n\n')[0]
+
+
+def main(argv=None):
+    """Run the command line tool on ``argv`` (``sys.argv[1:]`` by default)
+    and return its exit status."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['serve']:
+        if sys.version_info < (3, 7):
+            sys.stderr.write("serve needs Python 3.7 or later" + os.linesep)
+            return 1
+        from .server import main as serve
+        return serve(argv[1:])
+    try:
+        args = parse_args(argv)
+    except UsageError as err:
+        sys.stderr.write(usage() + os.linesep)
+        if str(err):
+            sys.stderr.write(os.linesep + str(err) + os.linesep)
+        return 1
+    if args['--help']:
+        sys.stdout.write(__doc__)
+        return 0
+    if args['--version']:
+        sys.stdout.write('num2words=={}{}'.format(__version__, os.linesep))
+        return 0
+    if args["--list-languages"]:
+        for lang in get_languages():
+            sys.stdout.write(lang)
+            sys.stdout.write(os.linesep)
+        return 0
+    if args["--list-converters"]:
+        for lang in get_converters():
+            sys.stdout.write(lang)
+            sys.stdout.write(os.linesep)
+        return 0
+    options = {}
+    if args['--currency']:
+        options['currency'] = args['--currency']
+    if args['<number>'] is None:
+        try:
+            jobs = int(args['--jobs'])
+            if jobs < 0:
+                raise ValueError()
+        except ValueError:
+            sys.stderr.write("--jobs must be a positive number or 0, "
+                             "not {}{}".format(args['--jobs'], os.linesep))
+            return 1
+        return convert_stream(
+            args['--lang'], args['--to'], options, jobs, args['--format'],
+            args['--column'] or args['--field'], args['--into'])
+    try:
+        words = num2words(args['<number>'], lang=args['--lang'],
+                          to=args['--to'], **options)
+        sys.stdout.write(words + os.linesep)
+        return 0
+    except Exception as err:
+        sys.stderr.write(str(args['<number>']))
+        sys.stderr.write(str(err) + os.linesep)
+        sys.stderr.write(__doc__)
+        return 1
@@ -15,6 +15,25 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA 02110-1301 USA
 
+import sys
+
+try:
+    from collections.abc import MutableMapping  # noqa: F401
+except ImportError:
+    from collections import MutableMapping  # noqa: F401
+
+
+def getargspec(func):
+    # inspect is slow to import and only needed to bind converters
+    import inspect
+    # see through functools.wraps() wrappers, e.g. num2words.instrument's
+    while hasattr(func, '__wrapped__'):
+        func = func.__wrapped__
+    try:
+        return inspect.getfullargspec(func)
+    except AttributeError:
+        return inspect.getargspec(func)
+
 
 try:
     strtype = basestring
@@ -22,8 +41,17 @@ except NameError:
     strtype = str
 
 
-def to_s(val):
-    try:
-        return unicode(val)
-    except NameError:
-        return str(val)
+try:
+    to_s = unicode
+except NameError:
+    to_s = str
+
+
+try:
+    intern = sys.intern
+except AttributeError:
+    # The Python 2 builtin only interns byte strings
+    _interned = {}
+
+    def intern(text):
+        return _interned.setdefault(text, text)
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Opt-in instrumentation of the conversions.
+
+enable() replaces num2words.num2words(), the ``to_*`` methods of the
+converter classes and the result cache lookup with timing wrappers, and
+disable() puts the originals back: nothing is checked on the hot path
+while instrumentation is off. Converter classes loaded after enable()
+are wrapped when the registry loads them.
+
+Recorded per language and converter type (``to``):
+
+* calls and a latency histogram of num2words() and of the ``to_*``
+  methods (only the outermost call, e.g. not the to_cardinal() done by
+  to_currency());
+* the magnitude of the inputs (number of integer digits);
+* result cache hits and misses.
+
+snapshot() returns them as a dict, to_prometheus() in the Prometheus text
+exposition format.
+"""
+
+from __future__ import unicode_literals
+
+import functools
+import threading
+import time
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (1e-05, 2.5e-05, 5e-05, 0.0001, 0.00025, 0.0005, 0.001,
+                   0.0025, 0.005, 0.01, 0.1, 1.0)
+
+# Upper bounds, in integer digits, of the input magnitude buckets
+MAGNITUDE_BUCKETS = (1, 3, 6, 9, 12, 30)
+
+timer = getattr(time, 'perf_counter', time.time)
+
+_lock = threading.Lock()
+_local = threading.local()
+_patches = []
+_langs = {}
+
+
+class Histogram(object):
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        i = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self):
+        cumulative, total = [], 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return {'count': self.count, 'sum': self.sum, 'buckets': cumulative}
+
+
+def _new_stats():
+    return {
+        'calls': defaultdict(lambda: Histogram(LATENCY_BUCKETS)),
+        'methods': defaultdict(lambda: Histogram(LATENCY_BUCKETS)),
+        'magnitudes': defaultdict(int),
+        'errors': defaultdict(int),
+        'cache': defaultdict(int),
+    }
+
+
+_stats = _new_stats()
+
+
+def magnitude(value):
+    """Return the label of the magnitude bucket of ``value``."""
+    try:
+        digits = len(str(abs(int(Decimal(str(value))))))
+    except (ValueError, TypeError, ArithmeticError, InvalidOperation):
+        return 'nan'
+    for bound in MAGNITUDE_BUCKETS:
+        if digits <= bound:
+            return '%d' % bound
+    return '+Inf'
+
+
+def _lang_of(converter):
+    cls = type(converter)
+    try:
+        return _langs[cls]
+    except KeyError:
+        pass
+    from . import CONVERTER_CLASSES
+
+    lang = cls.__name__
+    for code in CONVERTER_CLASSES:
+        path = CONVERTER_CLASSES.path(code)
+        if path is None:
+            if CONVERTER_CLASSES[code] is converter:
+                lang = code
+                break
+        elif path.rsplit('.', 1)[1] == cls.__name__:
+            lang = code
+            break
+    _langs[cls] = lang
+    return lang
+
+
+def _lang_label(lang):
+    from . import CONVERTER_CLASSES
+
+    return CONVERTER_CLASSES.resolve(lang) or 'unknown'
+
+
+def _wrap_num2words(func):
+    @functools.wraps(func)
+    def num2words(number, ordinal=False, lang='en', to='cardinal',
+                  *args, **kwargs):
+        failed = True
+        start = timer()
+        try:
+            result = func(number, ordinal, lang, to, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = timer() - start
+            key = (_lang_label(lang), 'ordinal' if ordinal else to)
+            bucket = magnitude(number)
+            with _lock:
+                _stats['calls'][key].observe(elapsed)
+                _stats['magnitudes'][key + (bucket,)] += 1
+                if failed:
+                    _stats['errors'][key] += 1
+    return num2words
+
+
+def _wrap_method(func, to):
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        if getattr(_local, 'depth', 0):
+            return func(self, *args, **kwargs)
+        _local.depth = 1
+        start = timer()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            elapsed = timer() - start
+            _local.depth = 0
+            key = (_lang_of(self), to)
+            with _lock:
+                _stats['methods'][key].observe(elapsed)
+    return method
+
+
+def _wrap_get_cached(func):
+    @functools.wraps(func)
+    def get_cached(key, default=None, count_misses=True):
+        result = func(key, default, count_misses)
+        if result is not default:
+            outcome = 'hit'
+        elif count_misses:
+            outcome = 'miss'
+        else:
+            return result
+        stat = (_lang_of(key[0]), key[1], outcome)
+        with _lock:
+            _stats['cache'][stat] += 1
+        return result
+    return get_cached
+
+
+def _wrap_load(func):
+    def load(path):
+        converter = func(path)
+        with _lock:
+            if _patches:
+                _instrument_class(type(converter))
+        return converter
+    return load
+
+
+def _patch(owner, name, wrapper):
+    original = owner.__dict__[name]
+    setattr(owner, name, wrapper)
+    _patches.append((owner, name, original))
+
+
+def _instrument_class(cls):
+    from . import CONVERTES_TYPES
+
+    for klass in cls.__mro__:
+        if klass is object or getattr(klass, '_instrumented', None) is klass:
+            continue
+        for to in CONVERTES_TYPES:
+            name = 'to_%s' % to
+            if name in klass.__dict__:
+                _patch(klass, name, _wrap_method(klass.__dict__[name], to))
+        _patch_attribute(klass, '_instrumented', klass)
+
+
+def _patch_attribute(owner, name, value):
+    original = owner.__dict__.get(name, _MISSING)
+    setattr(owner, name, value)
+    _patches.append((owner, name, original))
+
+
+_MISSING = object()
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        for klass in _subclasses(subclass):
+            yield klass
+
+
+def enabled():
+    return bool(_patches)
+
+
+def enable():
+    """Start recording. Does nothing if already enabled."""
+    import num2words as package
+
+    from . import CONVERTER_CLASSES, cache
+    from .base import Num2Word_Base
+
+    with _lock:
+        if _patches:
+            return
+        _patch(package, 'num2words', _wrap_num2words(package.num2words))
+        _patch(cache, 'get_cached', _wrap_get_cached(cache.get_cached))
+        _patch_attribute(CONVERTER_CLASSES, '_load',
+                         _wrap_load(CONVERTER_CLASSES._load))
+        for cls in [Num2Word_Base] + list(_subclasses(Num2Word_Base)):
+            _instrument_class(cls)
+        for lang in CONVERTER_CLASSES:
+            if CONVERTER_CLASSES.is_loaded(lang):
+                _instrument_class(type(CONVERTER_CLASSES[lang]))
+
+
+def disable():
+    """Stop recording and restore the original functions. The recorded
+    data is kept, see reset()."""
+    with _lock:
+        while _patches:
+            owner, name, original = _patches.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+
+def reset():
+    """Forget the recorded data."""
+    global _stats
+    with _lock:
+        _stats = _new_stats()
+
+
+def snapshot():
+    """Return the recorded data as a dict of plain values::
+
+        {'num2words': {'en': {'cardinal': {'count': ..., 'sum': ...,
+                                           'buckets': [(1e-05, n), ...]}}},
+         'methods': {...same, per to_* method...},
+         'magnitudes': {'en': {'cardinal': {'3': n, '6': n...}}},
+         'errors': {'en': {'cardinal': n}},
+         'cache': {'en': {'cardinal': {'hit': n, 'miss': n}}}}
+    """
+    result = dict((name, {}) for name in ('num2words', 'methods',
+                                          'magnitudes', 'errors', 'cache'))
+    with _lock:
+        for name, source in (('num2words', 'calls'), ('methods', 'methods')):
+            for (lang, to), histogram in _stats[source].items():
+                result[name].setdefault(lang, {})[to] = histogram.as_dict()
+        for (lang, to, bucket), count in _stats['magnitudes'].items():
+            result['magnitudes'].setdefault(lang, {}).setdefault(
+                to, {})[bucket] = count
+        for (lang, to), count in _stats['errors'].items():
+            result['errors'].setdefault(lang, {})[to] = count
+        for (lang, to, outcome), count in _stats['cache'].items():
+            result['cache'].setdefault(lang, {}).setdefault(
+                to, {})[outcome] = count
+    return result
+
+
+def _labels(**labels):
+    return ','.join('%s="%s"' % (name, str(value).replace('"', '\\"'))
+                    for name, value in sorted(labels.items()))
+
+
+def to_prometheus():
+    """Return the recorded data in the Prometheus text format."""
+    data = snapshot()
+    lines = []
+    for name, key, label in (('num2words_call', 'num2words', 'to'),
+                             ('num2words_converter', 'methods', 'to')):
+        metric = '%s_duration_seconds' % name
+        lines.append('# TYPE %s histogram' % metric)
+        for lang, per_to in sorted(data[key].items()):
+            for to, histogram in sorted(per_to.items()):
+                for bound, count in histogram['buckets']:
+                    lines.append('%s_bucket{%s} %d' % (metric, _labels(
+                        lang=lang, le=bound, **{label: to}), count))
+                labels = _labels(lang=lang, **{label: to})
+                lines.append('%s_sum{%s} %r' % (metric, labels,
+                                                histogram['sum']))
+                lines.append('%s_count{%s} %d' % (metric, labels,
+                                                  histogram['count']))
+    for metric, key, extra in (
+            ('num2words_input_magnitude_total', 'magnitudes', 'digits'),
+            ('num2words_cache_requests_total', 'cache', 'result')):
+        lines.append('# TYPE %s counter' % metric)
+        for lang, per_to in sorted(data[key].items()):
+            for to, counts in sorted(per_to.items()):
+                for value, count in sorted(counts.items()):
+                    lines.append('%s{%s} %d' % (metric, _labels(
+                        lang=lang, to=to, **{extra: value}), count))
+    lines.append('# TYPE num2words_errors_total counter')
+    for lang, per_to in sorted(data['errors'].items()):
+        for to, count in sorted(per_to.items()):
+            lines.append('num2words_errors_total{%s} %d' % (
+                _labels(lang=lang, to=to), count))
+    return '\n'.join(lines) + '\n'
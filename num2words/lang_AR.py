@@ -18,6 +18,7 @@
 # MA 02110-1301 USA
 
 import re
+from collections import namedtuple
 from decimal import Decimal
 from math import floor
 
@@ -28,6 +29,8 @@ CURRENCY_EGP = [("جنيه", "جنيهان", "جنيهات", "جنيهاً"),
 CURRENCY_KWD = [("دينار", "ديناران", "دينارات", "ديناراً"),
                 ("فلس", "فلسان", "فلس", "فلس")]
 
+NO_CURRENCY = ('', '', '', '')
+
 ARABIC_ONES = [
     "", "واحد", "اثنان", "ثلاثة", "أربعة", "خمسة", "ستة", "سبعة", "ثمانية",
     "تسعة",
@@ -37,22 +40,21 @@ ARABIC_ONES = [
 ]
 
 
+# Per-call settings, passed along instead of being stored on the converter
+# so that a single instance can be shared between threads.
+ArabicFormat = namedtuple(
+    "ArabicFormat",
+    "currency_unit currency_subunit separator prefix suffix "
+    "is_currency_name_feminine")
+
+
 class Num2Word_AR(object):
     errmsg_too_big = "Too large"
     max_num = 10 ** 36
 
     def __init__(self):
-        self.number = 0
-        self.arabicPrefixText = ""
-        self.arabicSuffixText = ""
-        self.integer_value = 0
-        self._decimalValue = ""
         self.partPrecision = 2
-        self.currency_unit = CURRENCY_SR[0]
-        self.currency_subunit = CURRENCY_SR[1]
         self.isCurrencyPartNameFeminine = True
-        self.isCurrencyNameFeminine = False
-        self.separator = 'و'
 
         self.arabicOnes = ARABIC_ONES
         self.arabicFeminineOnes = [
@@ -96,20 +98,15 @@ class Num2Word_AR(object):
             "كوينتليونات", "سكستيليونات"
         ]
 
-    def number_to_arabic(self, arabic_prefix_text, arabic_suffix_text):
-        self.arabicPrefixText = arabic_prefix_text
-        self.arabicSuffixText = arabic_suffix_text
-        self.extract_integer_and_decimal_parts()
-
-    def extract_integer_and_decimal_parts(self):
-        re.split('\\.', str(self.number))
-        splits = re.split('\\.', str(self.number))
+    def extract_integer_and_decimal_parts(self, number):
+        splits = re.split('\\.', str(number))
 
-        self.integer_value = int(splits[0])
+        integer_value = int(splits[0])
         if len(splits) > 1:
-            self._decimalValue = int(self.decimal_value(splits[1]))
+            decimal_value = int(self.decimal_value(splits[1]))
         else:
-            self._decimalValue = 0
+            decimal_value = 0
+        return integer_value, decimal_value
 
     def decimal_value(self, decimal_part):
 
@@ -133,14 +130,15 @@ class Num2Word_AR(object):
             result += '0'
         return result
 
-    def digit_feminine_status(self, digit, group_level):
+    def digit_feminine_status(self, digit, group_level,
+                              is_currency_name_feminine=False):
         if group_level == -1:
             if self.isCurrencyPartNameFeminine:
                 return self.arabicFeminineOnes[int(digit)]
             else:
                 return self.arabicOnes[int(digit)]
         elif group_level == 0:
-            if self.isCurrencyNameFeminine:
+            if is_currency_name_feminine:
                 return self.arabicFeminineOnes[int(digit)]
             else:
                 return self.arabicOnes[int(digit)]
@@ -149,7 +147,8 @@ class Num2Word_AR(object):
             return self.arabicOnes[int(digit)]
 
     def process_arabic_group(self, group_number, group_level,
-                             remaining_number):
+                             remaining_number, integer_value=0,
+                             is_currency_name_feminine=False):
         tens = Decimal(group_number) % Decimal(100)
         hundreds = Decimal(group_number) / Decimal(100)
         ret_val = ""
@@ -163,9 +162,9 @@ class Num2Word_AR(object):
         if tens > 0:
             if tens < 20:
                 if tens == 2 and int(hundreds) == 0 and group_level > 0:
-                    if self.integer_value in [2000, 2000000, 2000000000,
-                                              2000000000000, 2000000000000000,
-                                              2000000000000000000]:
+                    if integer_value in [2000, 2000000, 2000000000,
+                                         2000000000000, 2000000000000000,
+                                         2000000000000000000]:
                         ret_val = "{}".format(
                             self.arabicAppendedTwos[int(group_level)])
                     else:
@@ -182,8 +181,8 @@ class Num2Word_AR(object):
                             hundreds == 0 and remaining_number == 0:
                         ret_val += ""
                     else:
-                        ret_val += self.digit_feminine_status(int(tens),
-                                                              group_level)
+                        ret_val += self.digit_feminine_status(
+                            int(tens), group_level, is_currency_name_feminine)
             else:
                 ones = tens % 10
                 tens = (tens / 10) - 2
@@ -191,7 +190,8 @@ class Num2Word_AR(object):
                     if ret_val != "" and tens < 4:
                         ret_val += " و "
 
-                    ret_val += self.digit_feminine_status(ones, group_level)
+                    ret_val += self.digit_feminine_status(
+                        ones, group_level, is_currency_name_feminine)
                 if ret_val != "" and ones != 0:
                     ret_val += " و "
 
@@ -199,18 +199,20 @@ class Num2Word_AR(object):
 
         return ret_val
 
-    def convert(self, value):
-        self.number = "{:.9f}".format(value)
-        self.number_to_arabic(self.arabicPrefixText, self.arabicSuffixText)
-        return self.convert_to_arabic()
+    def convert(self, value, fmt):
+        number = "{:.9f}".format(value)
+        integer_value, decimal_value = \
+            self.extract_integer_and_decimal_parts(number)
+        return self.convert_to_arabic(number, integer_value, decimal_value,
+                                      fmt)
 
-    def convert_to_arabic(self):
-        temp_number = Decimal(self.number)
+    def convert_to_arabic(self, number, integer_value, decimal_value, fmt):
+        temp_number = Decimal(number)
 
         if temp_number == Decimal(0):
             return "صفر"
 
-        decimal_string = self.process_arabic_group(self._decimalValue,
+        decimal_string = self.process_arabic_group(decimal_value,
                                                    -1,
                                                    Decimal(0))
         ret_val = ""
@@ -225,7 +227,9 @@ class Num2Word_AR(object):
             group_description = \
                 self.process_arabic_group(number_to_process,
                                           group,
-                                          Decimal(floor(temp_number)))
+                                          Decimal(floor(temp_number)),
+                                          integer_value,
+                                          fmt.is_currency_name_feminine)
             if group_description != '':
                 if group > 0:
                     if ret_val != "":
@@ -250,46 +254,46 @@ class Num2Word_AR(object):
                 ret_val = "{} {}".format(group_description, ret_val)
             group += 1
         formatted_number = ""
-        if self.arabicPrefixText != "":
-            formatted_number += "{} ".format(self.arabicPrefixText)
+        if fmt.prefix != "":
+            formatted_number += "{} ".format(fmt.prefix)
         formatted_number += ret_val
-        if self.integer_value != 0:
-            remaining100 = int(self.integer_value % 100)
+        if integer_value != 0:
+            remaining100 = int(integer_value % 100)
 
             if remaining100 == 0:
-                formatted_number += self.currency_unit[0]
+                formatted_number += fmt.currency_unit[0]
             elif remaining100 == 1:
-                formatted_number += self.currency_unit[0]
+                formatted_number += fmt.currency_unit[0]
             elif remaining100 == 2:
-                if self.integer_value == 2:
-                    formatted_number += self.currency_unit[1]
+                if integer_value == 2:
+                    formatted_number += fmt.currency_unit[1]
                 else:
-                    formatted_number += self.currency_unit[0]
+                    formatted_number += fmt.currency_unit[0]
             elif 3 <= remaining100 <= 10:
-                formatted_number += self.currency_unit[2]
+                formatted_number += fmt.currency_unit[2]
             elif 11 <= remaining100 <= 99:
-                formatted_number += self.currency_unit[3]
-        if self._decimalValue != 0:
-            formatted_number += " {} ".format(self.separator)
+                formatted_number += fmt.currency_unit[3]
+        if decimal_value != 0:
+            formatted_number += " {} ".format(fmt.separator)
             formatted_number += decimal_string
 
-        if self._decimalValue != 0:
+        if decimal_value != 0:
             formatted_number += " "
-            remaining100 = int(self._decimalValue % 100)
+            remaining100 = int(decimal_value % 100)
 
             if remaining100 == 0:
-                formatted_number += self.currency_subunit[0]
+                formatted_number += fmt.currency_subunit[0]
             elif remaining100 == 1:
-                formatted_number += self.currency_subunit[0]
+                formatted_number += fmt.currency_subunit[0]
             elif remaining100 == 2:
-                formatted_number += self.currency_subunit[1]
+                formatted_number += fmt.currency_subunit[1]
             elif 3 <= remaining100 <= 10:
-                formatted_number += self.currency_subunit[2]
+                formatted_number += fmt.currency_subunit[2]
             elif 11 <= remaining100 <= 99:
-                formatted_number += self.currency_subunit[3]
+                formatted_number += fmt.currency_subunit[3]
 
-        if self.arabicSuffixText != "":
-            formatted_number += " {}".format(self.arabicSuffixText)
+        if fmt.suffix != "":
+            formatted_number += " {}".format(fmt.suffix)
 
         return formatted_number
 
@@ -298,38 +302,25 @@ class Num2Word_AR(object):
             raise OverflowError(self.errmsg_too_big)
         return number
 
-    def set_currency_prefer(self, currency):
+    def get_currency_forms(self, currency):
         if currency == 'EGP':
-            self.currency_unit = CURRENCY_EGP[0]
-            self.currency_subunit = CURRENCY_EGP[1]
+            return CURRENCY_EGP
         elif currency == 'KWD':
-            self.currency_unit = CURRENCY_KWD[0]
-            self.currency_subunit = CURRENCY_KWD[1]
-        else:
-            self.currency_unit = CURRENCY_SR[0]
-            self.currency_subunit = CURRENCY_SR[1]
+            return CURRENCY_KWD
+        return CURRENCY_SR
 
     def to_currency(self, value, currency='SR', prefix='', suffix=''):
-        self.set_currency_prefer(currency)
-        self.isCurrencyNameFeminine = False
-        self.separator = "و"
-        self.arabicOnes = ARABIC_ONES
-        self.arabicPrefixText = prefix
-        self.arabicSuffixText = suffix
-        return self.convert(value=value)
+        currency_unit, currency_subunit = self.get_currency_forms(currency)
+        fmt = ArabicFormat(currency_unit, currency_subunit, "و", prefix,
+                           suffix, False)
+        return self.convert(value, fmt)
 
     def to_ordinal(self, number, prefix=''):
         if number <= 19:
             return "{}".format(self.arabicOrdinal[number])
-        if number < 100:
-            self.isCurrencyNameFeminine = True
-        else:
-            self.isCurrencyNameFeminine = False
-        self.currency_subunit = ('', '', '', '')
-        self.currency_unit = ('', '', '', '')
-        self.arabicPrefixText = prefix
-        self.arabicSuffixText = ""
-        return "{}".format(self.convert(abs(number)).strip())
+        fmt = ArabicFormat(NO_CURRENCY, NO_CURRENCY, "و", prefix, "",
+                           number < 100)
+        return "{}".format(self.convert(abs(number), fmt).strip())
 
     def to_year(self, value):
         value = self.validate_number(value)
@@ -343,10 +334,5 @@ class Num2Word_AR(object):
         minus = ''
         if number < 0:
             minus = 'سالب '
-        self.separator = ','
-        self.currency_subunit = ('', '', '', '')
-        self.currency_unit = ('', '', '', '')
-        self.arabicPrefixText = ""
-        self.arabicSuffixText = ""
-        self.arabicOnes = ARABIC_ONES
-        return minus + self.convert(value=abs(number)).strip()
+        fmt = ArabicFormat(NO_CURRENCY, NO_CURRENCY, ',', "", "", False)
+        return minus + self.convert(abs(number), fmt).strip()
@@ -128,6 +128,10 @@ class Num2Word_DE(Num2Word_EU):
         # Exception: "hundertste" is usually preferred over "einhundertste"
         if res == "eintausendste" or res == "einhundertste":
             res = res.replace("ein", "", 1)
+        # The patterns below only match the last two words, keep the
+        # rest of a long number out of them
+        cut = max(res.rfind(" ", 0, res.rfind(" ")), 0)
+        head, res = res[:cut], res[cut:]
         # ... similarly for "millionste" etc.
         res = re.sub(r'eine ([a-z]+(illion|illiard)ste)$',
                      lambda m: m.group(1), res)
@@ -136,7 +140,7 @@ class Num2Word_DE(Num2Word_EU):
         res = re.sub(r' ([a-z]+(illion|illiard)ste)$',
                      lambda m: m.group(1), res)
 
-        return res
+        return head + res
 
     def to_ordinal_num(self, value):
         self.verify_ordinal(value)
@@ -62,7 +62,7 @@ class Num2Word_DK(lang_EU.Num2Word_EU):
                      "nitten": "nitt",
                      "tyve": "tyv"}
 
-    def merge(self, curr, next):
+    def merge(self, curr, next, ordflag=False):
         ctext, cnum, ntext, nnum = curr + next
         if next[1] == 100 or next[1] == 1000:
             lst = list(next)
@@ -70,7 +70,7 @@ class Num2Word_DK(lang_EU.Num2Word_EU):
             next = tuple(lst)
 
         if cnum == 1:
-            if nnum < 10 ** 6 or self.ordflag:
+            if nnum < 10 ** 6 or ordflag:
                 return next
             ctext = "en"
         if nnum > cnum:
@@ -94,9 +94,7 @@ class Num2Word_DK(lang_EU.Num2Word_EU):
 
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        self.ordflag = True
-        outword = self.to_cardinal(value)
-        self.ordflag = False
+        outword = self._int_to_cardinal(value, True)
         for key in self.ords:
             if outword.endswith(key):
                 outword = outword[:len(outword) - len(key)] + self.ords[key]
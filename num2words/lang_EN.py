@@ -70,8 +70,8 @@ class Num2Word_EN(lang_EU.Num2Word_EU):
 
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        outwords = self.to_cardinal(value).split(" ")
-        lastwords = outwords[-1].split("-")
+        outwords = self.to_cardinal(value).rsplit(" ", 1)
+        lastwords = outwords[-1].rsplit("-", 1)
         lastword = lastwords[-1].lower()
         try:
             lastword = self.ords[lastword]
@@ -18,8 +18,10 @@
 from __future__ import division, print_function, unicode_literals
 
 from collections import OrderedDict
+from functools import partial
 
 from . import lang_EU
+from .base import compact_cards
 
 GENERIC_CENTS = ('sentti', 'senttiä')
 GENERIC_CENTAVOS = ('centavo', 'centavoa')
@@ -456,6 +458,7 @@ class Num2Word_FI(lang_EU.Num2Word_EU):
     def __init__(self):
         self.ords = OrderedDict()
         super(Num2Word_FI, self).__init__()
+        self.ords = compact_cards(self.ords)
 
     def set_numwords(self):
         self.set_high_numwords(self.high_numwords)
@@ -635,13 +638,25 @@ class Num2Word_FI(lang_EU.Num2Word_EU):
             ltext = inflect(ltext, options)
             return (fmt % (ltext, rtext), lnum * rnum)
 
+    def bind(self, to, **options):
+        convert = super(Num2Word_FI, self).bind(to, **options)
+        if to not in ('cardinal', 'ordinal'):
+            return convert
+        # Resolve the case name and build the Options once
+        options = Options(
+            to == 'ordinal', NAME_TO_CASE[options.get('case', 'nominative')],
+            options.get('plural', False), options.get('prefer'))
+        return partial(getattr(self, '_to_%s' % to), options=options)
+
     def to_cardinal(self, value, case='nominative', plural=False, prefer=None):
         case = NAME_TO_CASE[case]
-        options = Options(False, case, plural, prefer)
+        return self._to_cardinal(value, Options(False, case, plural, prefer))
+
+    def _to_cardinal(self, value, options):
         try:
             assert int(value) == value
         except (ValueError, TypeError, AssertionError):
-            if case != NOM:
+            if options.case != NOM:
                 raise NotImplementedError(
                     "Cases other than nominative are not implemented for "
                     "cardinal floating point numbers.")
@@ -655,20 +670,23 @@ class Num2Word_FI(lang_EU.Num2Word_EU):
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value, options)
-        words, num = self.clean(val, options)
+        words, num = self.spell_int(
+            value, self.ords if options.ordinal else self.cards,
+            args=(options,))
         return self.title(out + words)
 
     def to_ordinal(self, value, case='nominative', plural=False, prefer=None):
         case = NAME_TO_CASE[case]
-        options = Options(True, case, plural, prefer)
+        return self._to_ordinal(value, Options(True, case, plural, prefer))
 
+    def _to_ordinal(self, value, options):
         self.verify_ordinal(value)
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value, options)
-        words, num = self.clean(val, options)
+        words, num = self.spell_int(
+            value, self.ords if options.ordinal else self.cards,
+            args=(options,))
         return self.title(words)
 
     def to_ordinal_num(self, value, case='nominative', plural=False):
@@ -690,47 +708,26 @@ class Num2Word_FI(lang_EU.Num2Word_EU):
 
     def splitnum(self, value, options):
         elems = self.ords if options.ordinal else self.cards
-        for elem in elems:
-            if elem > value:
-                continue
+        elem = self.find_card(value, elems)
+        if elem is None:
+            return None
 
-            out = []
-            if value == 0:
-                div, mod = 1, 0
-            else:
-                div, mod = divmod(value, elem)
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
 
-            if div == 1:
-                out.append((elems[1], 1))
-            else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(div * elems[elem], div*elem)]
-                out.append(self.splitnum(div, options))
-
-            out.append((elems[elem], elem))
-
-            if mod:
-                out.append(self.splitnum(mod, options))
-
-            return out
-
-    def clean(self, val, options):
-        out = val
-        while len(val) != 1:
-            out = []
-            left, right = val[:2]
-            if isinstance(left, tuple) and isinstance(right, tuple):
-                out.append(self.merge(left, right, options))
-                if val[2:]:
-                    out.append(val[2:])
-            else:
-                for elem in val:
-                    if isinstance(elem, list):
-                        if len(elem) == 1:
-                            out.append(elem[0])
-                        else:
-                            out.append(self.clean(elem, options))
-                    else:
-                        out.append(elem)
-            val = out
-        return out[0]
+        if div == 1:
+            out.append((elems[1], 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(div * elems[elem], div*elem)]
+            out.append(self.splitnum(div, options))
+
+        out.append((elems[elem], elem))
+
+        if mod:
+            out.append(self.splitnum(mod, options))
+
+        return out
@@ -17,6 +17,8 @@
 
 from __future__ import division, print_function, unicode_literals
 
+from decimal import Decimal
+
 from .base import Num2Word_Base
 from .compat import strtype, to_s
 from .currency import parse_currency_parts, prefix_currency
@@ -342,6 +344,7 @@ class Num2Word_JA(Num2Word_Base):
     CURRENCY_FORMS = {
         'JPY': (('円', 'えん'), ()),
     }
+    CARDINAL_TABLE_SIZE = 10000
 
     def set_high_numwords(self, high):
         max = 4 * len(high)
@@ -520,38 +523,46 @@ class Num2Word_JA(Num2Word_Base):
         )
 
     def splitnum(self, value, reading, prefer):
-        for elem in self.cards:
-            if elem > value:
-                continue
+        elem = self.find_card(value)
+        if elem is None:
+            return None
 
-            out = []
-            if value == 0:
-                div, mod = 1, 0
-            else:
-                div, mod = divmod(value, elem)
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
 
-            if div == 1:
-                out.append((select_text(self.cards[1], reading, prefer), 1))
-            else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(
-                        div * select_text(self.cards[elem], reading, prefer),
-                        div * elem)]
-                out.append(self.splitnum(div, reading, prefer))
+        if div == 1:
+            out.append((select_text(self.cards[1], reading, prefer), 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(
+                    div * select_text(self.cards[elem], reading, prefer),
+                    div * elem)]
+            out.append(self.splitnum(div, reading, prefer))
 
-            out.append((select_text(self.cards[elem], reading, prefer), elem))
+        out.append((select_text(self.cards[elem], reading, prefer), elem))
 
-            if mod:
-                out.append(self.splitnum(mod, reading, prefer))
+        if mod:
+            out.append(self.splitnum(mod, reading, prefer))
 
-            return out
+        return out
 
-    def to_cardinal(self, value, reading=False, prefer=None):
+    def to_cardinal(self, value, reading=False, prefer=None,
+                    trailing_zeros=False):
         try:
             assert int(value) == value
         except (ValueError, TypeError, AssertionError):
             return self.to_cardinal_float(value, reading=reading,
-                                          prefer=prefer)
+                                          prefer=prefer,
+                                          trailing_zeros=trailing_zeros)
+
+        if trailing_zeros and isinstance(value, Decimal) and \
+                value.as_tuple().exponent < 0:
+            return self.to_cardinal_float(value, reading=reading,
+                                          prefer=prefer,
+                                          trailing_zeros=trailing_zeros)
 
         out = ""
         if value < 0:
@@ -561,29 +572,31 @@ class Num2Word_JA(Num2Word_Base):
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value, reading, prefer)
-        words, _ = self.clean(val)
+        def text(elem):
+            return select_text(self.cards[elem], reading, prefer)
+
+        # Alternative readings are only tabulated for the default choice
+        table = () if prefer else self.spell_table(('cardinal', reading),
+                                                   text=text)
+        words, _ = self.spell_int(value, text=text, table=table)
         return self.title(out + words)
 
-    def to_cardinal_float(self, value, reading=False, prefer=None):
+    def to_cardinal_float(self, value, reading=False, prefer=None,
+                          trailing_zeros=False):
         prefer = prefer or ["れい"]
         try:
             float(value) == value
         except (ValueError, TypeError, AssertionError):
             raise TypeError(self.errmsg_nonnum % value)
 
-        pre, post = self.float2tuple(float(value))
-
-        post = str(post)
-        post = '0' * (self.precision - len(post)) + post
+        pre, digits = self.split_fraction(value, trailing_zeros)
 
         out = [self.to_cardinal(pre, reading=reading, prefer=prefer)]
-        if self.precision:
+        if digits:
             out.append(self.title(self.pointword[1 if reading else 0]))
 
-        for i in range(self.precision):
-            curr = int(post[i])
+        for digit in digits:
             out.append(to_s(
-                self.to_cardinal(curr, reading=reading, prefer=prefer)))
+                self.to_cardinal(digit, reading=reading, prefer=prefer)))
 
         return "".join(out)
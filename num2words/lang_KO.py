@@ -27,6 +27,7 @@ class Num2Word_KO(Num2Word_Base):
         'USD': ('달러', '센트'),
         'JPY': ('엔', None)
     }
+    CARDINAL_TABLE_SIZE = 10000
 
     def set_high_numwords(self, high):
         max = 4 * len(high)
@@ -95,7 +96,7 @@ class Num2Word_KO(Num2Word_Base):
         self.verify_ordinal(value)
         if(value == 1):
             return "첫 번째"
-        outwords = self.to_cardinal(value).split(" ")
+        outwords = self.to_cardinal(value).rsplit(" ", 1)
         lastwords = outwords[-1].split("백")
         if "십" in lastwords[-1]:
             ten_one = lastwords[-1].split("십")
@@ -79,7 +79,7 @@ class Num2Word_NO(lang_EU.Num2Word_EU):
 
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        outwords = self.to_cardinal(value).split(" ")
+        outwords = self.to_cardinal(value).rsplit(" ", 1)
         lastwords = outwords[-1].split("-")
         lastword = lastwords[-1].lower()
         try:
@@ -217,14 +217,12 @@ class Num2Word_PT(Num2Word_EU):
 
     def to_currency(self, val, currency='EUR', cents=True, separator=' e',
                     adjective=False):
-        # change negword because base.to_currency() does not need space after
-        backup_negword = self.negword
-        self.negword = self.negword[:-1]
         result = super(Num2Word_PT, self).to_currency(
             val, currency=currency, cents=cents, separator=separator,
             adjective=adjective)
-        # undo the change on negword
-        self.negword = backup_negword
+        # base.to_currency() adds a space after negword, which already has one
+        if result.startswith(self.negword + " "):
+            result = self.negword + result[len(self.negword) + 1:]
 
         # transforms "milhões euros" em "milhões de euros"
         cr1, _ = self.CURRENCY_FORMS[currency]
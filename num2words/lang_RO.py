@@ -57,6 +57,14 @@ class Num2Word_RO(lang_EU.Num2Word_EU):
             1000000: self.gen_numwords_n,
             1000000000: self.gen_numwords_n
         }
+        # romanian currency has a particularity for numeral: one
+        gen_numwords_currency = ["", "una"] + self.gen_numwords[2:]
+        self.currency_numwords_inflections = {
+            100: gen_numwords_currency,
+            1000: gen_numwords_currency,
+            1000000: self.gen_numwords_n,
+            1000000000: self.gen_numwords_n
+        }
         self.ords = {"unu": "primul",
                      "doi": "al doilea",
                      "three": "al treilea",
@@ -65,20 +73,21 @@ class Num2Word_RO(lang_EU.Num2Word_EU):
                      "nouă": "al nouălea",
                      "doisprezece": "al doisprezecelea"}
 
-    def merge(self, lpair, rpair):
+    def merge(self, lpair, rpair, inflections=None):
         ltext, lnum = lpair
         rtext, rnum = rpair
+        inflections = inflections or self.numwords_inflections
         rtext_i = self.inflect(rnum, rtext, lnum)
         if 1 <= lnum < 10:
-            if rnum not in self.numwords_inflections:
+            if rnum not in inflections:
                 return (rtext, rnum)
             else:
                 rtext_i = self.inflect(lnum * rnum, rtext, lnum)
-                lresult = (self.numwords_inflections[rnum][lnum], rtext_i)
+                lresult = (inflections[rnum][lnum], rtext_i)
                 return ("%s %s" % lresult, rnum)
         elif 10 < lnum < 100:
             if lnum % 10 == 0:
-                if rnum in self.numwords_inflections:
+                if rnum in inflections:
                     rtext_i = self.inflect(lnum * rnum, rtext, lnum)
                     return ("%s %s" % (ltext, rtext_i), lnum * rnum)
                 else:
@@ -89,7 +98,7 @@ class Num2Word_RO(lang_EU.Num2Word_EU):
                     else ltext.replace("doi", "două")
                 return ("%s %s" % (ltext_i, rtext_i), lnum * rnum)
         else:
-            if rnum in self.numwords_inflections:
+            if rnum in inflections:
                 rtext_i = self.inflect(lnum * rnum, rtext, lnum)
             return ("%s %s" % (ltext, rtext_i), lnum * rnum)
 
@@ -135,8 +144,6 @@ class Num2Word_RO(lang_EU.Num2Word_EU):
 
     def to_currency(self, val, currency="RON", cents=False, separator=" și",
                     adjective=False):
-        # romanian currency has a particularity for numeral: one
-        self.gen_numwords[1] = "una"
         result = super(Num2Word_RO, self).to_currency(
             int(round(val*100)),
             currency,
@@ -144,7 +151,6 @@ class Num2Word_RO(lang_EU.Num2Word_EU):
             separator,
             adjective
         )
-        self.gen_numwords[1] = "o"  # revert numeral
         return result.replace(
             "unu leu", "un leu"
         ).replace(
@@ -154,6 +160,14 @@ class Num2Word_RO(lang_EU.Num2Word_EU):
             separator + " zero bani", ""
         )
 
+    def _money_verbose(self, number, currency):
+        return self._int_to_cardinal(number,
+                                     self.currency_numwords_inflections)
+
+    def _cents_verbose(self, number, currency):
+        return self._int_to_cardinal(number,
+                                     self.currency_numwords_inflections)
+
     def to_year(self, val, suffix=None, longval=True):
         result = super(Num2Word_RO, self).to_year(
             val,
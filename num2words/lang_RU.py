@@ -169,7 +169,8 @@ class Num2Word_RU(Num2Word_Base):
 
     def to_ordinal(self, number):
         self.verify_ordinal(number)
-        outwords = self.to_cardinal(number).split(" ")
+        # Only the last three words can change
+        outwords = self.to_cardinal(number).rsplit(" ", 3)
         lastword = outwords[-1].lower()
         try:
             if len(outwords) > 1:
@@ -59,19 +59,18 @@ class Num2Word_SL(Num2Word_EU):
                      "tisoč": "tisoč",
                      "milijon": "milijont"
                      }
-        self.ordflag = False
 
-    def merge(self, curr, next):
+    def merge(self, curr, next, ordflag=False):
         ctext, cnum, ntext, nnum = curr + next
 
-        if ctext.endswith("dve") and self.ordflag and nnum <= 1000000:
+        if ctext.endswith("dve") and ordflag and nnum <= 1000000:
             ctext = ctext[:len(ctext)-1] + "a"
 
-        if ctext == "dve" and not self.ordflag and nnum < 1000000000:
+        if ctext == "dve" and not ordflag and nnum < 1000000000:
             ctext = "dva"
 
         if (ctext.endswith("tri") or ctext.endswith("štiri")) and\
-           nnum == 1000000 and not self.ordflag:
+           nnum == 1000000 and not ordflag:
             if ctext.endswith("štiri"):
                 ctext = ctext[:-1]
             ctext = ctext + "je"
@@ -83,13 +82,13 @@ class Num2Word_SL(Num2Word_EU):
             ctext = ctext[0:-1]
 
         if cnum == 1:
-            if nnum < 10**6 or self.ordflag:
+            if nnum < 10**6 or ordflag:
                 return next
             ctext = ""
 
         if nnum > cnum:
             if nnum >= 10**6:
-                if self.ordflag:
+                if ordflag:
                     ntext += "t"
 
                 elif cnum == 2:
@@ -125,14 +124,14 @@ class Num2Word_SL(Num2Word_EU):
                     else:
                         ntext += "ov"
 
-            if nnum >= 10**2 and self.ordflag is False and ctext:
+            if nnum >= 10**2 and ordflag is False and ctext:
                 ctext += " "
 
             val = cnum * nnum
         else:
             if nnum < 10 < cnum < 100:
                 ntext, ctext = ctext, ntext + "in"
-            elif cnum >= 10**2 and self.ordflag is False:
+            elif cnum >= 10**2 and ordflag is False:
                 ctext += " "
             val = cnum + nnum
 
@@ -141,9 +140,7 @@ class Num2Word_SL(Num2Word_EU):
 
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        self.ordflag = True
-        outword = self.to_cardinal(value)
-        self.ordflag = False
+        outword = self._int_to_cardinal(value, True)
         for key in self.ords:
             if outword.endswith(key):
                 outword = outword[:len(outword) - len(key)] + self.ords[key]
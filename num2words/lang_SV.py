@@ -84,7 +84,7 @@ class Num2Word_SV(lang_EU.Num2Word_EU):
 
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        outwords = self.to_cardinal(value).split(" ")
+        outwords = self.to_cardinal(value).rsplit(" ", 1)
         lastword = outwords[-1]
         ending_length = 0
         try:
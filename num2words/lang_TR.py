@@ -111,11 +111,6 @@ class Num2Word_TR(Num2Word_Base):
         }
         self.MAXVAL = (10 ** ((len(self.CARDINAL_TRIPLETS) + 1) * 3)) - 1
 
-        self.integers_to_read = []
-        self.total_triplets_to_read = 0
-        self.total_digits_outside_triplets = 0
-        self.order_of_last_zero_digit = 0
-
     def to_cardinal(self, value):
         wrd = ""
         is_cardinal = self.verify_cardinal(value)
@@ -124,218 +119,220 @@ class Num2Word_TR(Num2Word_Base):
 
         if not int(value) == value:
             return self.to_cardinal_float(value)
-        self.to_splitnum(value)
+        (integers_to_read, total_triplets_to_read,
+         total_digits_outside_triplets, order_of_last_zero_digit) = \
+            self.to_splitnum(value)
 
-        if self.order_of_last_zero_digit >= len(self.integers_to_read[0]):
+        if order_of_last_zero_digit >= len(integers_to_read[0]):
             # number like 00 and all 0s and even more, raise error
             return wrd
 
-        if self.total_triplets_to_read == 1:
-            if self.total_digits_outside_triplets == 2:
-                if self.order_of_last_zero_digit == 1:
+        if total_triplets_to_read == 1:
+            if total_digits_outside_triplets == 2:
+                if order_of_last_zero_digit == 1:
                     # number like x0, read cardinal x0 and return
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     return wrd
-                if self.order_of_last_zero_digit == 0:
+                if order_of_last_zero_digit == 0:
                     # number like xy, read cardinal xy and return
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                 return wrd
 
-            if self.total_digits_outside_triplets == 1:
-                if self.order_of_last_zero_digit == 0:
+            if total_digits_outside_triplets == 1:
+                if order_of_last_zero_digit == 0:
                     # number like x, read cardinal x and return
                     wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
-                    if self.integers_to_read[0][0] == "0":
+                    if integers_to_read[0][0] == "0":
                         return self.ZERO
                     return wrd
 
-            if self.total_digits_outside_triplets == 0:
-                if self.order_of_last_zero_digit == 2:
+            if total_digits_outside_triplets == 0:
+                if order_of_last_zero_digit == 2:
                     # number like x00, read cardinal x00 and return
                     wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_HUNDRED[0]
                     return wrd
-                if self.order_of_last_zero_digit == 1:
+                if order_of_last_zero_digit == 1:
                     # number like xy0, read cardinal xy0 and return
                     wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_HUNDRED[0]
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                     return wrd
-                if self.order_of_last_zero_digit == 0:
+                if order_of_last_zero_digit == 0:
                     # number like xyz, read cardinal xyz and return
                     wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_HUNDRED[0]
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                     wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][2], ""
+                        integers_to_read[0][2], ""
                     )
                     return wrd
 
-        if self.total_triplets_to_read >= 2:
-            if self.total_digits_outside_triplets == 2:
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 1:
+        if total_triplets_to_read >= 2:
+            if total_digits_outside_triplets == 2:
+                if order_of_last_zero_digit == len(
+                        integers_to_read[0]) - 1:
                     # number like x0 and all 0s, read cardinal x0 0..0
                     #  and return
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
                     return wrd
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 2:
+                if order_of_last_zero_digit == len(
+                        integers_to_read[0]) - 2:
                     # number like xy and all 0s, read cardinal xy 0..0
                     #  and return
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
                     return wrd
-                if self.order_of_last_zero_digit < len(
-                        self.integers_to_read[0]) - 2:
+                if order_of_last_zero_digit < len(
+                        integers_to_read[0]) - 2:
                     # number like xy and others, read cardinal xy n..n
                     #  and return
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
 
-            if self.total_digits_outside_triplets == 1:
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 1:
+            if total_digits_outside_triplets == 1:
+                if order_of_last_zero_digit == len(
+                        integers_to_read[0]) - 1:
                     # number like x and all 0s, read cardinal x 0..0
                     #  and return
-                    if not (self.total_triplets_to_read == 2 and
-                            self.integers_to_read[0][0] == "1"):
+                    if not (total_triplets_to_read == 2 and
+                            integers_to_read[0][0] == "1"):
                         wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
                     return wrd
-                if self.order_of_last_zero_digit < len(
-                        self.integers_to_read[0]) - 1:
+                if order_of_last_zero_digit < len(
+                        integers_to_read[0]) - 1:
                     # number like x and others, read cardinal x n..n
                     #  and return
-                    if not (self.total_triplets_to_read == 2 and
-                            self.integers_to_read[0][0] == "1"):
+                    if not (total_triplets_to_read == 2 and
+                            integers_to_read[0][0] == "1"):
                         wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
 
-            if self.total_digits_outside_triplets == 0:
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 1:
+            if total_digits_outside_triplets == 0:
+                if order_of_last_zero_digit == len(
+                        integers_to_read[0]) - 1:
                     # number like x00 and all 0s, read cardinal x00 0..0
                     #  and return
-                    wrd += self.HUNDREDS.get(self.integers_to_read[0][0], "")
+                    wrd += self.HUNDREDS.get(integers_to_read[0][0], "")
                     wrd += self.CARDINAL_HUNDRED[0]
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
                     return wrd
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 2:
+                if order_of_last_zero_digit == len(
+                        integers_to_read[0]) - 2:
                     # number like xy0 and all 0s, read cardinal xy0 0..0
                     #  and return
                     wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
+                        integers_to_read[0][0], ""
                     )
                     wrd += self.CARDINAL_HUNDRED[0]
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
                     return wrd
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 3:
+                if order_of_last_zero_digit == len(
+                        integers_to_read[0]) - 3:
                     # number like xyz and all 0s, read cardinal xyz 0..0
                     #  and return
-                    wrd += self.HUNDREDS.get(self.integers_to_read[0][0], "")
+                    wrd += self.HUNDREDS.get(integers_to_read[0][0], "")
                     wrd += self.CARDINAL_HUNDRED[0]
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
                     wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][2], ""
+                        integers_to_read[0][2], ""
                     )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
                     return wrd
-                if self.order_of_last_zero_digit < len(
-                        self.integers_to_read[0]) - 3:
+                if order_of_last_zero_digit < len(
+                        integers_to_read[0]) - 3:
                     # number like xyz and all others, read cardinal xyz n..n
-                    wrd += self.HUNDREDS.get(self.integers_to_read[0][0], "")
+                    wrd += self.HUNDREDS.get(integers_to_read[0][0], "")
                     wrd += self.CARDINAL_HUNDRED[0]
                     wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
+                        integers_to_read[0][1], ""
                     )
-                    if not (self.total_triplets_to_read == 2 and
-                            self.integers_to_read[0][2] == "1"):
+                    if not (total_triplets_to_read == 2 and
+                            integers_to_read[0][2] == "1"):
                         wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][2], ""
+                            integers_to_read[0][2], ""
                         )
                     wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
+                        total_triplets_to_read - 1
                     ]
 
-            for i in list(range(self.total_triplets_to_read - 1, 0, -1)):
-                reading_triplet_order = self.total_triplets_to_read - i
-                if self.total_digits_outside_triplets == 0:
+            for i in list(range(total_triplets_to_read - 1, 0, -1)):
+                reading_triplet_order = total_triplets_to_read - i
+                if total_digits_outside_triplets == 0:
                     last_read_digit_order = reading_triplet_order * 3
                 else:
                     last_read_digit_order = (reading_triplet_order - 1) * 3 +\
-                                            self.total_digits_outside_triplets
+                                            total_digits_outside_triplets
 
-                if not self.integers_to_read[0][
+                if not integers_to_read[0][
                         last_read_digit_order: last_read_digit_order + 3
                 ] == "000":
-                    if not self.integers_to_read[0][
+                    if not integers_to_read[0][
                         last_read_digit_order
                     ] == "0":
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][last_read_digit_order], ""
+                            integers_to_read[0][last_read_digit_order], ""
                         )
-                        if self.order_of_last_zero_digit == len(
-                                self.integers_to_read[0]) - (
+                        if order_of_last_zero_digit == len(
+                                integers_to_read[0]) - (
                                 last_read_digit_order) - 1:
                             if i == 1:
                                 wrd += self.CARDINAL_HUNDRED[0]
@@ -347,89 +344,89 @@ class Num2Word_TR(Num2Word_Base):
                         else:
                             wrd += self.CARDINAL_HUNDRED[0]
 
-                    if not self.integers_to_read[0][
+                    if not integers_to_read[0][
                                 last_read_digit_order + 1] == "0":
-                        if self.order_of_last_zero_digit == len(
-                                self.integers_to_read[0]) - (
+                        if order_of_last_zero_digit == len(
+                                integers_to_read[0]) - (
                                 last_read_digit_order) - 2:
                             if i == 1:
                                 wrd += self.CARDINAL_TENS.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order + 1], ""
                                 )
                                 return wrd
                             elif i > 1:
                                 wrd += self.CARDINAL_TENS.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order + 1], ""
                                 )
                                 wrd += self.CARDINAL_TRIPLETS[i - 1]
                                 return wrd
                         else:
                             wrd += self.CARDINAL_TENS.get(
-                                self.integers_to_read[0][
+                                integers_to_read[0][
                                     last_read_digit_order + 1], ""
                             )
 
-                    if not self.integers_to_read[0][
+                    if not integers_to_read[0][
                                 last_read_digit_order + 2] == "0":
-                        if self.order_of_last_zero_digit == len(
-                                self.integers_to_read[0]) - (
+                        if order_of_last_zero_digit == len(
+                                integers_to_read[0]) - (
                                 last_read_digit_order) - 3:
                             if i == 1:
                                 wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order + 2], ""
                                 )
                                 return wrd
                             if i == 2:
-                                if not self.integers_to_read[0][
+                                if not integers_to_read[0][
                                         last_read_digit_order:
                                         last_read_digit_order + 2
                                         ] == "00":
                                     wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 2], ""
                                     )
-                                elif not self.integers_to_read[0][
+                                elif not integers_to_read[0][
                                             last_read_digit_order + 2] == "1":
                                     wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 2], ""
                                     )
                                 wrd += self.CARDINAL_TRIPLETS[i - 1]
                                 return wrd
                             if i > 2:
                                 wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order + 2], ""
                                 )
                                 wrd += self.CARDINAL_TRIPLETS[i - 1]
                                 return wrd
                         else:
-                            if not self.integers_to_read[0][
+                            if not integers_to_read[0][
                                     last_read_digit_order:
                                     last_read_digit_order + 2
                             ] == "00":
                                 wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order + 2], ""
                                 )
                             else:
                                 if i == 2:
-                                    if not self.integers_to_read[0][
+                                    if not integers_to_read[0][
                                            last_read_digit_order:
                                            last_read_digit_order + 2
                                     ] == "00":
                                         wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
+                                            integers_to_read[0][
                                                 last_read_digit_order + 2], ""
                                         )
-                                    elif not self.integers_to_read[0][
+                                    elif not integers_to_read[0][
                                                 last_read_digit_order + 2
                                     ] == "1":
                                         wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
+                                            integers_to_read[0][
                                                 last_read_digit_order + 2], ""
                                         )
 
@@ -438,19 +435,19 @@ class Num2Word_TR(Num2Word_Base):
         return wrd
 
     def to_cardinal_float(self, value):
-        self.to_splitnum(value)
+        integers_to_read = self.to_splitnum(value)[0]
         wrd = ""
         wrd += self.pointword
-        if len(self.integers_to_read[1]) >= 1:
-            wrd += self.CARDINAL_TENS.get(self.integers_to_read[1][0], "")
+        if len(integers_to_read[1]) >= 1:
+            wrd += self.CARDINAL_TENS.get(integers_to_read[1][0], "")
 
-        if len(self.integers_to_read[1]) == 2:
-            wrd += self.CARDINAL_ONES.get(self.integers_to_read[1][1], "")
+        if len(integers_to_read[1]) == 2:
+            wrd += self.CARDINAL_ONES.get(integers_to_read[1][1], "")
 
-        if self.integers_to_read[0] == "0":
+        if integers_to_read[0] == "0":
             wrd = self.ZERO + wrd
         else:
-            wrd = self.to_cardinal(int(self.integers_to_read[0])) + wrd
+            wrd = self.to_cardinal(int(integers_to_read[0])) + wrd
         return wrd
 
     def verify_cardinal(self, value):
@@ -481,232 +478,234 @@ class Num2Word_TR(Num2Word_Base):
         wrd = ""
         isordinal = self.verify_ordinal(value)
         if isordinal:
-            self.to_splitnum(value)
+            (integers_to_read, total_triplets_to_read,
+             total_digits_outside_triplets, order_of_last_zero_digit) = \
+                self.to_splitnum(value)
 
-            if self.order_of_last_zero_digit >= len(self.integers_to_read[0]):
+            if order_of_last_zero_digit >= len(integers_to_read[0]):
                 # number like 00 and all 0s and even more, raise error
                 return wrd
 
-            if self.total_triplets_to_read == 1:
-                if self.total_digits_outside_triplets == 2:
-                    if self.order_of_last_zero_digit == 1:
+            if total_triplets_to_read == 1:
+                if total_digits_outside_triplets == 2:
+                    if order_of_last_zero_digit == 1:
                         # number like x0, read ordinal x0 and return
                         wrd += self.ORDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         return wrd
-                    if self.order_of_last_zero_digit == 0:
+                    if order_of_last_zero_digit == 0:
                         # number like xy, read ordinal xy and return
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.ORDINAL_ONES.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
                         return wrd
 
-                if self.total_digits_outside_triplets == 1:
-                    if self.order_of_last_zero_digit == 0:
+                if total_digits_outside_triplets == 1:
+                    if order_of_last_zero_digit == 0:
                         # number like x, read ordinal x and return
                         wrd += self.ORDINAL_ONES.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
-                        if self.integers_to_read[0][0] == "0":
+                        if integers_to_read[0][0] == "0":
                             return u"sıfırıncı"
                         return wrd
 
-                if self.total_digits_outside_triplets == 0:
-                    if self.order_of_last_zero_digit == 2:
+                if total_digits_outside_triplets == 0:
+                    if order_of_last_zero_digit == 2:
                         # number like x00, read ordinal x00 and return
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.ORDINAL_HUNDRED[0]
                         return wrd
-                    if self.order_of_last_zero_digit == 1:
+                    if order_of_last_zero_digit == 1:
                         # number like xy0, read ordinal xy0 and return
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_HUNDRED[0]
                         wrd += self.ORDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
                         return wrd
-                    if self.order_of_last_zero_digit == 0:
+                    if order_of_last_zero_digit == 0:
                         # number like xyz, read ordinal xyz and return
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_HUNDRED[0]
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
-                        if not self.integers_to_read[0][2] == "0":
+                        if not integers_to_read[0][2] == "0":
                             wrd += self.ORDINAL_ONES.get(
-                                self.integers_to_read[0][2], ""
+                                integers_to_read[0][2], ""
                             )
                         return wrd
 
-            if self.total_triplets_to_read >= 2:
-                if self.total_digits_outside_triplets == 2:
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 1:
+            if total_triplets_to_read >= 2:
+                if total_digits_outside_triplets == 2:
+                    if order_of_last_zero_digit == len(
+                            integers_to_read[0]) - 1:
                         # number like x0 and all 0s, read ordinal x0 0..0
                         #  and return
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
                         return wrd
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 2:
+                    if order_of_last_zero_digit == len(
+                            integers_to_read[0]) - 2:
                         # number like xy and all 0s, read ordinal xy 0..0
                         #  and return
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
                         wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
                         return wrd
-                    if self.order_of_last_zero_digit < len(
-                            self.integers_to_read[0]) - 2:
+                    if order_of_last_zero_digit < len(
+                            integers_to_read[0]) - 2:
                         # number like xy and others, read cardinal xy n..n
                         #  and return
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
                         wrd += self.CARDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
 
-                if self.total_digits_outside_triplets == 1:
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 1:
+                if total_digits_outside_triplets == 1:
+                    if order_of_last_zero_digit == len(
+                            integers_to_read[0]) - 1:
                         # number like x and all 0s, read ordinal x 0..0
                         #  and return
-                        if not (self.total_triplets_to_read == 2 and
-                                self.integers_to_read[0][0] == "1"):
+                        if not (total_triplets_to_read == 2 and
+                                integers_to_read[0][0] == "1"):
                             wrd += self.CARDINAL_ONES.get(
-                                self.integers_to_read[0][0], ""
+                                integers_to_read[0][0], ""
                             )
                         wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
                         return wrd
-                    if self.order_of_last_zero_digit < len(
-                            self.integers_to_read[0]) - 1:
+                    if order_of_last_zero_digit < len(
+                            integers_to_read[0]) - 1:
                         # number like x and others, read cardinal x n..n
                         #  and return
-                        if not (self.total_triplets_to_read == 2 and
-                                self.integers_to_read[0][0] == "1"):
+                        if not (total_triplets_to_read == 2 and
+                                integers_to_read[0][0] == "1"):
                             wrd += self.CARDINAL_ONES.get(
-                                self.integers_to_read[0][0], ""
+                                integers_to_read[0][0], ""
                             )
                         wrd += self.CARDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
 
-                if self.total_digits_outside_triplets == 0:
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 1:
+                if total_digits_outside_triplets == 0:
+                    if order_of_last_zero_digit == len(
+                            integers_to_read[0]) - 1:
                         # number like x00 and all 0s, read ordinal x00 0..0
                         #  and return
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_HUNDRED[0]
                         wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
                         return wrd
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 2:
+                    if order_of_last_zero_digit == len(
+                            integers_to_read[0]) - 2:
                         # number like xy0 and all 0s, read ordinal xy0 0..0
                         #  and return
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_HUNDRED[0]
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
                         wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
                         return wrd
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 3:
+                    if order_of_last_zero_digit == len(
+                            integers_to_read[0]) - 3:
                         # number like xyz and all 0s, read ordinal xyz 0..0
                         #  and return
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_HUNDRED[0]
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
                         wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][2], ""
+                            integers_to_read[0][2], ""
                         )
                         wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
                         return wrd
-                    if self.order_of_last_zero_digit < len(
-                            self.integers_to_read[0]) - 3:
+                    if order_of_last_zero_digit < len(
+                            integers_to_read[0]) - 3:
                         # number like xyz and all others, read cardinal
                         #  xyz n..n
                         wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
+                            integers_to_read[0][0], ""
                         )
                         wrd += self.CARDINAL_HUNDRED[0]
                         wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
+                            integers_to_read[0][1], ""
                         )
-                        if not (self.total_triplets_to_read == 2 and
-                                self.integers_to_read[0][2] == "1"):
+                        if not (total_triplets_to_read == 2 and
+                                integers_to_read[0][2] == "1"):
                             wrd += self.CARDINAL_ONES.get(
-                                self.integers_to_read[0][2], ""
+                                integers_to_read[0][2], ""
                             )
                         wrd += self.CARDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
+                            total_triplets_to_read - 1
                         ]
 
-                for i in list(range(self.total_triplets_to_read - 1, 0, -1)):
-                    reading_triplet_order = self.total_triplets_to_read - i
-                    if self.total_digits_outside_triplets == 0:
+                for i in list(range(total_triplets_to_read - 1, 0, -1)):
+                    reading_triplet_order = total_triplets_to_read - i
+                    if total_digits_outside_triplets == 0:
                         last_read_digit_order = reading_triplet_order * 3
                     else:
                         last_read_digit_order = \
                             (reading_triplet_order - 1) * 3 + \
-                            self.total_digits_outside_triplets
+                            total_digits_outside_triplets
 
-                    if not self.integers_to_read[0][
+                    if not integers_to_read[0][
                            last_read_digit_order: last_read_digit_order + 3
                            ] == "000":
-                        if not self.integers_to_read[0][
+                        if not integers_to_read[0][
                             last_read_digit_order
                         ] == "0":
-                            if not self.integers_to_read[0][
+                            if not integers_to_read[0][
                                 last_read_digit_order
                             ] == "1":
                                 wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order
                                     ], ""
                                 )
-                            if self.order_of_last_zero_digit == len(
-                                    self.integers_to_read[0]) - (
+                            if order_of_last_zero_digit == len(
+                                    integers_to_read[0]) - (
                                     last_read_digit_order) - 1:
                                 if i == 1:
                                     wrd += self.ORDINAL_HUNDRED[0]
@@ -718,87 +717,87 @@ class Num2Word_TR(Num2Word_Base):
                             else:
                                 wrd += self.CARDINAL_HUNDRED[0]
 
-                        if not self.integers_to_read[0][
+                        if not integers_to_read[0][
                                     last_read_digit_order + 1
                         ] == "0":
-                            if self.order_of_last_zero_digit == len(
-                                    self.integers_to_read[0]) - (
+                            if order_of_last_zero_digit == len(
+                                    integers_to_read[0]) - (
                                     last_read_digit_order) - 2:
                                 if i == 1:
                                     wrd += self.ORDINAL_TENS.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 1], ""
                                     )
                                     return wrd
                                 elif i > 1:
                                     wrd += self.CARDINAL_TENS.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 1], ""
                                     )
                                     wrd += self.ORDINAL_TRIPLETS[i - 1]
                                     return wrd
                             else:
                                 wrd += self.CARDINAL_TENS.get(
-                                    self.integers_to_read[0][
+                                    integers_to_read[0][
                                         last_read_digit_order + 1], ""
                                 )
 
-                        if not self.integers_to_read[0][
+                        if not integers_to_read[0][
                                     last_read_digit_order + 2
                         ] == "0":
-                            if self.order_of_last_zero_digit == len(
-                                    self.integers_to_read[0]) - (
+                            if order_of_last_zero_digit == len(
+                                    integers_to_read[0]) - (
                                     last_read_digit_order) - 3:
                                 if i == 1:
                                     wrd += self.ORDINAL_ONES.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 2], ""
                                     )
                                     return wrd
                                 if i == 2:
-                                    if not self.integers_to_read[0][
+                                    if not integers_to_read[0][
                                        last_read_digit_order:
                                             last_read_digit_order + 2] == "00":
                                         wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
+                                            integers_to_read[0][
                                                 last_read_digit_order + 2], ""
                                         )
-                                    elif not self.integers_to_read[0][
+                                    elif not integers_to_read[0][
                                                 last_read_digit_order + 2
                                     ] == "1":
                                         wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
+                                            integers_to_read[0][
                                                 last_read_digit_order + 2], ""
                                         )
                                     wrd += self.ORDINAL_TRIPLETS[i - 1]
                                     return wrd
                                 if i > 2:
                                     wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 2], ""
                                     )
                                     wrd += self.ORDINAL_TRIPLETS[i - 1]
                                     return wrd
                             else:
-                                if not self.integers_to_read[0][
+                                if not integers_to_read[0][
                                    last_read_digit_order:
                                         last_read_digit_order + 2] == "00":
                                     wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
+                                        integers_to_read[0][
                                             last_read_digit_order + 2], ""
                                     )
                                 else:
-                                    if not self.integers_to_read[0][
+                                    if not integers_to_read[0][
                                        last_read_digit_order:
                                            last_read_digit_order + 2] == "00":
                                         wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
+                                            integers_to_read[0][
                                                 last_read_digit_order + 2], ""
                                         )
-                                    elif not self.integers_to_read[0][
+                                    elif not integers_to_read[0][
                                             last_read_digit_order + 2] == "1":
                                         wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
+                                            integers_to_read[0][
                                                 last_read_digit_order + 2], ""
                                         )
 
@@ -809,32 +808,35 @@ class Num2Word_TR(Num2Word_Base):
     def to_splitnum(self, val):
         float_digits = str(int(val * 10 ** self.precision))
         if not int(val) == 0:
-            self.integers_to_read = [
+            integers_to_read = [
                 str(int(val)),
                 float_digits[len(float_digits) - self.precision:]
             ]
         else:
-            self.integers_to_read = [
+            integers_to_read = [
                 "0",
                 "0" * (self.precision - len(float_digits)) +
                 float_digits[len(float_digits) - self.precision:]
             ]
-        if len(self.integers_to_read[0]) % 3 > 0:
-            self.total_triplets_to_read = (len(self.integers_to_read[0]) // 3)\
+        if len(integers_to_read[0]) % 3 > 0:
+            total_triplets_to_read = (len(integers_to_read[0]) // 3)\
                                           + 1
-        elif len(self.integers_to_read[0]) % 3 == 0:
-            self.total_triplets_to_read = len(self.integers_to_read[0]) // 3
-        self.total_digits_outside_triplets = len(self.integers_to_read[0]) % 3
+        elif len(integers_to_read[0]) % 3 == 0:
+            total_triplets_to_read = len(integers_to_read[0]) // 3
+        total_digits_outside_triplets = len(integers_to_read[0]) % 3
 
-        okunacak = list(self.integers_to_read[0][::-1])
-        self.order_of_last_zero_digit = 0
+        okunacak = list(integers_to_read[0][::-1])
+        order_of_last_zero_digit = 0
         found = 0
         for i in range(len(okunacak) - 1):
             if int(okunacak[i]) == 0 and found == 0:
-                self.order_of_last_zero_digit = i + 1
+                order_of_last_zero_digit = i + 1
             else:
                 found = 1
 
+        return (integers_to_read, total_triplets_to_read,
+                total_digits_outside_triplets, order_of_last_zero_digit)
+
     def to_currency(self, value):
         if int(value) == 0:
             return u"bedelsiz"
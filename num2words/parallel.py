@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Conversion on several CPU cores with a process pool.
+
+Conversions are pure Python and CPU-bound, so threads are limited to one
+core by the GIL. ParallelConverter spreads chunks of values over worker
+processes that have preloaded the languages they will use.
+
+Requires Python 3.7 or later (``concurrent.futures`` with a worker
+initializer).
+"""
+
+from __future__ import unicode_literals
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from . import CONVERTER_CLASSES, _chunked, num2words_many, resolve_lang
+
+DEFAULT_CHUNKSIZE = 1000
+
+
+def _init_worker(langs):
+    CONVERTER_CLASSES.preload(langs)
+
+
+def _convert_chunk(chunk, lang, to, errors, default, kwargs):
+    return num2words_many(chunk, lang=lang, to=to, errors=errors,
+                          default=default, **kwargs)
+
+
+class ParallelConverter(object):
+    """Pool of worker processes converting numbers with num2words_many().
+
+    ``langs`` are preloaded by every worker when it starts; other languages
+    still work but are loaded on first use. ``max_workers`` defaults to the
+    number of CPUs. Values are sent to the workers ``chunksize`` at a time
+    to amortize the inter-process communication.
+
+    Use it as a context manager, or call shutdown() when done::
+
+        with ParallelConverter(langs=['en']) as pool:
+            words = pool.convert(range(10 ** 6))
+    """
+
+    def __init__(self, langs=('en',), max_workers=None,
+                 chunksize=DEFAULT_CHUNKSIZE):
+        if chunksize < 1:
+            raise ValueError('chunksize must be at least 1')
+        self.langs = [resolve_lang(lang) for lang in langs]
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._executor = ProcessPoolExecutor(
+            self.max_workers, initializer=_init_worker,
+            initargs=(self.langs,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def imap(self, values, lang='en', to='cardinal', errors='raise',
+             default=None, **kwargs):
+        """Yield the words of ``values`` in input order.
+
+        Arguments are the same as for num2words_many(). At most two chunks
+        per worker are in flight, so ``values`` may be a stream of any
+        length.
+        """
+        pending = deque()
+        for chunk in _chunked(values, self.chunksize):
+            pending.append(self._executor.submit(
+                _convert_chunk, chunk, lang, to, errors, default, kwargs))
+            if len(pending) >= 2 * self.max_workers:
+                for words in pending.popleft().result():
+                    yield words
+        while pending:
+            for words in pending.popleft().result():
+                yield words
+
+    def convert(self, values, lang='en', to='cardinal', errors='raise',
+                default=None, **kwargs):
+        """Return the list of the words of ``values``, see imap()."""
+        return list(self.imap(values, lang=lang, to=to, errors=errors,
+                              default=default, **kwargs))
+
+
+def num2words_parallel(values, lang='en', to='cardinal', max_workers=None,
+                       chunksize=DEFAULT_CHUNKSIZE, **kwargs):
+    """Convert ``values`` in a temporary ParallelConverter pool.
+
+    Starting the workers takes time; keep a ParallelConverter around when
+    converting several batches.
+    """
+    with ParallelConverter([lang], max_workers, chunksize) as pool:
+        return pool.convert(values, lang=lang, to=to, **kwargs)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import threading
+from importlib import import_module
+
+from .compat import MutableMapping, strtype
+
+# Number of language codes whose resolution is remembered
+RESOLVE_CACHE_SIZE = 1024
+
+
+class LazyConverterRegistry(MutableMapping):
+    """Mapping of language codes to converter instances.
+
+    Language modules are only imported, and their converter instantiated,
+    the first time the language is looked up. Membership tests, iteration
+    and ``len()`` never import anything.
+
+    Entries are given as ``'lang_XX.Num2Word_XX'`` paths relative to
+    ``package``. Assigning a converter instance registers it directly.
+    ``aliases`` maps other language codes, e.g. ISO 639-1 codes, to
+    registered ones; see resolve().
+    """
+
+    def __init__(self, package, paths, aliases=None):
+        self._package = package
+        self._paths = dict(paths)
+        self._aliases = dict(aliases or {})
+        self._converters = {}
+        self._lock = threading.Lock()
+        self._index = None
+        self._resolved = {}
+
+    def __getitem__(self, lang):
+        try:
+            return self._converters[lang]
+        except KeyError:
+            pass
+        path = self._paths[lang]
+        with self._lock:
+            if lang not in self._converters:
+                self._converters[lang] = self._load(path)
+            return self._converters[lang]
+
+    def _load(self, path):
+        """Import the converter class at ``path`` and instantiate it."""
+        module_name, class_name = path.rsplit('.', 1)
+        module = import_module('.%s' % module_name, package=self._package)
+        return getattr(module, class_name)()
+
+    def __setitem__(self, lang, converter):
+        with self._lock:
+            self._paths[lang] = None
+            self._converters[lang] = converter
+            self._forget_resolved()
+
+    def __delitem__(self, lang):
+        with self._lock:
+            del self._paths[lang]
+            self._converters.pop(lang, None)
+            self._forget_resolved()
+
+    def __contains__(self, lang):
+        return lang in self._paths
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, sorted(self._paths))
+
+    def path(self, lang):
+        """Return the ``'lang_XX.Num2Word_XX'`` path of ``lang``, None for
+        converters registered as instances."""
+        return self._paths[lang]
+
+    def is_loaded(self, lang):
+        """Return whether the converter for ``lang`` is instantiated."""
+        return lang in self._converters
+
+    def _forget_resolved(self):
+        self._index = None
+        self._resolved = {}
+
+    def resolve(self, lang):
+        """Return the registered code matching ``lang``, or None.
+
+        ``lang`` is matched as is first. Otherwise it is read as a BCP-47
+        tag or POSIX locale, case-insensitively and with ``-`` or ``_``
+        separators (``en-US``, ``pt_br``, ``fr_CA.UTF-8``), and the first
+        registered code or alias among language_subtag (for each subtag)
+        and language is returned. The first two letters of the language
+        are tried last, as num2words() always did. Results are cached.
+        """
+        try:
+            return self._resolved[lang]
+        except KeyError:
+            pass
+        resolved = self._resolve(lang)
+        resolved_cache = self._resolved
+        if len(resolved_cache) >= RESOLVE_CACHE_SIZE:
+            resolved_cache.clear()
+        resolved_cache[lang] = resolved
+        return resolved
+
+    def _resolve(self, lang):
+        if lang in self._paths:
+            return lang
+        if not isinstance(lang, strtype):
+            return None
+
+        index = self._index
+        if index is None:
+            index = dict((alias.lower(), code)
+                         for alias, code in self._aliases.items())
+            index.update((code.lower(), code) for code in self._paths)
+            self._index = index
+
+        # drop the encoding and modifier of POSIX locales
+        lang = lang.split('.')[0].split('@')[0]
+        tags = lang.replace('-', '_').lower().split('_')
+        language = tags[0]
+        candidates = ['%s_%s' % (language, tag) for tag in tags[1:]]
+        candidates += [language, language[:2]]
+        for candidate in candidates:
+            if candidate in index:
+                return index[candidate]
+        return None
+
+    def preload(self, langs=None):
+        """Instantiate the converters for ``langs`` (default: all)."""
+        for lang in (self._paths if langs is None else langs):
+            self[lang]
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Local HTTP conversion server, started by ``num2words serve``.
+
+Endpoints:
+
+* ``GET /convert?n=42&lang=en&to=cardinal`` returns ``{"words": "..."}``;
+  the converter options of CONVERTER_OPTIONS (e.g. ``currency=USD`` or
+  ``cents=false``) are passed to the converter.
+* ``POST /batch?lang=en&to=cardinal`` takes a JSON array of numbers and
+  returns the array of their words, ``null`` for those that failed.
+* ``GET /metrics`` returns the request latency histograms, the number of
+  values converted per endpoint and the conversion metrics of
+  num2words.instrument, in the Prometheus text format.
+
+Connections are kept alive (HTTP/1.1) and served on one thread each.
+Single conversions are done in the serving thread; with several
+``workers``, batches larger than a chunk are spread over a process pool
+(see num2words.parallel). The ``preload`` languages are loaded and their
+spell tables built before the first request, and the results of both
+/convert and /batch are kept in the result cache. Numbers are limited to
+MAX_DIGITS digits.
+
+Requires Python 3.7 or later.
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import json
+import sys
+import threading
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import num2words as package
+
+from . import (_MISSING, CONVERTER_CLASSES, __version__, _cache_key, cache,
+               get_formatter, instrument)
+from .cache import DEFAULT_MAXSIZE, enable_cache
+from .cli import error_message
+from .instrument import LATENCY_BUCKETS, Histogram, _labels, timer
+from .parallel import DEFAULT_CHUNKSIZE, ParallelConverter
+
+DEFAULT_PORT = 8080
+
+# Largest request body accepted by /batch, in bytes
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+# Longest number accepted, in digits once its exponent is applied
+MAX_DIGITS = 1000
+
+ENDPOINTS = ('/convert', '/batch', '/metrics')
+
+BOOLEANS = {'true': True, 'false': False, '1': True, '0': False}
+
+
+def parse_boolean(name, text):
+    try:
+        return BOOLEANS[text.lower()]
+    except KeyError:
+        raise HTTPError(400, '%s must be true, false, 1 or 0' % name)
+
+
+def parse_text(name, text):
+    return text
+
+
+def parse_list(name, text):
+    return [item for item in text.split(',') if item]
+
+
+# Keyword arguments of the converters' to_* methods accepted as query
+# parameters, with their parser
+CONVERTER_OPTIONS = {
+    'adjective': parse_boolean,
+    'case': parse_text,
+    'cents': parse_boolean,
+    'counter': parse_text,
+    'currency': parse_text,
+    'era': parse_boolean,
+    'feminine': parse_boolean,
+    'longval': parse_boolean,
+    'old': parse_boolean,
+    'plural': parse_boolean,
+    # comma separated alternatives, e.g. prefer=四,七
+    'prefer': parse_list,
+    'prefix': parse_text,
+    'reading': parse_boolean,
+    'separator': parse_text,
+    'suffix': parse_text,
+    'trailing_zeros': parse_boolean,
+    'zero': parse_text,
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class ServerMetrics(object):
+    """Latency histograms of the requests per endpoint and status, and
+    number of values converted per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.values = defaultdict(int)
+
+    def observe(self, endpoint, status, seconds, values=0):
+        if endpoint not in ENDPOINTS:
+            endpoint = 'other'
+        with self._lock:
+            self.requests[endpoint, status].observe(seconds)
+            self.values[endpoint] += values
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text format."""
+        metric = 'num2words_http_request_duration_seconds'
+        lines = ['# TYPE %s histogram' % metric]
+        with self._lock:
+            requests = sorted((key, histogram.as_dict())
+                              for key, histogram in self.requests.items())
+            values = sorted(self.values.items())
+        for (endpoint, status), histogram in requests:
+            for bound, count in histogram['buckets']:
+                lines.append('%s_bucket{%s} %d' % (metric, _labels(
+                    endpoint=endpoint, status=status, le=bound), count))
+            labels = _labels(endpoint=endpoint, status=status)
+            lines.append('%s_sum{%s} %r' % (metric, labels,
+                                            histogram['sum']))
+            lines.append('%s_count{%s} %d' % (metric, labels,
+                                              histogram['count']))
+        lines.append('# TYPE num2words_http_values_total counter')
+        for endpoint, count in values:
+            lines.append('num2words_http_values_total{%s} %d' % (
+                _labels(endpoint=endpoint), count))
+        return '\n'.join(lines) + '\n'
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'num2words/' + __version__
+    disable_nagle_algorithm = True
+    # buffered, so that headers and body are sent together
+    wbufsize = -1
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/convert':
+            self.respond(url, self.convert)
+        elif url.path == '/metrics':
+            self.respond(url, self.metrics)
+        else:
+            self.respond(url, self.not_found)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        try:
+            body = self.read_body()
+        except HTTPError as err:
+            self.close_connection = True
+            self.respond(url, error=err)
+            return
+        if url.path == '/batch':
+            self.respond(url, self.batch, body)
+        else:
+            self.respond(url, self.not_found)
+
+    def read_body(self):
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise HTTPError(411, 'Content-Length is required')
+        if not length.isdigit() or int(length) > MAX_BODY_SIZE:
+            raise HTTPError(413, 'body larger than %d bytes' %
+                            MAX_BODY_SIZE)
+        return self.rfile.read(int(length))
+
+    def respond(self, url, endpoint=None, *args, error=None):
+        """Answer with the result of ``endpoint(params, *args)``, a tuple
+        (content type, body, number of values converted), or with
+        ``error``, and record the request in the metrics."""
+        start = timer()
+        status, values = 200, 0
+        if error is None:
+            try:
+                params = dict((name, value[-1]) for name, value in
+                              parse_qs(url.query).items())
+                content_type, body, values = endpoint(params, *args)
+            except HTTPError as err:
+                error = err
+            except Exception as err:
+                self.log_error('%s failed: %r', url.path, err)
+                error = HTTPError(500, 'internal error')
+        if error is not None:
+            status = error.status
+            content_type, body = 'application/json', dump({
+                'error': str(error)})
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.metrics.observe(url.path, status, timer() - start,
+                                    values)
+
+    def convert(self, params):
+        lang, to, options = conversion_params(params)
+        if 'n' not in params:
+            raise HTTPError(400, 'missing parameter n')
+        if too_long(params['n']):
+            raise HTTPError(400, 'numbers are limited to %d digits' %
+                            MAX_DIGITS)
+        try:
+            words = package.num2words(params['n'], lang=lang, to=to,
+                                      **options)
+        except Exception as err:
+            raise HTTPError(400, error_message(err, lang=lang, to=to))
+        return 'application/json', dump({'words': words}), 1
+
+    def batch(self, params, body):
+        lang, to, options = conversion_params(params)
+        try:
+            values = json.loads(body.decode('utf-8'))
+        except ValueError:
+            raise HTTPError(400, 'body is not JSON')
+        if not isinstance(values, list):
+            raise HTTPError(400, 'body is not a JSON array')
+        try:
+            # check the language and options once
+            get_formatter(lang, to, **options)
+        except Exception as err:
+            raise HTTPError(400, error_message(err, lang=lang, to=to))
+        values = [batch_value(value) for value in values]
+        words = self.server.convert_batch(values, lang, to, options)
+        return 'application/json', dump(words), len(values)
+
+    def metrics(self, params):
+        text = self.server.metrics.to_prometheus() + \
+            instrument.to_prometheus()
+        return 'text/plain; version=0.0.4', text.encode('utf-8'), 0
+
+    def not_found(self, params, *args):
+        raise HTTPError(404, 'no such endpoint, use %s' %
+                        ', '.join(ENDPOINTS))
+
+    def log_message(self, format, *args):
+        # no access log, see /metrics
+        pass
+
+    def log_error(self, format, *args):
+        BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+def conversion_params(params):
+    """Return the language, converter and converter options of the query
+    ``params``, parsed with CONVERTER_OPTIONS. Unknown options raise a 400
+    HTTPError."""
+    options = {}
+    for name, text in params.items():
+        if name in ('n', 'lang', 'to'):
+            continue
+        try:
+            parse = CONVERTER_OPTIONS[name]
+        except KeyError:
+            raise HTTPError(400, 'unknown option %s' % name)
+        options[name] = parse(name, text)
+    return params.get('lang', 'en'), params.get('to', 'cardinal'), options
+
+
+def batch_value(value):
+    """Return the value converted for an item of a /batch array: numbers
+    are read from their text, like on the command line, booleans are not
+    numbers and numbers longer than MAX_DIGITS are refused (None)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        value = str(value)
+    if isinstance(value, str) and too_long(value):
+        return None
+    return value
+
+
+def too_long(text):
+    """Return whether the number ``text`` has more than MAX_DIGITS digits
+    once its exponent is applied, e.g. ``1e100000``."""
+    if len(text) > MAX_DIGITS:
+        return True
+    try:
+        digits, exponent = Decimal(text).as_tuple()[1:]
+    except (InvalidOperation, ValueError):
+        # not a number, left to the converter to report
+        return False
+    if not isinstance(exponent, int):
+        # NaN or infinity
+        return False
+    if exponent >= 0:
+        return len(digits) + exponent > MAX_DIGITS
+    return max(len(digits), -exponent) > MAX_DIGITS
+
+
+def dump(value):
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """HTTP server answering with RequestHandler; see make_server()."""
+
+    daemon_threads = True
+
+    def __init__(self, address, workers=1, preload=('en',),
+                 chunksize=DEFAULT_CHUNKSIZE):
+        ThreadingHTTPServer.__init__(self, address, RequestHandler)
+        self.metrics = ServerMetrics()
+        self.pool = None
+        if workers != 1:
+            self.pool = ParallelConverter(preload, workers or None,
+                                          chunksize)
+
+    def convert_batch(self, values, lang, to, options):
+        """Return the words of ``values``, None for those that fail. When
+        the result cache is enabled, cached words are used and only the
+        misses are converted, in the pool for large batches."""
+        converter = package.get_converter(lang)
+        words = [_MISSING] * len(values)
+        keys = [None] * len(values)
+        if cache.cache_enabled():
+            for i, value in enumerate(values):
+                keys[i] = _cache_key(converter, to, value, options)
+                if keys[i] is not None:
+                    words[i] = cache.get_cached(keys[i], _MISSING)
+        misses = [i for i, result in enumerate(words) if result is _MISSING]
+        pending = [values[i] for i in misses]
+        if self.pool is not None and len(pending) > self.pool.chunksize:
+            converted = self.pool.convert(pending, lang=lang, to=to,
+                                          errors='replace', **options)
+        else:
+            converted = package.num2words_many(
+                pending, lang=lang, to=to, errors='replace', **options)
+        for i, result in zip(misses, converted):
+            words[i] = result
+            if result is not None and keys[i] is not None:
+                cache.set_cached(keys[i], result)
+        return words
+
+    def server_close(self):
+        ThreadingHTTPServer.server_close(self)
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+def warm(langs):
+    """Load the converters of ``langs`` and build their spell tables."""
+    for lang in langs:
+        converter = package.get_converter(lang)
+        for method in (converter.to_cardinal, converter.to_ordinal):
+            try:
+                method(1)
+            except Exception:
+                pass
+
+
+def make_server(host='127.0.0.1', port=DEFAULT_PORT, workers=1,
+                preload=('en',), cache_size=DEFAULT_MAXSIZE,
+                chunksize=DEFAULT_CHUNKSIZE):
+    """Return a ConversionServer listening on ``host``:``port``.
+
+    ``workers`` processes (one per CPU for 0) convert the large batches,
+    with 1 everything is converted in the server process. The ``preload``
+    languages are warmed up first. Results are cached in an LRU cache of
+    ``cache_size`` entries (0 disables it) and instrumentation is enabled
+    for /metrics.
+    """
+    preload = [package.resolve_lang(lang) for lang in preload]
+    if cache_size:
+        enable_cache(maxsize=cache_size)
+    instrument.enable()
+    warm(preload)
+    return ConversionServer((host, port), workers, preload, chunksize)
+
+
+def main(argv=None):
+    """Run ``num2words serve`` with the command line ``argv``."""
+    parser = argparse.ArgumentParser(
+        prog='num2words serve',
+        description='Serve conversions over HTTP (see num2words.server).')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes converting large batches, 0 for '
+                        'one per CPU (default: 1, in process)')
+    parser.add_argument('--preload', default='en',
+                        help='comma separated languages to warm up')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_MAXSIZE,
+                        help='result cache entries, 0 to disable')
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error('--workers must be a positive number or 0')
+    preload = [lang for lang in args.preload.split(',') if lang]
+    unknown = [lang for lang in preload
+               if CONVERTER_CLASSES.resolve(lang) is None]
+    if unknown:
+        parser.error('unsupported language: %s' % ', '.join(unknown))
+
+    server = make_server(args.host, args.port, args.workers, preload,
+                         args.cache_size)
+    sys.stderr.write('Serving on http://%s:%d\n' % server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
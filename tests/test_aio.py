@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import sys
+import threading
+from unittest import TestCase, skipIf
+
+from num2words import (cache_clear, cache_info, disable_cache, enable_cache,
+                       num2words)
+
+# num2words.aio needs Python 3.7+, these tests avoid the async syntax so
+# that the module can still be collected by older interpreters.
+if sys.version_info >= (3, 7):
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    from num2words import aio
+
+    class CountingExecutor(ThreadPoolExecutor):
+        """Thread pool recording how many jobs were submitted at once."""
+
+        def __init__(self, *args, **kwargs):
+            super(CountingExecutor, self).__init__(*args, **kwargs)
+            self.lock = threading.Lock()
+            self.submitted = self.running = self.max_running = 0
+
+        def submit(self, *args, **kwargs):
+            with self.lock:
+                self.submitted += 1
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            future = super(CountingExecutor, self).submit(*args, **kwargs)
+            future.add_done_callback(self._done)
+            return future
+
+        def _done(self, future):
+            with self.lock:
+                self.running -= 1
+
+
+@skipIf(sys.version_info < (3, 7), 'num2words.aio needs Python 3.7+')
+class AsyncConverterTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.executor = CountingExecutor(max_workers=8)
+        self.converter = aio.AsyncConverter(self.executor, max_concurrency=2,
+                                            chunksize=10)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.loop.close()
+
+    def run_until_complete(self, *aws):
+        if len(aws) == 1:
+            return self.loop.run_until_complete(aws[0])
+        tasks = [self.loop.create_task(aw) for aw in aws]
+        return self.loop.run_until_complete(asyncio.gather(*tasks))
+
+    def test_convert(self):
+        result = self.run_until_complete(self.converter.convert(
+            10 ** 12 + 1, lang='fr', to='ordinal'))
+        self.assertEqual(result, num2words(10 ** 12 + 1, lang='fr',
+                                           to='ordinal'))
+        self.assertEqual(self.executor.submitted, 1)
+
+    def test_cheap_values_run_inline(self):
+        self.assertEqual(
+            self.run_until_complete(self.converter.convert(42),
+                                    self.converter.convert_many([1, 2])),
+            ['forty-two', ['one', 'two']])
+        self.assertEqual(self.executor.submitted, 0)
+
+    def test_cached_values_run_inline(self):
+        enable_cache()
+        try:
+            num2words(10 ** 9, lang='fr')
+            self.assertEqual(
+                self.run_until_complete(self.converter.convert(
+                    10 ** 9, lang='fr')), 'un milliard')
+            self.assertEqual(self.executor.submitted, 0)
+            self.assertEqual(cache_info().hits, 1)
+            self.run_until_complete(self.converter.convert(10 ** 9 + 1))
+            self.assertEqual(self.executor.submitted, 1)
+        finally:
+            disable_cache()
+            cache_clear()
+
+    def test_bounded_concurrency(self):
+        values = [10 ** 9 + n for n in range(100)]
+        results = self.run_until_complete(
+            self.converter.convert_many(values, lang='de'),
+            *[self.converter.convert(value) for value in values])
+        self.assertEqual(results[0], [num2words(v, lang='de')
+                                      for v in values])
+        self.assertEqual(results[1:], [num2words(v) for v in values])
+        self.assertEqual(self.executor.submitted, 110)
+        self.assertLessEqual(self.executor.max_running, 2)
+
+    def test_errors(self):
+        self.assertEqual(
+            self.run_until_complete(self.converter.convert_many(
+                [10 ** 6, 'x'], errors='replace', default='?')),
+            ['one million', '?'])
+        with self.assertRaises(NotImplementedError):
+            self.run_until_complete(
+                self.converter.convert_many([10 ** 6], lang='lalala'))
+
+    def test_cancellation(self):
+        values = [10 ** 9 + n for n in range(1000)]
+        task = self.loop.create_task(self.converter.convert_many(values))
+        self.run_until_complete(asyncio.sleep(0))
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_until_complete(task)
+        self.assertLess(self.executor.submitted, 100)
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            converter = aio.AsyncConverter(executor, chunksize=5)
+            result = self.run_until_complete(converter.convert_many(
+                range(2000, 2020), lang='en', to='year'))
+        self.assertEqual(result, [num2words(v, to='year')
+                                  for v in range(2000, 2020)])
+
+    def test_module_functions(self):
+        old = aio._default_converter
+        try:
+            converter = aio.configure(self.executor, max_concurrency=1)
+            self.assertIs(aio._default_converter, converter)
+            self.assertEqual(
+                self.run_until_complete(aio.anum2words(10 ** 6)),
+                'one million')
+            self.assertEqual(
+                self.run_until_complete(
+                    aio.anum2words_many([10 ** 6], lang='es')),
+                ['un millón'])
+            self.assertEqual(self.executor.submitted, 2)
+        finally:
+            aio._default_converter = old
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+from unittest import TestCase, skipIf
+
+from num2words import num2words
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+else:
+    from num2words.arrays import get_engine, num2words_array
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class Num2WordsArrayTest(TestCase):
+    def assert_parity(self, values, lang, **kwargs):
+        result = num2words_array(values, lang=lang, **kwargs)
+        self.assertEqual(result.shape, values.shape)
+        self.assertEqual(result.dtype, object)
+        expected = [num2words(v, lang=lang, **kwargs)
+                    for v in values.ravel().tolist()]
+        self.assertEqual(result.ravel().tolist(), expected)
+
+    def test_group_engines(self):
+        rng = numpy.random.RandomState(0)
+        values = numpy.concatenate([
+            numpy.arange(-150, 1100),
+            numpy.arange(9990, 10200),
+            rng.randint(-10 ** 18, 10 ** 18, 500, dtype=numpy.int64),
+            10 ** numpy.arange(19, dtype=numpy.int64),
+            numpy.array([numpy.iinfo(numpy.int64).min,
+                         numpy.iinfo(numpy.int64).max]),
+        ])
+        for lang in ('en', 'ja', 'ko'):
+            self.assertIsNotNone(get_engine(lang))
+            self.assert_parity(values, lang)
+
+    def test_unsigned(self):
+        values = numpy.array([0, 5, 2 ** 64 - 1], dtype=numpy.uint64)
+        self.assertEqual(num2words_array(values).tolist()[:2],
+                         ['zero', 'five'])
+        self.assertEqual(num2words_array(values)[2],
+                         num2words(2 ** 64 - 1))
+
+    def test_floats(self):
+        values = numpy.array([0.0, 1.5, -2.0, 12.34, 1e20, 3.0])
+        for lang in ('en', 'ja', 'fr'):
+            self.assert_parity(values, lang)
+
+    def test_fallback(self):
+        values = numpy.array([[1, 22], [333, 1]])
+        self.assertIsNone(get_engine('fr'))
+        self.assert_parity(values, 'fr')
+        self.assert_parity(values, 'en', to='ordinal')
+        self.assert_parity(values, 'ja', reading=True)
+        self.assert_parity(values, 'en_IN')
+
+    def test_empty(self):
+        self.assertEqual(num2words_array(numpy.array([], dtype=int)).shape,
+                         (0,))
+
+    def test_errors(self):
+        with self.assertRaises(NotImplementedError):
+            num2words_array(numpy.array([1]), lang='lalala')
+        with self.assertRaises(OverflowError):
+            num2words_array(numpy.array([10 ** 400], dtype=object))
@@ -17,10 +17,14 @@
 
 from __future__ import unicode_literals
 
+import random
+from collections import OrderedDict
 from decimal import Decimal
 from unittest import TestCase
 
-from num2words.base import Num2Word_Base
+from num2words import CONVERTER_CLASSES, num2words
+from num2words.base import CardIndex, Num2Word_Base, SpellTable, compact_cards
+from num2words.lang_EN import Num2Word_EN
 
 
 class Num2WordBaseTest(TestCase):
@@ -58,3 +62,245 @@ class Num2WordBaseTest(TestCase):
             self.base.title("one"),
             "One"
             )
+
+    def test_float_does_not_change_precision(self):
+        from num2words.lang_EN import Num2Word_EN
+        converter = Num2Word_EN()
+        self.assertEqual(converter.to_cardinal(1.234),
+                         "one point two three four")
+        self.assertEqual(converter.precision, 2)
+        self.assertEqual(converter.float2tuple(12.5, 2), (12, 50))
+
+
+def sample_values(maxval, count=40):
+    # Values beyond 40 digits only add more of the same groups, but both
+    # code paths are slow on them: only maxval - 1 is checked up there.
+    rng = random.Random(maxval)
+    values = list(range(120)) + [999, 1000, 1001, 1999, 2000, 10001]
+    power = 10 ** 4
+    while power < min(maxval, 10 ** 40):
+        values.extend([power - 1, power, power * 21 + 7])
+        power *= 1000
+    digits = min(len(str(maxval)), 40)
+    values.extend(rng.randrange(10 ** rng.randrange(1, digits))
+                  for _ in range(count))
+    values.append(maxval - 1)
+    return [v for v in values if v < maxval]
+
+
+def uses_merge(converter):
+    """Whether ``converter`` spells numbers with splitnum/clean/merge."""
+    def func(method):
+        return getattr(method, '__func__', method)
+    return (hasattr(converter, 'cards') and
+            func(type(converter).merge) is not func(Num2Word_Base.merge))
+
+
+def scan_cards(cards, value):
+    for elem in cards:
+        if elem <= value:
+            return elem
+
+
+class CardIndexTest(TestCase):
+    def test_matches_scan(self):
+        tables = [(lang, CONVERTER_CLASSES[lang].cards)
+                  for lang in CONVERTER_CLASSES
+                  if hasattr(CONVERTER_CLASSES[lang], 'cards')]
+        tables.append(('fi ords', CONVERTER_CLASSES['fi'].ords))
+        for name, cards in tables:
+            index = CardIndex(cards)
+            values = set([-1, 0, 1, 7, 42, 999])
+            for key in cards:
+                values.update([key - 1, key, key + 1, key * 5 + 3])
+            for value in values:
+                self.assertEqual(index.find(value), scan_cards(cards, value),
+                                 '%s: %d' % (name, value))
+
+    def test_table_order(self):
+        cards = OrderedDict([(100, 'c'), (1000, 'm'), (10, 'x'), (1, 'i'),
+                             (50, 'l')])
+        index = CardIndex(cards)
+        for value in range(2000):
+            self.assertEqual(index.find(value), scan_cards(cards, value))
+        self.assertIsNone(index.find(0))
+
+    def test_rebuilt_when_table_changes(self):
+        converter = Num2Word_EN()
+        cards = OrderedDict([(1000, 'thousand'), (100, 'hundred')])
+        self.assertEqual(converter.find_card(999, cards), 100)
+        self.assertIsNone(converter.find_card(5, cards))
+        cards[1] = 'one'
+        self.assertEqual(converter.find_card(5, cards), 1)
+        self.assertEqual(converter.find_card(10 ** 6 + 1), 10 ** 6)
+
+
+class SpellIntTest(TestCase):
+    def assertSameWords(self, converter, legacy, fast, maxval):
+        for value in sample_values(maxval):
+            self.assertEqual(fast(value), legacy(value),
+                             '%s: %d' % (type(converter).__name__, value))
+
+    def test_matches_splitnum_and_clean(self):
+        for lang in CONVERTER_CLASSES:
+            converter = CONVERTER_CLASSES[lang]
+            if not uses_merge(converter) or lang in ('fi', 'ja'):
+                continue
+            self.assertSameWords(
+                converter,
+                lambda v: converter.clean(converter.splitnum(v)),
+                converter.spell_int, converter.MAXVAL)
+
+    def test_matches_fi_options(self):
+        from num2words.lang_FI import NAME_TO_CASE, Options
+
+        converter = CONVERTER_CLASSES['fi']
+        for ordinal in (False, True):
+            for case in ('nominative', 'genitive', 'inessive'):
+                options = Options(ordinal, NAME_TO_CASE[case], True, None)
+                self.assertSameWords(
+                    converter,
+                    lambda v: converter.clean(
+                        converter.splitnum(v, options), options),
+                    lambda v: converter.spell_int(
+                        v, converter.ords if ordinal else converter.cards,
+                        args=(options,)),
+                    converter.MAXVAL)
+
+    def test_matches_ja_readings(self):
+        from num2words.lang_JA import select_text
+
+        converter = CONVERTER_CLASSES['ja']
+        for reading, prefer in ((False, None), (True, None),
+                                (True, ['よん', 'なな'])):
+            self.assertSameWords(
+                converter,
+                lambda v: converter.clean(
+                    converter.splitnum(v, reading, prefer)),
+                lambda v: converter.spell_int(
+                    v, text=lambda elem: select_text(
+                        converter.cards[elem], reading, prefer)),
+                converter.MAXVAL)
+
+    def test_largest_values(self):
+        converter = CONVERTER_CLASSES['en']
+        value = converter.MAXVAL - 1
+        words = converter.to_cardinal(value)
+        self.assertEqual(words.count('thousand'), 1)
+        # One comma separated part per group of three digits
+        self.assertEqual(len(words.split(',')), (len(str(value)) + 2) // 3)
+
+
+class SpellTableTest(TestCase):
+    def assertTableMatches(self, converter, table, spell):
+        self.assertEqual(len(table), converter.CARDINAL_TABLE_SIZE)
+        for value, text in enumerate(table):
+            pair = (text, table.nums.get(value, value))
+            self.assertEqual(pair, spell(value),
+                             '%s: %d' % (type(converter).__name__, value))
+
+    def test_every_entry(self):
+        for lang in CONVERTER_CLASSES:
+            converter = CONVERTER_CLASSES[lang]
+            if not uses_merge(converter) or lang in ('fi', 'ja'):
+                continue
+            self.assertTableMatches(converter, converter.spell_table(),
+                                    converter.spell_int)
+
+    def test_ja_readings(self):
+        from num2words.lang_JA import select_text
+
+        converter = CONVERTER_CLASSES['ja']
+        self.assertEqual(converter.CARDINAL_TABLE_SIZE, 10000)
+        for reading in (False, True):
+            def text(elem):
+                return select_text(converter.cards[elem], reading)
+
+            converter.to_cardinal(1, reading=reading)
+            self.assertTableMatches(
+                converter, converter.spell_table(('cardinal', reading)),
+                lambda v: converter.spell_int(v, text=text))
+
+    def test_composed_from_table(self):
+        for lang in ('en', 'fr', 'de', 'es', 'nl', 'ko', 'ro'):
+            converter = CONVERTER_CLASSES[lang]
+            table = converter.spell_table()
+            for value in sample_values(converter.MAXVAL):
+                self.assertEqual(converter.spell_int(value, table=table),
+                                 converter.spell_int(value))
+
+    def test_non_int_values_skip_table(self):
+        converter = CONVERTER_CLASSES['en']
+        self.assertEqual(converter.to_cardinal(42.0), 'forty-two')
+        self.assertEqual(converter.to_cardinal(Decimal(1042)),
+                         'one thousand and forty-two')
+        self.assertEqual(converter.to_cardinal(-7), 'minus seven')
+
+    def test_nums_kept_when_not_the_index(self):
+        table = SpellTable()
+        for pair in [('zero', 0), ('one', 1), ('one hundred', 100)]:
+            table.add(pair)
+        self.assertEqual(table, ['zero', 'one', 'one hundred'])
+        self.assertEqual(table.nums, {2: 100})
+        self.assertEqual(CONVERTER_CLASSES['en'].spell_table().nums, {})
+        self.assertTrue(CONVERTER_CLASSES['ro'].spell_table().nums)
+
+
+class CompactCardsTest(TestCase):
+    def test_shared_between_converters(self):
+        first, second = Num2Word_EN(), CONVERTER_CLASSES['fr']
+        key = 10 ** 6
+        self.assertIs(first.cards[key], second.cards[key])
+        self.assertIs([k for k in first.cards if k == key][0],
+                      [k for k in second.cards if k == key][0])
+
+    def test_keeps_order_and_tuples(self):
+        cards = OrderedDict([(10 ** 9, ('mil' + 'jardi', 5)), (1, 'yksi')])
+        compact = compact_cards(cards)
+        self.assertEqual(compact, cards)
+        self.assertEqual(list(compact), list(cards))
+        self.assertIs(compact[10 ** 9][0],
+                      compact_cards({1: 'miljardi'})[1])
+
+
+class SplitFractionTest(TestCase):
+    def setUp(self):
+        self.converter = CONVERTER_CLASSES['en']
+
+    def test_digits_are_exact(self):
+        split = self.converter.split_fraction
+        self.assertEqual(split(Decimal('123.4500001')),
+                         (123, (4, 5, 0, 0, 0, 0, 1)))
+        self.assertEqual(split(Decimal('0.12345678901234567890123')),
+                         (0, tuple(int(d) for d in '12345678901234567890123')))
+        self.assertEqual(split(12345678.123456789),
+                         (12345678, (1, 2, 3, 4, 5, 6, 7, 9)))
+        self.assertEqual(split(1e-05), (0, (0, 0, 0, 0, 1)))
+        self.assertEqual(split(-2.5), (-2, (5,)))
+        self.assertEqual(split(Decimal('1E+3')), (1000, ()))
+
+    def test_trailing_zeros(self):
+        split = self.converter.split_fraction
+        self.assertEqual(split(Decimal('1.500')), (1, (5,)))
+        self.assertEqual(split(Decimal('1.500'), True), (1, (5, 0, 0)))
+        self.assertEqual(split(Decimal('2.000'), True), (2, (0, 0, 0)))
+        self.assertEqual(num2words('3.140', trailing_zeros=True),
+                         'three point one four zero')
+        self.assertEqual(num2words(Decimal('1.0'), trailing_zeros=True),
+                         'one point zero')
+        self.assertEqual(num2words(Decimal('1.0')), 'one')
+        self.assertEqual(num2words('1.50', lang='ja', trailing_zeros=True),
+                         '一点五零')
+
+    def test_float2tuple_truncates(self):
+        self.assertEqual(self.converter.float2tuple(1.239999999),
+                         (1, 239999999))
+        self.assertEqual(self.converter.float2tuple(1.239999999, 2), (1, 23))
+        self.assertEqual(self.converter.float2tuple(Decimal('7.05'), 4),
+                         (7, 500))
+
+    def test_special_values(self):
+        self.assertRaises(ValueError, self.converter.to_cardinal,
+                          float('nan'))
+        self.assertRaises(OverflowError, self.converter.to_cardinal,
+                          float('inf'))
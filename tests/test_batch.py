@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import itertools
+from decimal import Decimal
+from unittest import TestCase
+
+from num2words import (CONVERTER_CLASSES, iter_num2words, num2words,
+                       num2words_many)
+
+
+class Num2WordsManyTest(TestCase):
+    def test_matches_num2words(self):
+        values = [0, 1, 42, -7, 1.5, 1000001, '12.5', Decimal('3.14')]
+        for lang in ('en', 'fr', 'de', 'ja'):
+            self.assertEqual(
+                num2words_many(values, lang=lang),
+                [num2words(v, lang=lang) for v in values]
+            )
+        self.assertEqual(
+            num2words_many([1, 2, 3], lang='en', to='ordinal'),
+            ['first', 'second', 'third']
+        )
+
+    def test_kwargs(self):
+        self.assertEqual(
+            num2words_many([1.5, 2], lang='en', to='currency',
+                           currency='USD'),
+            ['one dollar, fifty cents', 'zero dollars, two cents']
+        )
+
+    def test_lang_fallback(self):
+        self.assertEqual(num2words_many([2], lang='fr_FR'), ['deux'])
+
+    def test_dedupe_keeps_types_apart(self):
+        # integers are cents for currency, floats are not
+        self.assertEqual(
+            num2words_many([150, 150.0, 150], to='currency'),
+            ['one euro, fifty cents', 'one hundred and fifty euro, zero cents',
+             'one euro, fifty cents']
+        )
+
+    def test_dedupe_converts_once(self):
+        calls = []
+        converter = CONVERTER_CLASSES['en']
+
+        class Counting(type(converter)):
+            def to_cardinal(self, value):
+                calls.append(value)
+                return super(Counting, self).to_cardinal(value)
+
+        CONVERTER_CLASSES['xx'] = Counting()
+        try:
+            self.assertEqual(num2words_many([5, 6, 5, 5, 6], lang='xx'),
+                             ['five', 'six', 'five', 'five', 'six'])
+        finally:
+            del CONVERTER_CLASSES['xx']
+        self.assertEqual(calls, [5, 6])
+
+    def test_errors(self):
+        values = [1, 'abc', 2, None]
+        with self.assertRaises(Exception):
+            num2words_many(values)
+        self.assertEqual(num2words_many(values, errors='skip'),
+                         ['one', 'two'])
+        self.assertEqual(num2words_many(values, errors='replace'),
+                         ['one', None, 'two', None])
+        self.assertEqual(
+            num2words_many(values, errors='replace', default='?'),
+            ['one', '?', 'two', '?']
+        )
+        with self.assertRaises(ValueError):
+            num2words_many(values, errors='ignore')
+
+    def test_unhashable_values(self):
+        self.assertEqual(
+            num2words_many([[1], 3], errors='replace', default=''),
+            ['', 'three']
+        )
+
+    def test_not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], lang='lalala')
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], to='lalala')
+
+    def test_generator_input(self):
+        self.assertEqual(num2words_many(n for n in range(3)),
+                         ['zero', 'one', 'two'])
+
+
+class IterNum2WordsTest(TestCase):
+    def test_matches_num2words(self):
+        values = [0, 1, 42, -7, 1.5, 10 ** 6, 42, '12.5', Decimal('3.14')]
+        expected = [num2words(v, lang='de') for v in values]
+        for chunksize in (None, 1, 4, 100):
+            result = iter_num2words(iter(values), lang='de',
+                                    chunksize=chunksize)
+            self.assertFalse(isinstance(result, list))
+            self.assertEqual(list(result), expected)
+
+    def test_lazy(self):
+        def values():
+            yield 1
+            yield 2
+            raise AssertionError("read too far")
+
+        for chunksize in (None, 1):
+            stream = iter_num2words(values(), chunksize=chunksize)
+            self.assertEqual(next(stream), 'one')
+            self.assertEqual(next(stream), 'two')
+
+    def test_unbounded(self):
+        stream = iter_num2words(itertools.count(), lang='en', chunksize=64)
+        self.assertEqual(list(itertools.islice(stream, 1000, 1002)),
+                         ['one thousand', 'one thousand and one'])
+
+    def test_errors(self):
+        values = [1, 'abc', [2], 2]
+        for chunksize in (None, 2):
+            self.assertEqual(
+                list(iter_num2words(values, errors='skip',
+                                    chunksize=chunksize)),
+                ['one', 'two'])
+            self.assertEqual(
+                list(iter_num2words(values, errors='replace', default='',
+                                    chunksize=chunksize)),
+                ['one', '', '', 'two'])
+            with self.assertRaises(Exception):
+                list(iter_num2words(values, chunksize=chunksize))
+
+    def test_validates_eagerly(self):
+        with self.assertRaises(NotImplementedError):
+            iter_num2words([1], lang='lalala')
+        with self.assertRaises(ValueError):
+            iter_num2words([1], errors='ignore')
+
+    def test_kwargs(self):
+        self.assertEqual(
+            list(iter_num2words([1, 2], lang='ja', to='ordinal',
+                                reading=True)),
+            [num2words(1, lang='ja', to='ordinal', reading=True),
+             num2words(2, lang='ja', to='ordinal', reading=True)])
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from decimal import Decimal
+from unittest import TestCase
+
+import num2words
+from num2words import (_value_key, cache, cache_clear, cache_info,
+                       disable_cache, enable_cache)
+from num2words import num2words as n2w
+from num2words.cache import (DEFAULT_MAXSIZE, CacheInfo, DbmCache, LRUCache,
+                             SqliteCache, open_backend)
+from num2words.lang_EN import Num2Word_EN
+
+
+class LRUCacheTest(TestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.info(), CacheInfo(3, 1, 2, 2))
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 2, 0))
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def test_threads(self):
+        cache = LRUCache(50)
+
+        def work(offset):
+            for i in range(2000):
+                key = (i + offset) % 100
+                if cache.get(key) is None:
+                    cache.set(key, str(key))
+
+        threads = [threading.Thread(target=work, args=(n * 7,))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 16000)
+        self.assertEqual(info.currsize, 50)
+
+
+class ResultCacheTest(TestCase):
+    def setUp(self):
+        cache_clear()
+
+    def tearDown(self):
+        enable_cache(DEFAULT_MAXSIZE)
+        disable_cache()
+        cache_clear()
+
+    def test_disabled_by_default(self):
+        self.assertEqual(n2w(42), 'forty-two')
+        self.assertEqual(cache_info(), CacheInfo(0, 0, DEFAULT_MAXSIZE, 0))
+
+    def test_per_call(self):
+        self.assertEqual(n2w(42, cache=True), 'forty-two')
+        self.assertEqual(n2w(42, cache=True), 'forty-two')
+        self.assertEqual(n2w(42), 'forty-two')
+        self.assertEqual(cache_info().hits, 1)
+        self.assertEqual(cache_info().misses, 1)
+
+    def test_enabled_globally(self):
+        enable_cache(maxsize=2)
+        for value in (1, 2, 1, 3, 2):
+            n2w(value, lang='fr')
+        self.assertEqual(cache_info(), CacheInfo(1, 4, 2, 2))
+        n2w(3, lang='fr', cache=False)
+        self.assertEqual(cache_info(), CacheInfo(1, 4, 2, 2))
+        disable_cache()
+        n2w(3, lang='fr')
+        self.assertEqual(cache_info().hits, 1)
+
+    def test_keys(self):
+        enable_cache()
+        self.assertNotEqual(n2w(150, to='currency', currency='USD'),
+                            n2w(150.0, to='currency', currency='USD'))
+        self.assertEqual(n2w(150, to='currency', currency='USD'),
+                         n2w(150, to='currency', currency='USD',
+                             cache=False))
+        self.assertEqual(n2w(Decimal('1.5')), 'one point five')
+        self.assertEqual(n2w(1.5), 'one point five')
+        self.assertEqual(n2w(1, lang='de'), 'eins')
+        self.assertEqual(n2w(1, lang='de', to='ordinal'), 'erste')
+        self.assertEqual(n2w(1, lang='de', ordinal=True), 'erste')
+        self.assertEqual(n2w('1', lang='de'), 'eins')
+        self.assertEqual(n2w(True), 'one')
+        self.assertEqual(n2w(5, to='year'), 'five')
+        self.assertEqual(n2w(5, lang='en_IN'), 'five')
+        self.assertEqual(cache_info().hits, 2)
+
+    def test_value_keys(self):
+        self.assertNotEqual(_value_key(Decimal('1.0')),
+                            _value_key(Decimal('1.00')))
+        self.assertNotEqual(_value_key(0.0), _value_key(-0.0))
+        self.assertNotEqual(_value_key(1), _value_key(1.0))
+        self.assertNotEqual(_value_key(1), _value_key(True))
+        self.assertEqual(_value_key(float('nan')), _value_key(float('nan')))
+
+    def test_unhashable_arguments(self):
+        enable_cache()
+        self.assertEqual(n2w(4, lang='ja', reading=True, prefer=['よん']),
+                         'よん')
+        self.assertEqual(n2w(4, lang='ja', reading=True, prefer=['し']),
+                         'し')
+        self.assertEqual(cache_info(), CacheInfo(0, 0, DEFAULT_MAXSIZE, 0))
+
+    def test_replaced_converter(self):
+        enable_cache()
+        self.assertEqual(n2w(7, lang='en_IN'), 'seven')
+        registry = num2words.CONVERTER_CLASSES
+        original = registry['en_IN']
+
+        class Shouting(Num2Word_EN):
+            def to_cardinal(self, value):
+                return super(Shouting, self).to_cardinal(value).upper()
+
+        registry['en_IN'] = Shouting()
+        try:
+            self.assertEqual(n2w(7, lang='en_IN'), 'SEVEN')
+        finally:
+            registry['en_IN'] = original
+
+
+class PersistentCacheTest(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.converter = num2words.CONVERTER_CLASSES['en']
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def key(self, value, to='cardinal', **kwargs):
+        return num2words._cache_key(self.converter, to, value, kwargs)
+
+    def check_backend(self, open_cache):
+        backend = open_cache('v1')
+        backend.set(self.key(1), 'one')
+        backend.set(self.key(1.0), 'one point zero')
+        backend.set(self.key(1, to='ordinal_num'), 1)
+        backend.set(self.key(2), object())
+        self.assertEqual(backend.get(self.key(1)), 'one')
+        self.assertEqual(backend.get(self.key(1.0)), 'one point zero')
+        self.assertEqual(backend.get(self.key(1, to='ordinal_num')), 1)
+        self.assertIsNone(backend.get(self.key(2)))
+        self.assertEqual(backend.get(self.key(3), '?', False), '?')
+        self.assertEqual(backend.info(), CacheInfo(3, 1, None, 3))
+        backend.close()
+
+        backend = open_cache('v1')
+        self.assertEqual(backend.get(self.key(1)), 'one')
+        backend.close()
+
+        backend = open_cache('v2')
+        self.assertIsNone(backend.get(self.key(1)))
+        backend.set(self.key(1), 'one')
+        backend.clear()
+        self.assertEqual(backend.info(), CacheInfo(0, 0, None, 0))
+        backend.close()
+
+    def test_dbm(self):
+        path = os.path.join(self.dir, 'cache')
+        self.check_backend(lambda namespace: DbmCache(path, namespace))
+
+    def test_sqlite(self):
+        path = os.path.join(self.dir, 'cache.sqlite')
+        self.check_backend(lambda namespace: SqliteCache(path, namespace))
+
+    def test_sqlite_batches_and_prunes(self):
+        path = os.path.join(self.dir, 'cache.sqlite')
+
+        def stored():
+            with sqlite3.connect(path) as db:
+                return db.execute('SELECT namespace, COUNT(*) FROM results '
+                                  'GROUP BY namespace').fetchall()
+
+        backend = SqliteCache(path, 'v1', batch_size=3)
+        self.assertEqual(backend.get(self.key(0), '?'), '?')
+        backend.set(self.key(1), 'one')
+        backend.set(self.key(2), 'two')
+        self.assertEqual(backend.get(self.key(2)), 'two')
+        self.assertEqual(stored(), [])
+        backend.set(self.key(3), 'three')
+        self.assertEqual(stored(), [('v1', 3)])
+        backend.set(self.key(4), 'four')
+        backend.flush()
+        self.assertEqual(stored(), [('v1', 4)])
+        self.assertEqual(
+            backend._db.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        backend.close()
+
+        SqliteCache(path, 'v2').close()
+        self.assertEqual(stored(), [])
+
+    def test_default_namespace(self):
+        backend = SqliteCache(os.path.join(self.dir, 'cache.sqlite'))
+        self.assertEqual(backend.namespace,
+                         'num2words-%s' % num2words.__version__)
+        backend.close()
+
+    def test_open_backend(self):
+        self.assertEqual(open_backend('memory').maxsize, DEFAULT_MAXSIZE)
+        self.assertEqual(open_backend('memory:10').maxsize, 10)
+        backend = open_backend('sqlite:' + os.path.join(self.dir, 'db'))
+        self.assertIsInstance(backend, SqliteCache)
+        backend.close()
+        backend = open_backend('dbm:' + os.path.join(self.dir, 'dbm'))
+        self.assertIsInstance(backend, DbmCache)
+        backend.close()
+        for spec in ('', 'sqlite', 'redis:localhost'):
+            with self.assertRaises(ValueError):
+                open_backend(spec)
+
+    def test_num2words_backend(self):
+        path = os.path.join(self.dir, 'cache.sqlite')
+        environ = dict(os.environ)
+        os.environ[cache.CACHE_ENV] = 'sqlite:' + path
+        try:
+            cache.enable_cache_from_env()
+            self.assertIsInstance(cache.get_backend(), SqliteCache)
+            self.assertEqual(n2w(10 ** 6, lang='fr'), 'un million')
+            enable_cache(backend=SqliteCache(path))
+            self.assertEqual(n2w(10 ** 6, lang='fr'), 'un million')
+            self.assertEqual(cache_info().hits, 1)
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+            enable_cache(backend=LRUCache())
+            disable_cache()
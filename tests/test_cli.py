@@ -19,11 +19,15 @@
 from __future__ import unicode_literals
 
 import os
+import subprocess
+import sys
 import unittest
+from unittest import skipIf
 
 import delegator
 
 import num2words
+from num2words.cli import UsageError, parse_args
 
 
 class CliCaller(object):
@@ -38,6 +42,17 @@ class CliCaller(object):
         cmd = " ".join(cmd_list)
         return delegator.run(cmd)
 
+    def run_stdin(self, text, *args):
+        """Run the app feeding ``text`` on its standard input and return
+        (status, stdout, stderr) as text."""
+        process = subprocess.Popen(
+            [sys.executable, self.cmd] + [str(arg) for arg in args],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE)
+        out, err = process.communicate(text.encode('utf-8'))
+        return (process.returncode, out.decode('utf-8'),
+                err.decode('utf-8'))
+
 
 class CliTestCase(unittest.TestCase):
     """Test the command line app"""
@@ -47,7 +62,7 @@ class CliTestCase(unittest.TestCase):
 
     def test_cli_help(self):
         """num2words without arguments should exit with status 1
-        and show docopt's default short usage message
+        and show the short usage message
         """
         output = self.cli.run_cmd()
         self.assertEqual(output.return_code, 1)
@@ -111,3 +126,155 @@ class CliTestCase(unittest.TestCase):
              output.out).strip(),
             "ciento cincuenta euros con cincuenta y cinco céntimos"
         )
+
+    def test_cli_stdin(self):
+        """--stdin converts one number per line, skipping blank lines
+        """
+        status, out, err = self.cli.run_stdin(
+            '1\n\n 2.5 \n150\n', '--stdin', '-l', 'es')
+        self.assertEqual(status, 0)
+        self.assertEqual(out.split(os.linesep),
+                         ['uno', 'dos punto cinco', 'ciento cincuenta', ''])
+        self.assertEqual(err, '')
+
+    def test_cli_stdin_errors(self):
+        """Failing lines are reported with their number, the others are
+        still converted
+        """
+        status, out, err = self.cli.run_stdin(
+            '1\nabc\n3\n', '--stdin', '--to', 'ordinal')
+        self.assertEqual(status, 1)
+        self.assertEqual(out.split(os.linesep), ['first', 'third', ''])
+        self.assertEqual(err.strip(), 'line 2: abc: not a number')
+
+    def test_cli_stdin_unsupported(self):
+        """An unknown language fails once, without the usage message
+        """
+        status, out, err = self.cli.run_stdin('1\n', '--stdin', '-l', 'xx')
+        self.assertEqual(status, 1)
+        self.assertEqual(out, '')
+        self.assertEqual(err.strip(),
+                         'unsupported language or converter: xx cardinal')
+
+    @skipIf(sys.version_info < (3, 7), '--jobs needs Python 3.7+')
+    def test_cli_stdin_jobs(self):
+        """--jobs converts on worker processes in input order
+        """
+        numbers = [str(number) for number in range(2500)]
+        status, out, err = self.cli.run_stdin(
+            '\n'.join(numbers[:1200] + ['x'] + numbers[1200:]),
+            '--stdin', '--jobs', '2', '-l', 'fr')
+        self.assertEqual(status, 1)
+        self.assertEqual(out.split(os.linesep)[:-1],
+                         [num2words.num2words(number, lang='fr')
+                          for number in range(2500)])
+        self.assertEqual(err.strip(), 'line 1201: x: not a number')
+
+    def test_cli_stdin_bad_jobs(self):
+        """--jobs must be a number of processes
+        """
+        status, out, err = self.cli.run_stdin('1\n', '--stdin', '-j', '-2')
+        self.assertEqual(status, 1)
+        self.assertEqual(out, '')
+        self.assertTrue(err.startswith('--jobs must be'))
+
+    def test_cli_csv(self):
+        """--format csv writes the words of a column to another one
+        """
+        status, out, err = self.cli.run_stdin(
+            'id,amount\n1,12.50\n2,abc\n3\n', '--format', 'csv',
+            '--column', 'amount', '--into', 'words', '--to', 'currency',
+            '--currency', 'USD')
+        self.assertEqual(status, 1)
+        self.assertEqual(out.split(os.linesep), [
+            'id,amount,words',
+            '1,12.50,"twelve dollars, fifty cents"',
+            '2,abc,',
+            '3,,',
+            ''])
+        self.assertEqual(err.strip(), 'line 3: abc: not a number')
+
+    def test_cli_csv_replace(self):
+        """By default the numbers are replaced by their words
+        """
+        status, out, err = self.cli.run_stdin(
+            'n,x\n7,a\n', '-f', 'csv', '--column', 'n', '-l', 'fr')
+        self.assertEqual(status, 0)
+        self.assertEqual(out.split(os.linesep), ['n,x', 'sept,a', ''])
+
+    def test_cli_csv_missing_column(self):
+        status, out, err = self.cli.run_stdin(
+            'n,x\n7,a\n', '-f', 'csv', '--column', 'amount')
+        self.assertEqual(status, 1)
+        self.assertEqual(out, '')
+        self.assertEqual(err.strip(), 'no column amount')
+
+    def test_cli_ndjson(self):
+        """--format ndjson sets the words of a field in each record
+        """
+        status, out, err = self.cli.run_stdin(
+            '{"a": 12.5}\n{"a": "7", "b": 1}\nnope\n{"b": 2}\n',
+            '-f', 'ndjson', '--field', 'a', '--into', 'w', '-l', 'de')
+        self.assertEqual(status, 1)
+        self.assertEqual(out.split(os.linesep), [
+            '{"a": 12.5, "w": "zwölf Komma fünf"}',
+            '{"a": "7", "b": 1, "w": "sieben"}',
+            '{"b": 2, "w": null}',
+            ''])
+        self.assertEqual(err.strip().split(os.linesep), [
+            'line 3: not a JSON object', 'line 4: no field a'])
+
+    def test_cli_negative_number(self):
+        """A negative number is not taken for an option
+        """
+        output = self.cli.run_cmd(-5, '-l', 'fr')
+        self.assertEqual(output.return_code, 0)
+        self.assertEqual(output.out.strip(), "moins cinq")
+
+    def test_cli_imports_requested_language_only(self):
+        """Converting a number only imports the module of its language,
+        listing the languages imports none
+        """
+        code = ("import sys; from num2words.cli import main; main({}); "
+                "print(sorted(m for m in sys.modules "
+                "if m.startswith('num2words.lang_')))")
+        output = subprocess.check_output(
+            [sys.executable, '-c', code.format("['42', '-l', 'fr']")])
+        self.assertEqual(output.decode('utf-8').splitlines()[-1],
+                         "['num2words.lang_EU', 'num2words.lang_FR']")
+        output = subprocess.check_output(
+            [sys.executable, '-c', code.format("['-L']")])
+        self.assertEqual(output.decode('utf-8').splitlines()[-1], "[]")
+
+
+class ParseArgsTest(unittest.TestCase):
+
+    def test_defaults(self):
+        args = parse_args(['42'])
+        self.assertEqual(args['<number>'], '42')
+        self.assertEqual(args['--lang'], 'en')
+        self.assertEqual(args['--to'], 'cardinal')
+        self.assertEqual(args['--jobs'], '1')
+        self.assertEqual(args['--format'], 'lines')
+        self.assertIsNone(args['--currency'])
+        self.assertFalse(args['--stdin'])
+
+    def test_option_forms(self):
+        args = parse_args(['-lfr', '--to=ordinal', '--currency', 'USD',
+                           '-j', '0', '--stdin'])
+        self.assertEqual(args['--lang'], 'fr')
+        self.assertEqual(args['--to'], 'ordinal')
+        self.assertEqual(args['--currency'], 'USD')
+        self.assertEqual(args['--jobs'], '0')
+        self.assertTrue(args['--stdin'])
+        self.assertEqual(parse_args(['--', '-1.5'])['<number>'], '-1.5')
+        self.assertEqual(parse_args(['-f', 'csv'])['--format'], 'csv')
+        self.assertTrue(parse_args(['-L'])['--list-languages'])
+        self.assertTrue(parse_args(['--help', '42', '43'])['--help'])
+
+    def test_errors(self):
+        for argv in ([], ['1', '2'], ['--stdin', '1'], ['-L', '-C'],
+                     ['-x', '1'], ['--bogus', '1'], ['1', '--lang'],
+                     ['--stdin=yes']):
+            with self.assertRaises(UsageError):
+                parse_args(argv)
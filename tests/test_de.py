@@ -123,6 +123,18 @@ class Num2WordsDETest(TestCase):
             "zweiundsiebzig Milliarden neunhundert Millionen einhundertelf"
         )
 
+    def test_giant_ordinal(self):
+        self.assertEqual(
+            num2words(4500072900000111, ordinal=True, lang='de'),
+            "vier billiarden fünfhundert billionen zweiundsiebzig " +
+            "milliarden neunhundert millionen einhundertelfte"
+        )
+        self.assertEqual(
+            num2words(4500072001000000, ordinal=True, lang='de'),
+            "vier billiarden fünfhundert billionen " +
+            "zweiundsiebzig milliardenmillionste"
+        )
+
     def test_ordinal_num(self):
         self.assertEqual(num2words(7, to="ordinal_num", lang='de'), "7.")
         self.assertEqual(num2words(81, to="ordinal_num", lang='de'), "81.")
@@ -55,6 +55,13 @@ class Num2WordsENTest(TestCase):
             'one thousand and third'
         )
 
+    def test_giant_ordinal(self):
+        self.assertEqual(
+            num2words(4500072900000111, lang='en', to='ordinal'),
+            'four quadrillion, five hundred trillion, seventy-two billion, '
+            'nine hundred million, one hundred and eleventh'
+        )
+
     def test_ordinal_num(self):
         self.assertEqual(num2words(10, lang='en', to='ordinal_num'), '10th')
         self.assertEqual(num2words(21, lang='en', to='ordinal_num'), '21st')
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+from decimal import Decimal
+from unittest import TestCase
+
+from num2words import (CONVERTER_CLASSES, CONVERTES_TYPES, get_formatter,
+                       num2words)
+
+
+def words_or_error(function, value):
+    try:
+        return function(value)
+    except Exception as err:
+        return type(err)
+
+
+class GetFormatterTest(TestCase):
+    def test_matches_num2words(self):
+        values = [0, 1, 42, 1999, 1000001, 2.5, '12.5', Decimal('3.14')]
+        for lang in CONVERTER_CLASSES:
+            for to in CONVERTES_TYPES:
+                try:
+                    formatter = get_formatter(lang, to)
+                except AttributeError:
+                    # No such method, num2words() fails on every call
+                    self.assertRaises(AttributeError, num2words, 1,
+                                      lang=lang, to=to)
+                    continue
+                for value in values:
+                    self.assertEqual(
+                        words_or_error(formatter, value),
+                        words_or_error(
+                            lambda v: num2words(v, lang=lang, to=to), value),
+                        '%s %s %r' % (lang, to, value))
+
+    def test_options(self):
+        for lang, to, options in [
+                ('fi', 'cardinal', {'case': 'genitive'}),
+                ('fi', 'ordinal', {'case': 'inessive', 'plural': True}),
+                ('fi', 'cardinal', {'prefer': ['kymmenen']}),
+                ('ja', 'cardinal', {'reading': True}),
+                ('en', 'currency', {'currency': 'USD', 'cents': False}),
+                ('es', 'currency', {'currency': 'PEN'}),
+                ('en', 'year', {'suffix': 'AD'})]:
+            formatter = get_formatter(lang, to, **options)
+            for value in (1, 21, 1234):
+                self.assertEqual(formatter(value), num2words(
+                    value, lang=lang, to=to, **options))
+
+    def test_fi_float_case(self):
+        formatter = get_formatter('fi', case='genitive')
+        self.assertRaises(NotImplementedError, formatter, 1.5)
+        self.assertEqual(get_formatter('fi')(1.5), num2words(1.5, lang='fi'))
+
+    def test_checked_when_created(self):
+        self.assertRaises(NotImplementedError, get_formatter, 'xx')
+        self.assertRaises(NotImplementedError, get_formatter, 'en', 'foo')
+        self.assertRaises(TypeError, get_formatter, 'en', gender='f')
+        self.assertRaises(TypeError, get_formatter, 'fi', cas='genitive')
+        self.assertRaises(KeyError, get_formatter, 'fi', case='nowhere')
+        self.assertRaises(NotImplementedError, get_formatter, 'en',
+                          'currency', currency='XXX')
+        # Languages without a currency table accept any code
+        self.assertEqual(get_formatter('ar', 'currency', currency='EGP')(1),
+                         num2words(1, lang='ar', to='currency',
+                                   currency='EGP'))
+
+    def test_resolves_lang_codes(self):
+        self.assertEqual(get_formatter('fr-BE')(80),
+                         num2words(80, lang='fr_BE'))
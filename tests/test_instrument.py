@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+import num2words
+from num2words import CONVERTER_CLASSES, cache, instrument
+from num2words.base import Num2Word_Base
+from num2words.lang_EN import Num2Word_EN
+
+
+class InstrumentTest(TestCase):
+    def setUp(self):
+        instrument.reset()
+        instrument.enable()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+        num2words.disable_cache()
+        num2words.cache_clear()
+
+    def test_disable_restores_originals(self):
+        instrument.disable()
+        originals = (num2words.num2words, cache.get_cached,
+                     Num2Word_Base.to_cardinal, Num2Word_EN.to_ordinal)
+        instrument.enable()
+        self.assertTrue(instrument.enabled())
+        wrapped = (num2words.num2words, cache.get_cached,
+                   Num2Word_Base.to_cardinal, Num2Word_EN.to_ordinal)
+        for original, wrapper in zip(originals, wrapped):
+            self.assertIsNot(original, wrapper)
+        self.assertIn('_load', CONVERTER_CLASSES.__dict__)
+
+        instrument.disable()
+        self.assertFalse(instrument.enabled())
+        restored = (num2words.num2words, cache.get_cached,
+                    Num2Word_Base.to_cardinal, Num2Word_EN.to_ordinal)
+        for original, function in zip(originals, restored):
+            self.assertIs(original, function)
+        self.assertNotIn('_load', CONVERTER_CLASSES.__dict__)
+        self.assertNotIn('_instrumented', Num2Word_Base.__dict__)
+
+    def test_calls(self):
+        num2words.num2words(42)
+        num2words.num2words(42, lang='en-GB')
+        num2words.num2words(10 ** 7, lang='fr', to='ordinal')
+        num2words.num2words(1, ordinal=True)
+        with self.assertRaises(NotImplementedError):
+            num2words.num2words(1, lang='lalala')
+        data = instrument.snapshot()
+
+        self.assertEqual(data['num2words']['en']['cardinal']['count'], 2)
+        self.assertEqual(data['num2words']['en']['ordinal']['count'], 1)
+        self.assertEqual(data['num2words']['fr']['ordinal']['count'], 1)
+        self.assertEqual(data['errors'], {'unknown': {'cardinal': 1}})
+        self.assertEqual(data['magnitudes']['en']['cardinal'], {'3': 2})
+        self.assertEqual(data['magnitudes']['fr']['ordinal'], {'9': 1})
+        histogram = data['num2words']['en']['cardinal']
+        self.assertEqual(histogram['buckets'][-1], ('+Inf', 2))
+        self.assertGreater(histogram['sum'], 0)
+
+    def test_methods_count_outermost_call(self):
+        converter = CONVERTER_CLASSES['en']
+        converter.to_currency(12.5, currency='USD')
+        CONVERTER_CLASSES['en_IN'].to_cardinal(10 ** 5)
+        data = instrument.snapshot()['methods']
+        self.assertEqual(data['en'], {'currency': data['en']['currency']})
+        self.assertEqual(data['en']['currency']['count'], 1)
+        self.assertEqual(data['en_IN']['cardinal']['count'], 1)
+
+    def test_cache(self):
+        num2words.enable_cache()
+        for value in (1, 2, 1, 1):
+            num2words.num2words(value, lang='de')
+        self.assertEqual(instrument.snapshot()['cache'],
+                         {'de': {'cardinal': {'hit': 2, 'miss': 2}}})
+
+    def test_loaded_later(self):
+        converter = CONVERTER_CLASSES._load('lang_IT.Num2Word_IT')
+        self.assertTrue(hasattr(type(converter).to_cardinal, '__wrapped__'))
+        converter.to_cardinal(3)
+        self.assertEqual(
+            instrument.snapshot()['methods']['it']['cardinal']['count'], 1)
+
+    def test_magnitude(self):
+        self.assertEqual(instrument.magnitude(7), '1')
+        self.assertEqual(instrument.magnitude(-999.5), '3')
+        self.assertEqual(instrument.magnitude('1234567'), '9')
+        self.assertEqual(instrument.magnitude(10 ** 40), '+Inf')
+        self.assertEqual(instrument.magnitude('x'), 'nan')
+
+    def test_prometheus(self):
+        num2words.num2words(5, lang='es')
+        text = instrument.to_prometheus()
+        self.assertIn('# TYPE num2words_call_duration_seconds histogram\n',
+                      text)
+        self.assertIn('num2words_call_duration_seconds_bucket'
+                      '{lang="es",le="+Inf",to="cardinal"} 1\n', text)
+        self.assertIn('num2words_call_duration_seconds_count'
+                      '{lang="es",to="cardinal"} 1\n', text)
+        self.assertIn('num2words_converter_duration_seconds_count'
+                      '{lang="es",to="cardinal"} 1\n', text)
+        self.assertIn('num2words_input_magnitude_total'
+                      '{digits="1",lang="es",to="cardinal"} 1\n', text)
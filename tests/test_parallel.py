@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import sys
+from unittest import TestCase, skipIf
+
+from num2words import num2words
+
+if sys.version_info >= (3, 7):
+    from num2words.parallel import ParallelConverter, num2words_parallel
+
+
+@skipIf(sys.version_info < (3, 7), 'num2words.parallel needs Python 3.7+')
+class ParallelConverterTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParallelConverter(langs=['en', 'fr_FR'], max_workers=2,
+                                     chunksize=7)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_settings(self):
+        self.assertEqual(self.pool.langs, ['en', 'fr'])
+        self.assertEqual(self.pool.max_workers, 2)
+        self.assertEqual(self.pool.chunksize, 7)
+
+    def test_keeps_order(self):
+        values = list(range(-50, 150)) + [1.5, '12.25']
+        self.assertEqual(self.pool.convert(values, lang='fr'),
+                         [num2words(v, lang='fr') for v in values])
+
+    def test_stream(self):
+        stream = self.pool.imap(iter(range(1000)), lang='en', to='ordinal')
+        self.assertEqual(next(stream), 'zeroth')
+        self.assertEqual(list(stream)[-1], 'nine hundred and ninety-ninth')
+
+    def test_kwargs_and_errors(self):
+        self.assertEqual(
+            self.pool.convert([1.5, 'x'], to='currency', currency='USD',
+                              errors='replace', default='?'),
+            ['one dollar, fifty cents', '?'])
+        with self.assertRaises(NotImplementedError):
+            self.pool.convert([1], lang='lalala')
+
+    def test_num2words_parallel(self):
+        self.assertEqual(num2words_parallel([3, 2, 1], lang='de',
+                                            max_workers=1),
+                         ['drei', 'zwei', 'eins'])
+
+    def test_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            ParallelConverter(chunksize=0)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import subprocess
+import sys
+from unittest import TestCase
+
+import num2words
+from num2words import resolve_lang
+from num2words.lang_EN import Num2Word_EN
+from num2words.registry import LazyConverterRegistry
+
+
+class LazyConverterRegistryTest(TestCase):
+    def setUp(self):
+        self.registry = LazyConverterRegistry('num2words', {
+            'en': 'lang_EN.Num2Word_EN',
+            'fr': 'lang_FR.Num2Word_FR',
+        })
+
+    def test_lookup_instantiates_once(self):
+        self.assertFalse(self.registry.is_loaded('en'))
+        converter = self.registry['en']
+        self.assertIsInstance(converter, Num2Word_EN)
+        self.assertTrue(self.registry.is_loaded('en'))
+        self.assertIs(self.registry['en'], converter)
+        self.assertFalse(self.registry.is_loaded('fr'))
+
+    def test_mapping_interface(self):
+        self.assertIn('en', self.registry)
+        self.assertNotIn('xx', self.registry)
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(sorted(self.registry.keys()), ['en', 'fr'])
+        self.assertFalse(self.registry.is_loaded('en'))
+        with self.assertRaises(KeyError):
+            self.registry['xx']
+
+    def test_register_instance(self):
+        converter = Num2Word_EN()
+        self.registry['xx'] = converter
+        self.assertIs(self.registry['xx'], converter)
+        del self.registry['xx']
+        self.assertNotIn('xx', self.registry)
+
+    def test_preload(self):
+        self.registry.preload(['fr'])
+        self.assertTrue(self.registry.is_loaded('fr'))
+        self.assertFalse(self.registry.is_loaded('en'))
+        self.registry.preload()
+        self.assertTrue(self.registry.is_loaded('en'))
+        self.assertEqual(len(self.registry.values()), 2)
+
+    def test_package_registry_is_complete(self):
+        for lang in num2words.CONVERTER_CLASSES:
+            self.assertTrue(hasattr(num2words.CONVERTER_CLASSES[lang],
+                                    'to_cardinal'))
+
+    def test_import_does_not_load_languages(self):
+        code = ("import sys, num2words; "
+                "print(sorted(m for m in sys.modules "
+                "if m.startswith('num2words.lang_')))")
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.decode('utf-8').strip(), '[]')
+
+
+class ResolveLangTest(TestCase):
+    def test_registered_codes(self):
+        for lang in num2words.CONVERTER_CLASSES:
+            self.assertEqual(resolve_lang(lang), lang)
+
+    def test_locales(self):
+        self.assertEqual(resolve_lang('en-US'), 'en')
+        self.assertEqual(resolve_lang('EN'), 'en')
+        self.assertEqual(resolve_lang('pt-BR'), 'pt_BR')
+        self.assertEqual(resolve_lang('pt_br'), 'pt_BR')
+        self.assertEqual(resolve_lang('pt-PT'), 'pt')
+        self.assertEqual(resolve_lang('es-419'), 'es')
+        self.assertEqual(resolve_lang('es-CO'), 'es_CO')
+        self.assertEqual(resolve_lang('fr_CA'), 'fr')
+        self.assertEqual(resolve_lang('fr_CH.UTF-8'), 'fr_CH')
+        self.assertEqual(resolve_lang('sr-Latn-RS'), 'sr')
+        self.assertEqual(resolve_lang('sr_RS@latin'), 'sr')
+        self.assertEqual(resolve_lang('en-Latn-IN'), 'en_IN')
+
+    def test_aliases(self):
+        self.assertEqual(resolve_lang('cs-CZ'), 'cz')
+        self.assertEqual(resolve_lang('da'), 'dk')
+        self.assertEqual(resolve_lang('nb_NO'), 'no')
+        self.assertEqual(resolve_lang('kk'), 'kz')
+
+    def test_legacy_two_letter_fallback(self):
+        self.assertEqual(resolve_lang('fr_FR'), 'fr')
+        self.assertEqual(resolve_lang('english'), 'en')
+
+    def test_unsupported(self):
+        for lang in ('lalala', 'zz-ZZ', '', None):
+            with self.assertRaises(NotImplementedError):
+                resolve_lang(lang)
+            with self.assertRaises(NotImplementedError):
+                num2words.num2words(1, lang=lang)
+
+    def test_num2words_uses_locales(self):
+        self.assertEqual(num2words.num2words(42, lang='de-AT'),
+                         'zweiundvierzig')
+        self.assertEqual(num2words.num2words(1, lang='da-DK'), 'et')
+
+    def test_registry_changes_are_seen(self):
+        registry = LazyConverterRegistry('num2words', {
+            'en': 'lang_EN.Num2Word_EN',
+        })
+        self.assertEqual(registry.resolve('en-IN'), 'en')
+        registry['en_IN'] = Num2Word_EN()
+        self.assertEqual(registry.resolve('en-IN'), 'en_IN')
+        del registry['en_IN']
+        self.assertEqual(registry.resolve('en-IN'), 'en')
+        self.assertIsNone(registry.resolve('xx'))
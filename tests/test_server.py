@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import json
+import sys
+import threading
+from unittest import TestCase, skipIf
+
+import num2words
+from num2words import instrument
+
+if sys.version_info >= (3, 7):
+    from http.client import HTTPConnection
+
+    from num2words.server import make_server
+
+
+@skipIf(sys.version_info < (3, 7), 'num2words.server needs Python 3.7+')
+class ServerTest(TestCase):
+    workers = 1
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = make_server(port=0, workers=cls.workers,
+                                 preload=['en', 'fr'], chunksize=5)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+        instrument.disable()
+        instrument.reset()
+        num2words.disable_cache()
+        num2words.cache_clear()
+
+    def setUp(self):
+        self.connection = HTTPConnection(*self.server.server_address[:2])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def request(self, method, path, body=None):
+        if body is not None:
+            body = json.dumps(body)
+        self.connection.request(method, path, body=body)
+        response = self.connection.getresponse()
+        content = response.read().decode('utf-8')
+        if response.getheader('Content-Type') == 'application/json':
+            content = json.loads(content)
+        return response.status, content
+
+    def test_convert(self):
+        self.assertEqual(self.request('GET', '/convert?n=42'),
+                         (200, {'words': 'forty-two'}))
+        self.assertEqual(
+            self.request('GET', '/convert?n=1.5&lang=fr&to=currency'
+                                '&currency=USD'),
+            (200, {'words': 'un dollar et cinquante cents'}))
+
+    def test_convert_options(self):
+        self.assertEqual(
+            self.request('GET', '/convert?n=1.5&to=currency&cents=false'),
+            (200, {'words': 'one euro, 50 cents'}))
+        self.assertEqual(
+            self.request('GET', '/convert?n=1&lang=ja&reading=false'),
+            (200, {'words': '一'}))
+        self.assertEqual(
+            self.request('GET', '/convert?n=1&lang=ja&reading=1'),
+            (200, {'words': 'いち'}))
+        self.assertEqual(
+            self.request('GET', '/convert?n=3&lang=fi&plural=false'),
+            (200, {'words': 'kolme'}))
+        self.assertEqual(
+            self.request('GET', '/convert?n=4&lang=ja&reading=true'
+                                '&prefer=%E3%81%97'),
+            (200, {'words': 'し'}))
+
+    def test_convert_option_errors(self):
+        self.assertEqual(
+            self.request('GET', '/convert?n=1&to=currency&cents=maybe'),
+            (400, {'error': 'cents must be true, false, 1 or 0'}))
+        self.assertEqual(self.request('GET', '/convert?n=1&foo=1'),
+                         (400, {'error': 'unknown option foo'}))
+        status, content = self.request('GET', '/convert?n=1&cents=false')
+        self.assertEqual(status, 400)
+        self.assertIn("unexpected keyword argument 'cents'",
+                      content['error'])
+
+    def test_convert_errors(self):
+        self.assertEqual(self.request('GET', '/convert?lang=fr'),
+                         (400, {'error': 'missing parameter n'}))
+        self.assertEqual(self.request('GET', '/convert?n=abc'),
+                         (400, {'error': 'not a number'}))
+        status, content = self.request('GET', '/convert?n=1&lang=xx')
+        self.assertEqual(status, 400)
+        self.assertEqual(content['error'],
+                         'unsupported language or converter: xx cardinal')
+
+    def test_batch(self):
+        values = [1, '2', 2.5, 'x', None, True] + list(range(10, 20))
+        status, content = self.request('POST', '/batch?lang=fr', values)
+        self.assertEqual(status, 200)
+        self.assertEqual(content, ['un', 'deux', 'deux virgule cinq',
+                                   None, None, None] +
+                         [num2words.num2words(value, lang='fr')
+                          for value in range(10, 20)])
+
+    def test_batch_cache(self):
+        values = list(range(100, 112)) + ['x']
+        words = [num2words.num2words(value, lang='de')
+                 for value in values[:-1]] + [None]
+        hits, misses, maxsize, currsize = num2words.cache_info()
+        self.assertEqual(self.request('POST', '/batch?lang=de', values),
+                         (200, words))
+        info = num2words.cache_info()
+        self.assertEqual(info[3], currsize + 12)
+        self.assertEqual(self.request('POST', '/batch?lang=de', values),
+                         (200, words))
+        self.assertEqual(num2words.cache_info()[0], info[0] + 12)
+        self.assertEqual(self.request('GET', '/convert?n=100&lang=de'),
+                         (200, {'words': words[0]}))
+        self.assertEqual(num2words.cache_info()[0], info[0] + 13)
+
+    def test_number_length(self):
+        for n in ('1e100000', '1e-100000', '1' * 1001):
+            self.assertEqual(
+                self.request('GET', '/convert?n=%s' % n),
+                (400, {'error': 'numbers are limited to 1000 digits'}))
+        self.assertEqual(
+            self.request('POST', '/batch', ['1e100000', '1e2']),
+            (200, [None, 'one hundred']))
+
+    def test_batch_errors(self):
+        self.assertEqual(self.request('POST', '/batch', {'n': 1}),
+                         (400, {'error': 'body is not a JSON array'}))
+        self.assertEqual(self.request('POST', '/batch?foo=1', [1]),
+                         (400, {'error': 'unknown option foo'}))
+        status, content = self.request('POST', '/batch?cents=false', [1])
+        self.assertEqual(status, 400)
+        self.assertIn('cents', content['error'])
+        self.assertEqual(self.request('POST', '/convert', [1])[0], 404)
+
+    def test_keep_alive(self):
+        for value in range(3):
+            self.request('GET', '/convert?n=%d' % value)
+        self.connection.request('GET', '/nowhere')
+        response = self.connection.getresponse()
+        response.read()
+        self.assertEqual(response.status, 404)
+        self.assertEqual(response.version, 11)
+        self.assertFalse(response.will_close)
+
+    def test_metrics(self):
+        self.request('GET', '/convert?n=7')
+        self.request('POST', '/batch', [1, 2, 3])
+        status, text = self.request('GET', '/metrics')
+        self.assertEqual(status, 200)
+        self.assertIn('num2words_http_request_duration_seconds_count'
+                      '{endpoint="/convert",status="200"}', text)
+        self.assertIn('num2words_http_values_total{endpoint="/batch"}',
+                      text)
+        self.assertIn('# TYPE num2words_call_duration_seconds histogram',
+                      text)
+
+
+@skipIf(sys.version_info < (3, 7), 'num2words.server needs Python 3.7+')
+class PooledServerTest(ServerTest):
+    workers = 2
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import random
+import sys
+import threading
+from unittest import TestCase
+
+from num2words import CONVERTER_CLASSES, CONVERTES_TYPES, num2words
+
+VALUES = [0, 1, 2, 3, 7, 11, 21, 42, 99, 100, 101, 118, 200, 999, 1000,
+          1001, 1234, 2000, 12345, 100000, 1000000, 2000000, 123456789,
+          -1, -42, 1.5, 2.25, 12.34, 0.05, -3.75]
+
+THREADS = 8
+ROUNDS = 3
+
+
+def build_cases():
+    """Return the (lang, to, value, expected) conversions that succeed."""
+    cases = []
+    for lang in sorted(CONVERTER_CLASSES):
+        for to in CONVERTES_TYPES:
+            for value in VALUES:
+                try:
+                    expected = num2words(value, lang=lang, to=to)
+                except Exception:
+                    continue
+                cases.append((lang, to, value, expected))
+    return cases
+
+
+class ThreadSafetyTest(TestCase):
+    def setUp(self):
+        if hasattr(sys, 'setswitchinterval'):
+            self.switchinterval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        if hasattr(sys, 'setswitchinterval'):
+            sys.setswitchinterval(self.switchinterval)
+
+    def test_all_languages_concurrently(self):
+        cases = build_cases()
+        errors = []
+
+        def worker(seed):
+            order = list(cases)
+            random.Random(seed).shuffle(order)
+            for _ in range(ROUNDS):
+                for lang, to, value, expected in order:
+                    try:
+                        result = num2words(value, lang=lang, to=to)
+                    except Exception as e:
+                        errors.append((lang, to, value, expected, repr(e)))
+                        continue
+                    if result != expected:
+                        errors.append((lang, to, value, expected, result))
+
+        threads = [threading.Thread(target=worker, args=(seed,))
+                   for seed in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(len(cases) > 1000)
+        self.assertEqual(errors, [])